@@ -0,0 +1,50 @@
+"""Porównanie kosztu tasowania i rozdawania: dawna talia na liście vs bufor z kursorem.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m benchmarks.bench_deck [liczba_rozdań] [liczba_graczy]
+"""
+import random
+import sys
+import time
+
+from main import Card, Deck
+
+
+def legacy_hands(num_hands: int, num_players: int) -> float:
+    """Dawne zachowanie: nowa lista kart co rozdanie, ``random.shuffle`` i ``pop(0)``."""
+    ranks = list(Card.RANK_ORDER.keys())
+    suits = list(Card.unicode_dict.keys())
+    start = time.perf_counter()
+    for _ in range(num_hands):
+        deck = [Card(rank, suit) for suit in suits for rank in ranks]
+        random.shuffle(deck)
+        for _ in range(5 * num_players):
+            deck.pop(0)
+    return time.perf_counter() - start
+
+
+def buffered_hands(num_hands: int, num_players: int) -> float:
+    deck = Deck()
+    start = time.perf_counter()
+    for _ in range(num_hands):
+        deck.reset()
+        deck.shuffle()
+        for _ in range(num_players):
+            deck.deal_many(5)
+    return time.perf_counter() - start
+
+
+def main(argv):
+    num_hands = int(argv[1]) if len(argv) > 1 else 1_000_000
+    num_players = int(argv[2]) if len(argv) > 2 else 4
+    random.seed(0)
+    legacy = legacy_hands(num_hands, num_players)
+    buffered = buffered_hands(num_hands, num_players)
+    print(f"Rozdania: {num_hands}, gracze: {num_players}")
+    print(f"  lista + pop(0):    {legacy:8.2f} s ({legacy / num_hands * 1e6:.2f} us/rozdanie)")
+    print(f"  bufor z kursorem:  {buffered:8.2f} s ({buffered / num_hands * 1e6:.2f} us/rozdanie)")
+    print(f"  przyspieszenie:    {legacy / buffered:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,123 @@
+"""Porównanie kosztu przesyłania przebiegu gry: pełny stan sesji w JSON vs ramki binarne.
+
+Zdarzenia pochodzą z rzeczywistych (zasianych) gier botów: dla każdej akcji
+zapisywany jest stan w układzie ``SessionManager`` (to, co trzeba by wysłać,
+przesyłając cały stan), zdarzenie akcji i, na początku rozdania, zmiana stanu
+(stosy i ręce). Mierzone są bajty i czas kodowania + dekodowania na akcję.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m benchmarks.bench_protocol [liczba_gier] [liczba_graczy]
+"""
+import json
+import random
+import sys
+import time
+from typing import Dict, List
+
+from main import GameEngine, GameLogger, Player
+from src.net.protocol import code_to_card, decode, encode
+
+ACTION_EVENTS = {"fold", "check", "call", "bet", "raise", "small_blind", "big_blind", "exchange", "win"}
+
+
+class RecordingLogger(GameLogger):
+    """Logger bez plików, który przy każdym zdarzeniu zapamiętuje komunikaty do porównania."""
+
+    def __init__(self, game_id: str):
+        super().__init__(None)
+        self.game_id = game_id
+        self.engine = None
+        self.hand = 0
+        self.delta_sent = False
+        self.bets: List[Dict] = []
+        self.history: List[Dict] = []
+        self.sessions: List[Dict] = []
+        self.actions: List[Dict] = []
+        self.deltas: List[Dict] = []
+
+    def event(self, event_type: str, **fields) -> None:
+        engine = self.engine
+        players = engine.players
+        if event_type == "round_start":
+            self.hand = fields["round"]
+            self.bets = []
+            self.delta_sent = False
+            return
+        if event_type == "round_end":
+            self.history.append({"round": self.hand, "pot": sum(b["amount"] for b in self.bets),
+                                 "stacks": {p.name: p.stack for p in players}})
+            return
+        if event_type not in ACTION_EVENTS:
+            return
+        seat = next(i for i, p in enumerate(players) if p.name == fields["player"])
+        if not self.delta_sent and event_type not in ("small_blind", "big_blind"):
+            # Pierwsza akcja po rozdaniu kart: stosy i ręce wysyłane raz, jako zmiana stanu.
+            self.delta_sent = True
+            self.deltas.append({"type": "state_delta", "table": 0, "hand": self.hand, "pot": engine.pot,
+                                "current_player": seat, "stacks": [[i, p.stack] for i, p in enumerate(players)],
+                                "hands": [[i, p.hand_codes()] for i, p in enumerate(players) if p.hand_codes()]})
+        self.bets.append({"stage": "draw", "player_id": seat + 1, "action": event_type,
+                          "amount": fields["amount"], "pot": fields["pot"]})
+        self.actions.append({"type": "action_event", "table": 0, "hand": self.hand, "seat": seat,
+                             "action": event_type, "amount": fields["amount"], "pot": fields["pot"],
+                             "stack": players[seat].stack})
+        self.sessions.append({
+            "game_id": self.game_id,
+            "timestamp": "2025-05-14T12:30:00",
+            "players": [{"id": i + 1, "name": p.name, "stack": p.stack} for i, p in enumerate(players)],
+            "deck": [code_to_card(card.code) for card in engine.deck.cards],
+            "hands": {str(i + 1): [code_to_card(code) for code in p.hand_codes()] for i, p in enumerate(players)},
+            "bets": list(self.bets),
+            "current_player": seat + 1,
+            "pot": fields["pot"],
+            "history": list(self.history),
+        })
+
+
+def record_games(num_games: int, num_players: int, max_hands: int = 50) -> List[RecordingLogger]:
+    loggers = []
+    for game in range(num_games):
+        logger = RecordingLogger(f"bench{game}")
+        players = Player.create_players(num_players, 1000)
+        engine = GameEngine.create_headless(players, 25, 50, logger=logger, rng=random.Random(game))
+        logger.engine = engine
+        for hand_number in range(1, max_hands + 1):
+            if sum(1 for p in players if p.stack > 0) < 2:
+                break
+            engine.play_round(hand_number)
+        loggers.append(logger)
+    return loggers
+
+
+def measure(messages: List[Dict], encoder, decoder) -> Dict[str, float]:
+    start = time.perf_counter()
+    frames = [encoder(message) for message in messages]
+    for frame in frames:
+        decoder(frame)
+    elapsed = time.perf_counter() - start
+    return {"bytes": sum(len(frame) for frame in frames), "seconds": elapsed}
+
+
+def main(argv):
+    num_games = int(argv[1]) if len(argv) > 1 else 20
+    num_players = int(argv[2]) if len(argv) > 2 else 4
+    loggers = record_games(num_games, num_players)
+    sessions = [s for log in loggers for s in log.sessions]
+    actions = [a for log in loggers for a in log.actions]
+    deltas = [d for log in loggers for d in log.deltas]
+    n = len(actions)
+
+    full = measure(sessions, lambda s: json.dumps(s, indent=4, ensure_ascii=False).encode("utf-8"), json.loads)
+    json_frames = measure(actions + deltas, lambda m: encode(m, binary=False), decode)
+    binary = measure(actions + deltas, encode, decode)
+
+    print(f"Gry: {num_games}, akcje: {n}, zmiany stanu: {len(deltas)}")
+    for label, result in (("pełny stan sesji (JSON)", full), ("zdarzenia, fallback JSON", json_frames),
+                          ("zdarzenia, binarnie", binary)):
+        print(f"  {label:26s} {result['bytes'] / n:9.1f} B/akcję  {result['seconds'] / n * 1e6:8.2f} us/akcję")
+    print(f"  binarnie vs pełny stan:    {full['bytes'] / binary['bytes']:.0f}x mniej bajtów, "
+          f"{full['seconds'] / binary['seconds']:.0f}x mniej czasu")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,61 @@
+"""Przepustowość i pamięć harmonogramu wielu stołów (``src.sim.scheduler``).
+
+Mierzone są rozdania na sekundę przy wielu stołach botów prowadzonych w jednym
+wątku oraz pamięć zajmowana przez stół między rozdaniami (``tracemalloc``):
+zaraz po utworzeniu i po rozegraniu pierwszego rozdania.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m benchmarks.bench_scheduler [liczba_stołów] [graczy_przy_stole] [rozdań_na_stół]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from main import GameEngine, Player, RuleBasedBotStrategy
+from src.sim.scheduler import TableScheduler
+
+
+def build(num_tables: int, num_players: int, max_hands: int) -> TableScheduler:
+    scheduler = TableScheduler(max_seats=num_players)
+    bot = RuleBasedBotStrategy()  # boty są bezstanowe - jedna strategia wystarczy dla wszystkich miejsc
+    for table in range(num_tables):
+        players = [Player(1000, f"Bot_{table}_{i}", is_bot=True) for i in range(num_players)]
+        engine = GameEngine.create_headless(players, 25, 50, strategies=[bot] * num_players,
+                                            rng=random.Random(table))
+        scheduler.add_table(engine, max_hands=max_hands)
+    return scheduler
+
+
+def memory_per_table(num_tables: int, num_players: int) -> tuple:
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    scheduler = build(num_tables, num_players, max_hands=1)
+    created = tracemalloc.get_traced_memory()[0] - base
+    scheduler.run()
+    after_hand = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return created / num_tables, after_hand / num_tables
+
+
+def main(argv):
+    num_tables = int(argv[1]) if len(argv) > 1 else 2000
+    num_players = int(argv[2]) if len(argv) > 2 else 6
+    max_hands = int(argv[3]) if len(argv) > 3 else 20
+
+    scheduler = build(num_tables, num_players, max_hands)
+    start = time.perf_counter()
+    scheduler.run()
+    elapsed = time.perf_counter() - start
+    stats = scheduler.stats()
+    print(f"Stoły: {num_tables}, graczy przy stole: {num_players}, rozdań na stół: do {max_hands}")
+    print(f"  rozdania:      {stats['hands_played']} w {elapsed:.2f} s "
+          f"({stats['hands_played'] / elapsed:.0f} rozdań/s, {stats['ticks'] / elapsed:.0f} taktów/s)")
+    print(f"  przesiadki:    {stats['moves']}, wyeliminowani: {stats['eliminated']}")
+
+    created, after_hand = memory_per_table(min(num_tables, 1000), num_players)
+    print(f"  pamięć stołu:  {created / 1024:.1f} KiB po utworzeniu, {after_hand / 1024:.1f} KiB po rozdaniu")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,392 @@
+"""Zestaw benchmarków głównych ścieżek gry z wynikami w JSON.
+
+Mierzone są: tworzenie, tasowanie i rozdawanie talii, ``Player.hand_rank``
+(ręce losowe i najdroższy przypadek), ``showdown`` dla 2-10 graczy, podział
+puli z wejściami za wszystko przy 10 miejscach (także w ``showdown``), runda
+licytacji ``BettingRound`` na kolumnach stanu stołu, pełne
+``play_round`` botów bez konsoli (także z ``Instrumentation``), przepustowość
+``GameLogger.log`` oraz zapis i odczyt ``SessionManager`` i dopisywanie historii
+JSONL przy różnej długości historii. Każdy pomiar powtarzany jest ``--repeat`` razy; zapisywany jest czas
+najlepszego powtórzenia i średnia na operację.
+
+Wynik trafia do pliku JSON (``--out``). Z ``--compare`` wyniki są porównywane
+z wcześniejszym plikiem, a pomiary wolniejsze o więcej niż ``--threshold``
+są wypisywane jako regresje (kod wyjścia 1).
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m benchmarks.suite [--quick] [--filter deck] [--out bench_results.json]
+    python -m benchmarks.suite --compare bench_results.json --out nowe.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from main import Card, Deck, GameEngine, GameLogger, Player
+from src.fileops.session_manager import SessionManager
+from src.logic.betting import BettingRound
+from src.logic.pots import award_pots, build_pots
+from src.logic.instrumentation import Instrumentation
+
+Benchmark = Callable[[int, int], Dict[str, Dict]]
+
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str):
+    def register(func: Benchmark) -> Benchmark:
+        _BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def measure(func: Callable[[], object], number: int, repeat: int,
+            setup: Optional[Callable[[], object]] = None, **params) -> Dict:
+    """Czas jednej operacji ``func`` (najlepsze powtórzenie i średnia, w mikrosekundach).
+
+    Z ``setup`` czas mierzony jest osobno dla każdego wywołania, więc przygotowanie
+    (np. rozdanie kart przed showdownem) nie wlicza się do wyniku.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is None:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            times.append(time.perf_counter() - start)
+        else:
+            total = 0.0
+            for _ in range(number):
+                setup()
+                start = time.perf_counter()
+                func()
+                total += time.perf_counter() - start
+            times.append(total)
+    per_op = [t / number * 1e6 for t in times]
+    return {"ops": number, "repeat": repeat, "best_us": min(per_op), "mean_us": sum(per_op) / len(per_op),
+            "params": params}
+
+
+@benchmark("deck")
+def bench_deck(scale: int, repeat: int) -> Dict[str, Dict]:
+    deck = Deck(random.Random(0))
+
+    def shuffle_and_deal():
+        deck.reset()
+        deck.shuffle()
+        for _ in range(6):
+            deck.deal_many(5)
+
+    return {
+        "deck.create": measure(Deck, 2000 * scale, repeat),
+        "deck.shuffle_deal_6x5": measure(shuffle_and_deal, 2000 * scale, repeat, players=6),
+    }
+
+
+def _players_with_hands(hands: List[List[int]]) -> List[Player]:
+    players = []
+    for codes in hands:
+        player = Player(1000, "Bench", is_bot=True)
+        for code in codes:
+            player.take_card(Card.from_code(code))
+        players.append(player)
+    return players
+
+
+@benchmark("hand_rank")
+def bench_hand_rank(scale: int, repeat: int) -> Dict[str, Dict]:
+    rng = random.Random(1)
+    random_hands = [rng.sample(range(52), 5) for _ in range(1000)]
+    # Para z trzema różnymi dodatkami: wyszukiwanie po iloczynie liczb pierwszych i komplet rozstrzygaczy.
+    worst_hands = []
+    while len(worst_hands) < 1000:
+        codes = rng.sample(range(52), 5)
+        ranks = [code % 13 for code in codes]
+        if len(set(ranks)) == 4:
+            worst_hands.append(codes)
+
+    results = {}
+    for label, hands in (("random", random_hands), ("worst_case", worst_hands)):
+        players = _players_with_hands(hands)
+        first_cards = [(player, player.hand_cards()[0]) for player in players]
+
+        def rank_all():
+            for player, card in first_cards:
+                # Zmiana karty kasuje zapamiętaną siłę - mierzymy pełną ocenę, a nie odczyt z pamięci.
+                player.change_card(card, 0)
+                player.hand_rank()
+
+        result = measure(rank_all, 5 * scale, repeat, hands=len(hands))
+        result["best_us"] /= len(hands)
+        result["mean_us"] /= len(hands)
+        results[f"hand_rank.{label}"] = result
+    return results
+
+
+@benchmark("showdown")
+def bench_showdown(scale: int, repeat: int) -> Dict[str, Dict]:
+    results = {}
+    for num_players in (2, 4, 6, 8, 10):
+        players = Player.create_players(num_players, 1000)
+        engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(num_players))
+
+        def deal():
+            engine.deck.reset()
+            engine.deck.shuffle()
+            engine.pot = 0
+            for player in players:
+                player.clear_hand()
+                player.receive_money(1000 - player.stack)
+                engine.pot += player.pay_money(100)
+            engine.deck.deal(players, 5, None, None)
+            engine.last_showdown = []
+            engine.last_winnings = []
+
+        results[f"showdown.{num_players}p"] = measure(engine.showdown, 500 * scale, repeat, setup=deal,
+                                                      players=num_players)
+    return results
+
+
+# Wkłady 10 miejsc: cztery wejścia za wszystko na różnych poziomach i dwa pasy (miejsca 2 i 7).
+_ALL_IN_CONTRIBUTIONS = [40, 120, 60, 120, 300, 500, 500, 200, 500, 500]
+_ALL_IN_FOLDED = [False, False, True, False, False, False, False, True, False, False]
+
+
+@benchmark("pots")
+def bench_pots(scale: int, repeat: int) -> Dict[str, Dict]:
+    rng = random.Random(10)
+    strengths = [[rng.randrange(9 << 20) for _ in range(10)] for _ in range(100)]
+    contributions, folded = _ALL_IN_CONTRIBUTIONS, _ALL_IN_FOLDED
+    results = {}
+
+    def resolve():
+        for hand in strengths:
+            award_pots(build_pots(contributions, folded), hand)
+
+    result = measure(resolve, 20 * scale, repeat, players=10, pots=len(build_pots(contributions, folded)))
+    result["best_us"] /= len(strengths)
+    result["mean_us"] /= len(strengths)
+    results["pots.resolve_10p_all_in"] = result
+
+    players = [Player(amount, f"Bot_{i}", is_bot=True) for i, amount in enumerate(contributions)]
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(11))
+
+    def deal():
+        engine.deck.reset()
+        engine.deck.shuffle()
+        engine.pot = 0
+        for player, amount, out in zip(players, contributions, folded):
+            player.clear_hand()
+            player.receive_money(amount - player.stack)
+            engine.pot += player.pay_money(amount)
+            player.is_folded = out
+        engine.deck.deal(players, 5, None, None)
+        engine.last_showdown = []
+        engine.last_winnings = []
+
+    results["showdown.10p_all_in"] = measure(engine.showdown, 500 * scale, repeat, setup=deal, players=10)
+    return results
+
+
+# Licytacja 6 miejsc po blindach: sprawdzenie, przebicie, pas i wyrównania (7 akcji).
+_BETTING_SCRIPT = [("call", 0), ("raise", 200), ("fold", 0), ("call", 0), ("call", 0), ("call", 0), ("fold", 0)]
+
+
+@benchmark("betting")
+def bench_betting(scale: int, repeat: int) -> Dict[str, Dict]:
+    players = [Player(1000, f"Bot_{i}", is_bot=True) for i in range(6)]
+    engine = GameEngine.create_headless(players, 25, 50)
+    state = engine.state
+
+    def post_blinds():
+        state.new_hand()
+        for player in players:
+            player.receive_money(1000 - player.stack)
+        for seat, blind in ((1, 25), (2, 50)):
+            state.bet[seat] = state.pay(seat, blind)
+
+    def play():
+        betting_round = BettingRound(state, 3, 50, 75)
+        for action, amount in _BETTING_SCRIPT:
+            betting_round.next_to_act()
+            betting_round.apply_action(action, amount)
+        betting_round.next_to_act()
+
+    return {"betting.round_6p": measure(play, 2000 * scale, repeat, setup=post_blinds, players=6,
+                                        actions=len(_BETTING_SCRIPT))}
+
+
+@benchmark("play_round")
+def bench_play_round(scale: int, repeat: int) -> Dict[str, Dict]:
+    results = {}
+    for num_players, inst in ((2, None), (6, None), (6, Instrumentation())):
+        players = Player.create_players(num_players, 1000)
+        engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(num_players), instrumentation=inst)
+        counter = [0]
+
+        def play():
+            if sum(1 for p in players if p.stack > 0) < 2:
+                for player in players:
+                    player.receive_money(1000 - player.stack)
+            counter[0] += 1
+            engine.play_round(counter[0])
+
+        label = f"play_round.{num_players}p" + ("_instrumented" if inst is not None else "")
+        results[label] = measure(play, 200 * scale, repeat, players=num_players)
+    return results
+
+
+@benchmark("logger")
+def bench_logger(scale: int, repeat: int) -> Dict[str, Dict]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, options in (("unbuffered", {}), ("buffered", {"buffered": True}),
+                               ("filtered", {"level": GameLogger.INFO})):
+            logger = GameLogger(os.path.join(tmp, f"{label}.txt"), **options)
+
+            def log_lines():
+                for i in range(100):
+                    logger.debug("Gracz %s czeka. Stack: %s", "Bot_1", i)
+
+            result = measure(log_lines, 20 * scale, repeat)
+            logger.close_session()
+            result["best_us"] /= 100
+            result["mean_us"] /= 100
+            result["lines_per_s"] = 1e6 / result["best_us"]
+            results[f"logger.{label}"] = result
+    return results
+
+
+def _session(history_len: int) -> Dict:
+    return {
+        "game_id": "bench",
+        "players": [{"id": i + 1, "name": f"Bot_{i}", "stack": 1000} for i in range(4)],
+        "deck": ["AS", "KD", "3H"],
+        "hands": {"1": ["AS", "3H", "7C", "9D", "KD"]},
+        "bets": [{"stage": "draw", "player_id": 1, "action": "call", "amount": 50, "pot": 125}],
+        "current_player": 1,
+        "pot": 125,
+        "history": [{"round": i, "winner_id": i % 4 + 1, "pot": 125} for i in range(history_len)],
+    }
+
+
+@benchmark("session")
+def bench_session(scale: int, repeat: int) -> Dict[str, Dict]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for history_len in (10, 1000, 10000):
+            session = _session(history_len)
+            number = max(1, 20 * scale // max(1, history_len // 100))
+            full = SessionManager(os.path.join(tmp, f"full{history_len}"))
+            results[f"session.save_full.{history_len}"] = measure(lambda: full.save_session(session), number,
+                                                                  repeat, history=history_len)
+            results[f"session.load_full.{history_len}"] = measure(lambda: full.load_session("bench"), number,
+                                                                  repeat, history=history_len)
+
+            incremental = SessionManager(os.path.join(tmp, f"inc{history_len}"), incremental=True)
+            incremental.save_session(session)
+
+            def save_next_hand():
+                session["history"].append({"round": len(session["history"]), "winner_id": 1, "pot": 125})
+                incremental.save_session(session)
+
+            results[f"session.save_incremental.{history_len}"] = measure(save_next_hand, 20 * scale, repeat,
+                                                                         history=history_len)
+            del session["history"][history_len:]
+
+            hand = {"round": history_len, "winner_id": 2, "pot": 250, "stacks": [1000, 875, 1125, 1000]}
+            append_dir = SessionManager(os.path.join(tmp, f"append{history_len}"))
+            for i in range(history_len):
+                append_dir.append_hand_history("bench", hand)
+            results[f"session.append_jsonl.{history_len}"] = measure(
+                lambda: append_dir.append_hand_history("bench", hand), 50 * scale, repeat, history=history_len)
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names: Sequence[str], scale: int, repeat: int) -> Dict:
+    results: Dict[str, Dict] = {}
+    for name in names:
+        start = time.perf_counter()
+        results.update(_BENCHMARKS[name](scale, repeat))
+        print(f"  {name:12s} {time.perf_counter() - start:6.1f} s", file=sys.stderr)
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "scale": scale,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(old: Dict, new: Dict, threshold: float) -> List[str]:
+    """Zwraca opisy pomiarów wolniejszych niż w ``old`` o więcej niż ``threshold`` (ułamek)."""
+    regressions = []
+    for name, result in new["results"].items():
+        before = old.get("results", {}).get(name)
+        if before is None:
+            continue
+        ratio = result["best_us"] / before["best_us"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {before['best_us']:.2f} -> {result['best_us']:.2f} us (+{ratio - 1:.0%})")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarki głównych ścieżek gry.")
+    parser.add_argument("--out", default="bench_results.json", help="Plik JSON z wynikami.")
+    parser.add_argument("--filter", action="append", default=None,
+                        help=f"Uruchom tylko wybrane grupy: {', '.join(_BENCHMARKS)}.")
+    parser.add_argument("--quick", action="store_true", help="Krótkie pomiary (np. w CI).")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", default=None, help="Wcześniejszy plik wyników do porównania.")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Dopuszczalne spowolnienie (ułamek).")
+    args = parser.parse_args(argv)
+
+    names = args.filter or list(_BENCHMARKS)
+    unknown = [name for name in names if name not in _BENCHMARKS]
+    if unknown:
+        parser.error(f"Nieznane grupy benchmarków: {', '.join(unknown)}")
+    scale = 1 if args.quick else 10
+    repeat = 2 if args.quick else args.repeat
+
+    report = run(names, scale, repeat)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    for name, result in report["results"].items():
+        print(f"{name:38s} {result['best_us']:10.2f} us/op (średnio {result['mean_us']:.2f})")
+    print(f"Zapisano wyniki do {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        if regressions:
+            print("Regresje:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("Brak regresji.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
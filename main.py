@@ -1,57 +1,183 @@
 import random
 import json
+import itertools
 import datetime
-from typing import List, Tuple, Dict, Optional, Callable
+import time
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import Executor, TimeoutError as FutureTimeoutError
+from typing import List, Tuple, Dict, Optional, Callable, Iterator, NamedTuple
+
+from src.fileops.log_writer import BufferedLogWriter
+from src.fileops.session_manager import SessionManager
+from src.logic import betting, cards
+from src.logic.betting import BettingRound
+from src.logic.bots import RuleBasedBot
+from src.logic.canonical import canonicalize, hand_index
+from src.logic.draw_table import DrawTable
+from src.logic.evaluator import CATEGORY_NAMES, evaluate5, category_of, category_name, describe
+from src.logic.instrumentation import Instrumentation
+from src.logic.memo import LRUCache
+from src.logic.opponent_stats import AGGRESSIVE_ACTIONS, OpponentStats
+from src.logic.pots import Pot, award_pots, build_pots, uncalled_bet
+from src.logic.table_state import DETACHED, HAND_SIZE, UNKNOWN, TableState
+from src.logic.table_view import TableView, ViewStrategy
 
 
 # --- Klasa GameLogger ---
 class GameLogger:
-    def __init__(self, log_file_path="poker_log.txt"):
+    """Log gry w pliku tekstowym oraz opcjonalny, strukturalny log zdarzeń (JSON Lines).
+
+    Wiadomości poniżej ustawionego poziomu (``level``) są pomijane przed formatowaniem:
+    ``log`` przyjmuje szablon z argumentami (``"Gracz %s czeka", name``) albo funkcję
+    bez argumentów zwracającą tekst, wywoływaną tylko wtedy, gdy wpis zostanie zapisany.
+
+    ``log_file_path=None`` wyłącza log tekstowy (np. w symulacjach bez wyjścia).
+    Domyślnie każda linia jest dopisywana od razu. Z ``buffered=True`` pliki pozostają
+    otwarte, a linie zapisuje w paczkach wątek ``BufferedLogWriter``; wtedy trzeba
+    wywołać ``flush()`` lub ``close_session()``, aby mieć pewność, że trafiły na dysk.
+    """
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+    def __init__(self, log_file_path: Optional[str] = "poker_log.txt", buffered: bool = False, capacity: int = 8192,
+                 batch_size: int = 256, flush_interval: float = 0.5, overflow: str = BufferedLogWriter.BLOCK,
+                 level: int = DEBUG, events_file_path: Optional[str] = None):
         self.log_file_path = log_file_path
-        try:
-            with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"\n=== Sesja gry rozpoczęta: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-        except IOError:
-            print(f"Nie można otworzyć pliku logu: {self.log_file_path}")
+        self.events_file_path = events_file_path
+        self.level = level
+        self._writer: Optional[BufferedLogWriter] = None
+        self._events_writer: Optional[BufferedLogWriter] = None
+        self._timestamp_second = -1
+        self._timestamp_str = ""
+        self.lines_written = 0  # wpisy logu i zdarzenia przekazane do zapisu
+        if buffered:
+            writer_options = dict(capacity=capacity, batch_size=batch_size,
+                                  flush_interval=flush_interval, overflow=overflow)
+            try:
+                if log_file_path is not None:
+                    self._writer = BufferedLogWriter(log_file_path, **writer_options)
+                if events_file_path:
+                    self._events_writer = BufferedLogWriter(events_file_path, **writer_options)
+            except IOError:
+                print(f"Nie można otworzyć pliku logu: {self.log_file_path}")
+        self._write(self._writer, self.log_file_path, f"\n=== Sesja gry rozpoczęta: {self._timestamp()} ===\n",
+                    f"Nie można otworzyć pliku logu: {self.log_file_path}")
 
-    def log(self, message: str):
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] {message}\n"
+    @property
+    def structured(self) -> bool:
+        """Czy zdarzenia przekazywane do ``event`` są gdziekolwiek zapisywane."""
+        return self.events_file_path is not None
+
+    def is_enabled_for(self, level: int) -> bool:
+        return level >= self.level and self.log_file_path is not None
+
+    def _timestamp(self) -> str:
+        # Znacznik czasu ma rozdzielczość sekundy, więc formatujemy go najwyżej raz na sekundę.
+        now = time.time()
+        second = int(now)
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_str = datetime.datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M:%S')
+        return self._timestamp_str
+
+    @staticmethod
+    def _write(writer: Optional[BufferedLogWriter], path: Optional[str], text: str, error_message: str) -> None:
+        if writer is not None:
+            writer.write(text)
+            return
+        if path is None:
+            return
         try:
-            with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(text)
         except IOError:
-            print(f"Błąd zapisu logu: {log_entry.strip()}")
+            print(error_message)
+
+    def log(self, message, *args, level: int = INFO):
+        if level < self.level or self.log_file_path is None:
+            return
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+        log_entry = f"[{self._timestamp()}] {message}\n"
+        self.lines_written += 1
+        self._write(self._writer, self.log_file_path, log_entry, f"Błąd zapisu logu: {log_entry.strip()}")
+
+    def debug(self, message, *args):
+        if self.DEBUG >= self.level and self.log_file_path is not None:
+            self.log(message, *args, level=self.DEBUG)
+
+    def warning(self, message, *args):
+        self.log(message, *args, level=self.WARNING)
+
+    def event(self, event_type: str, **fields) -> None:
+        """Zapisuje zdarzenie gry jako jeden rekord JSON (np. ``event("call", player="Bob", amount=50, pot=125)``)."""
+        if self.events_file_path is None:
+            return
+        record = {"ts": round(time.time(), 3), "event": event_type}
+        record.update(fields)
+        self.lines_written += 1
+        self._write(self._events_writer, self.events_file_path, json.dumps(record, ensure_ascii=False) + "\n",
+                    f"Błąd zapisu zdarzenia: {event_type}")
+
+    def flush(self) -> None:
+        """Gwarantuje, że wszystkie dotychczasowe wpisy są zapisane w plikach."""
+        for writer in (self._writer, self._events_writer):
+            if writer is not None:
+                writer.flush()
 
     def close_session(self):
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] === Sesja gry zakończona ===\n"
-        try:
-            with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except IOError:
-            print(f"Błąd zapisu logu zamknięcia sesji: {log_entry.strip()}")
+        log_entry = f"[{self._timestamp()}] === Sesja gry zakończona ===\n"
+        self._write(self._writer, self.log_file_path, log_entry,
+                    f"Błąd zapisu logu zamknięcia sesji: {log_entry.strip()}")
+        for writer in (self._writer, self._events_writer):
+            if writer is not None:
+                writer.close()
+        self._writer = None
+        self._events_writer = None
 
 
 # --- Klasa Card ---
 class Card:
+    """Karta do gry. Istnieją tylko 52 instancje - ``Card(rank, suit)`` zwraca współdzielony obiekt."""
+    __slots__ = ('code', 'rank', 'suit', '_rank_value')
+
     unicode_dict = {'s': '\u2660', 'h': '\u2665', 'd': '\u2666', 'c': '\u2663'}
     RANK_ORDER = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10, 'J': 11, 'Q': 12, 'K': 13,
                   'A': 14}
     VALUE_TO_RANK_STR = {v: k for k, v in RANK_ORDER.items()}
-    def __init__(self, rank: str, suit: str):
+    _instances: List['Card'] = []
+
+    def __new__(cls, rank: str, suit: str) -> 'Card':
         if rank not in Card.RANK_ORDER:
             raise ValueError(f"Invalid rank: {rank}")
         if suit not in Card.unicode_dict:
             raise ValueError(f"Invalid suit: {suit}")
-        self.rank = rank
-        self.suit = suit
+        return cls._instances[cards.encode(rank, suit)]
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Card':
+        return cls._instances[code]
+
+    @classmethod
+    def _create_instances(cls) -> None:
+        for code in range(cards.NUM_CARDS):
+            card = object.__new__(cls)
+            card.code = code
+            card.rank = cards.RANK_STR[code]
+            card.suit = cards.SUIT_STR[code]
+            card._rank_value = cards.RANK_VALUE[code]
+            cls._instances.append(card)
 
     def get_value(self) -> Tuple[str, str]:
         return (self.rank, self.suit)
 
     def get_rank_value(self) -> int:
-        return Card.RANK_ORDER[self.rank]
+        return self._rank_value
 
     def __str__(self) -> str:
         return f"{self.rank}{Card.unicode_dict[self.suit]}"
@@ -62,70 +188,216 @@ class Card:
     def __lt__(self, other: 'Card') -> bool:
         if not isinstance(other, Card):
             return NotImplemented
-        return self.get_rank_value() < other.get_rank_value()
+        return self._rank_value < other._rank_value
+
+    def __reduce__(self):
+        return (Card.from_code, (self.code,))
+
+
+Card._create_instances()
 
 
 # --- Klasa Deck ---
 class Deck():
-    def __init__(self):
-        ranks = list(Card.RANK_ORDER.keys())
-        suits = list(Card.unicode_dict.keys())
-        self.cards: List[Card] = [Card(rank, suit) for suit in suits for rank in ranks]
+    """Talia oparta na stałym buforze 52 kodów kart z przesuwanym kursorem.
+
+    Bufor jest cykliczny: karty rozdaje się z wierzchu (kursor ``_head``), a zwrócone
+    karty trafiają na spód, więc rozdanie i odłożenie karty kosztuje O(1).
+    Tasowanie to algorytm Fishera-Yatesa wykonywany leniwie: losowanie karty
+    odbywa się dopiero przy jej rozdaniu, więc rozdanie 20 kart to 20 losowań, a nie 51.
+
+    Każda talia ma własny generator (``rng``), więc po ``seed`` kolejność kart
+    zależy wyłącznie od ziarna, a nie od innych użytkowników modułu ``random``.
+    """
+    _FULL_DECK = array('b', range(cards.NUM_CARDS))
+    allocations = 0  # liczba utworzonych talii w procesie
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        Deck.allocations += 1
+        self._rng = rng
+        # Własny generator powstaje dopiero przy pierwszym losowaniu - jego utworzenie
+        # (ziarno z systemu) kosztuje więcej niż reszta konstruktora.
+        self._random = rng.random if rng is not None else self._first_random
+        self._buffer = array('b', Deck._FULL_DECK)
+        # Pozycje absolutne; indeks w buforze to pozycja modulo jego rozmiar.
+        self._head = 0
+        self._count = cards.NUM_CARDS
+        self._shuffle_end = 0  # karty z pozycji [_head, _shuffle_end) czekają na dokończenie tasowania
+
+    @property
+    def cards(self) -> List[Card]:
+        """Karty pozostałe w talii, od wierzchu."""
+        self._finish_shuffle()
+        size = len(self._buffer)
+        return [Card.from_code(self._buffer[(self._head + i) % size]) for i in range(self._count)]
+
+    def __len__(self) -> int:
+        return self._count
 
     def __str__(self) -> str:
-        return f"Talia ({len(self.cards)} kart)"
+        return f"Talia ({self._count} kart)"
+
+    def reset(self) -> None:
+        """Przywraca pełną, nieprzetasowaną talię w tym samym buforze."""
+        self._buffer[:] = Deck._FULL_DECK
+        self._head = 0
+        self._count = cards.NUM_CARDS
+        self._shuffle_end = 0
+
+    def _first_random(self) -> float:
+        self._rng = random.Random()
+        self._random = self._rng.random
+        return self._random()
+
+    def seed(self, seed: int) -> None:
+        """Ustawia ziarno generatora talii - to samo ziarno daje to samo tasowanie."""
+        if self._rng is None:
+            self._rng = random.Random(seed)
+            self._random = self._rng.random
+        else:
+            self._rng.seed(seed)
 
     def shuffle(self) -> None:
-        random.shuffle(self.cards)
+        """Tasuje wszystkie pozostałe karty (Fisher-Yates, dokańczany przy rozdawaniu)."""
+        self._shuffle_end = self._head + self._count
+
+    def _finish_shuffle(self) -> None:
+        buf = self._buffer
+        size = len(buf)
+        rand = self._random
+        end = self._shuffle_end
+        for pos in range(self._head, end - 1):
+            j = (pos + int(rand() * (end - pos))) % size
+            buf[pos % size], buf[j] = buf[j], buf[pos % size]
+        self._shuffle_end = self._head
+
+    def deal_one_code(self) -> int:
+        """Zdejmuje kartę z wierzchu i zwraca jej kod lub -1, gdy talia jest pusta."""
+        if not self._count:
+            return -1
+        buf = self._buffer
+        size = len(buf)
+        head = self._head
+        pos = head % size
+        unshuffled = self._shuffle_end - head
+        if unshuffled > 1:
+            j = (head + int(self._random() * unshuffled)) % size
+            code = buf[j]
+            buf[j] = buf[pos]
+        else:
+            code = buf[pos]
+        self._head = head + 1
+        self._count -= 1
+        return code
 
     def deal_one(self) -> Optional[Card]:
-        if self.cards:
-            return self.cards.pop(0)
-        return None
-
-    def deal(self, players: List['Player'], num_cards: int = 5, logger: Optional[GameLogger] = None):
+        code = self.deal_one_code()
+        if code < 0:
+            return None
+        return Card.from_code(code)
+
+    def deal_many(self, n: int) -> List[Card]:
+        """Zdejmuje do ``n`` kart z wierzchu talii."""
+        deal_one_code = self.deal_one_code
+        from_code = Card.from_code
+        return [from_code(deal_one_code()) for _ in range(min(n, self._count))]
+
+    def deal(self, players: List['Player'], num_cards: int = 5, logger: Optional[GameLogger] = None,
+             observer: Optional[Callable[[str], None]] = print):
         if logger: logger.log("Rozpoczęcie rozdawania kart.")
-        for _ in range(num_cards):
-            for player in players:
-                if not player.is_folded and len(player._Player__hand_) < 5:
-                    card = self.deal_one()
-                    if card:
-                        log_msg_card = str(card) if player.is_bot else "kartę"
-                        if logger: logger.log(f"Gracz {player.name} otrzymuje {log_msg_card}.")
-                        player.take_card(card)
+        debug = logger.debug if logger and logger.is_enabled_for(GameLogger.DEBUG) else None
+        deal_one_code = self.deal_one_code
+        # Gracz dostaje kartę w każdym okrążeniu, dopóki nie ma pełnej ręki - liczba kart jest znana z góry.
+        missing = [0 if player.is_folded else HAND_SIZE - player.hand_size() for player in players]
+        for round_idx in range(num_cards):
+            for player, player_missing in zip(players, missing):
+                if round_idx < player_missing:
+                    code = deal_one_code()
+                    if code >= 0:
+                        if debug: debug("Gracz %s otrzymuje %s.", player.name,
+                                        Card.from_code(code) if player.is_bot else "kartę")
+                        player.take_code(code)
                     else:
-                        if logger: logger.log("Talia jest pusta podczas rozdawania.")
-                        print("Talia jest pusta!")
+                        if logger: logger.warning("Talia jest pusta podczas rozdawania.")
+                        if observer: observer("Talia jest pusta!")
                         return
         if logger: logger.log("Zakończono rozdawanie kart.")
 
     def add_cards_to_bottom(self, discarded_cards: List[Card]):
-        self.cards.extend(discarded_cards)
+        size = len(self._buffer)
+        for card in discarded_cards:
+            if self._count >= size:
+                raise ValueError("Talia jest już pełna.")
+            self._buffer[(self._head + self._count) % size] = card.code
+            self._count += 1
 
 
 # --- Klasa Player ---
 class Player():
-    HAND_HIERARCHY = {
-        "Wysoka karta": 0, "Para": 1, "Dwie pary": 2, "Trójka": 3,
-        "Strit": 4, "Kolor": 5, "Full": 6, "Kareta": 7,
-        "Poker": 8, "Poker królewski": 9
-    }
+    """Gracz jako widok jednego miejsca w ``TableState`` (``src.logic.table_state``).
+
+    Stos, zakład, znaczniki i karty są przechowywane w kolumnach stanu stołu;
+    obiekt gracza zna tylko swój stan i numer miejsca. Gracz poza stołem ma wiersz
+    we wspólnym stanie ``DETACHED``.
+    """
+    __slots__ = ('_state', '_seat', '_name', 'is_bot')
+    HAND_HIERARCHY = {name: value for value, name in enumerate(CATEGORY_NAMES)}
+    _unnamed = itertools.count(1)
+    evaluations = 0  # liczba ocen układów (bez odczytów zapamiętanej siły) w procesie
 
     def __init__(self, money: int, name: str = "", is_bot: bool = False):
-        self.__stack_ = money
-        self.__name_ = name if name else f"Gracz_{random.randint(100, 999)}"
-        self.__hand_: List[Card] = []
-        self.is_folded: bool = False
-        self.current_bet_in_round: int = 0
+        self._state: Optional[TableState] = None
+        self._seat = 0
+        self._name = name if name else f"Gracz_{next(Player._unnamed)}"
         self.is_bot: bool = is_bot
+        DETACHED.attach(self, money)
+
+    def __del__(self):
+        if getattr(self, '_state', None) is DETACHED:
+            DETACHED.release(self._seat)
+
+    def __getstate__(self) -> Dict:
+        # Kopia (``copy``/``deepcopy``) i ``pickle`` przenoszą dane miejsca, a nie stan stołu (z blokadą).
+        return {"name": self._name, "is_bot": self.is_bot, "row": self._state.row(self._seat)}
+
+    def __setstate__(self, state: Dict) -> None:
+        self._name = state["name"]
+        self.is_bot = state["is_bot"]
+        DETACHED.attach(self)
+        DETACHED.set_row(self._seat, state["row"])
 
     @property
     def name(self) -> str:
-        return self.__name_
+        return self._name
+
+    @property
+    def seat(self) -> int:
+        """Numer miejsca w stanie stołu (indeks w ``GameEngine.players``)."""
+        return self._seat
 
     @property
     def stack(self) -> int:
-        return self.__stack_
+        return self._state.stack[self._seat]
+
+    @property
+    def is_folded(self) -> bool:
+        return self._state.folded[self._seat] != 0
+
+    @is_folded.setter
+    def is_folded(self, value: bool) -> None:
+        self._state.folded[self._seat] = bool(value)
+
+    @property
+    def current_bet_in_round(self) -> int:
+        return self._state.bet[self._seat]
+
+    @current_bet_in_round.setter
+    def current_bet_in_round(self, value: int) -> None:
+        self._state.bet[self._seat] = value
+
+    @property
+    def is_all_in(self) -> bool:
+        return self._state.all_in[self._seat] != 0
 
     @classmethod
     def create_players(cls, num_players: int, initial_stack: int, human_player_name: str = "Gracz") -> List['Player']:
@@ -138,102 +410,129 @@ class Player():
         return player_list
 
     def take_card(self, card: Card):
-        if len(self.__hand_) < 5:
-            self.__hand_.append(card)
+        self.take_code(card.code)
+
+    def take_code(self, code: int):
+        state, seat = self._state, self._seat
+        size = state.hand_len[seat]
+        if size < HAND_SIZE:
+            state.hand[seat * HAND_SIZE + size] = code
+            state.hand_len[seat] = size + 1
+            state.strength[seat] = UNKNOWN
+
+    def hand_size(self) -> int:
+        return self._state.hand_len[self._seat]
 
     def get_stack_amount(self) -> int:
-        return self.__stack_
+        return self.stack
 
     def pay_money(self, amount: int) -> int:
-        to_pay = min(self.__stack_, amount)
-        self.__stack_ -= to_pay
-        return to_pay
+        return self._state.pay(self._seat, amount)
 
     def receive_money(self, amount: int):
-        self.__stack_ += amount
+        self._state.stack[self._seat] += amount
 
     def change_card(self, new_card: Card, idx: int) -> Card:
-        if 0 <= idx < len(self.__hand_):
-            old_card = self.__hand_[idx]
-            self.__hand_[idx] = new_card
-            return old_card
-        raise IndexError(f"Niepoprawny indeks {idx} dla ręki o rozmiarze {len(self.__hand_)}")
+        state, seat = self._state, self._seat
+        if 0 <= idx < state.hand_len[seat]:
+            pos = seat * HAND_SIZE + idx
+            old_code = state.hand[pos]
+            state.hand[pos] = new_card.code
+            state.strength[seat] = UNKNOWN
+            return Card.from_code(old_code)
+        raise IndexError(f"Niepoprawny indeks {idx} dla ręki o rozmiarze {state.hand_len[seat]}")
+
+    def hand_codes(self) -> List[int]:
+        """Kody kart w kolejności, w jakiej leżą w ręce (indeksy jak w ``change_card``)."""
+        return self._state.hand_codes(self._seat)
+
+    def hand_cards(self) -> List[Card]:
+        """Karty w kolejności, w jakiej leżą w ręce (indeksy jak w ``change_card``)."""
+        from_code = Card.from_code
+        return [from_code(code) for code in self._state.hand_codes(self._seat)]
 
     def get_player_hand(self) -> Tuple[Card, ...]:
-        return tuple(sorted(self.__hand_, reverse=True))
+        return tuple(sorted(self.hand_cards(), reverse=True))
 
     def cards_to_str(self, reveal_for_human: bool = False) -> str:
-        if not self.__hand_: return "Brak kart"
+        size = self.hand_size()
+        if not size: return "Brak kart"
         if self.is_bot and not reveal_for_human:
-            return "?? " * len(self.__hand_)
-        return ', '.join(str(card) for card in sorted(self.__hand_, reverse=True))
+            return "?? " * size
+        return ', '.join(str(card) for card in sorted(self.hand_cards(), reverse=True))
 
     def clear_hand(self) -> List[Card]:
-        discarded = self.__hand_
-        self.__hand_ = []
-        self.is_folded = False
-        self.current_bet_in_round = 0
+        discarded = self.hand_cards()
+        state, seat = self._state, self._seat
+        state.hand_len[seat] = 0
+        state.strength[seat] = UNKNOWN
+        state.folded[seat] = False
+        state.all_in[seat] = False
+        state.bet[seat] = 0
+        state.committed[seat] = 0
         return discarded
 
+    def hand_strength(self) -> int:
+        """Zwraca porównywalną siłę układu (większa = lepsza) lub -1 dla niepełnej ręki."""
+        state, seat = self._state, self._seat
+        strength = state.strength[seat]
+        if strength == UNKNOWN:
+            if state.hand_len[seat] != HAND_SIZE:
+                return -1
+            Player.evaluations += 1
+            hand, start = state.hand, seat * HAND_SIZE
+            strength = evaluate5(hand[start], hand[start + 1], hand[start + 2], hand[start + 3], hand[start + 4])
+            state.strength[seat] = strength
+        return strength
+
     def hand_rank(self) -> Tuple[str, int, List[int]]:
-        if len(self.__hand_) != 5:
-            return "Niepełna ręka", -1, []
-
-        hand_sorted = sorted(self.__hand_, key=lambda c: c.get_rank_value(), reverse=True)
-        values = [card.get_rank_value() for card in hand_sorted]
-        suits = [card.suit for card in hand_sorted]
-
-        is_flush = len(set(suits)) == 1
-        is_straight = False
-        tie_breaker_values_straight = values
-        if all(values[i] == values[i + 1] + 1 for i in range(len(values) - 1)):
-            is_straight = True
-        elif values == [14, 5, 4, 3, 2]:
-            is_straight = True
-            tie_breaker_values_straight = [5, 4, 3, 2, 1]
-
-        rank_counts: Dict[int, int] = {}
-        for r_val in values:
-            rank_counts[r_val] = rank_counts.get(r_val, 0) + 1
-        sorted_rank_groups = sorted(rank_counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
-
-        final_tie_breakers = values
-
-        if is_flush and is_straight:
-            final_tie_breakers = tie_breaker_values_straight
-            if values == [14, 13, 12, 11, 10]:
-                return "Poker królewski", Player.HAND_HIERARCHY["Poker królewski"], final_tie_breakers
-            return "Poker", Player.HAND_HIERARCHY["Poker"], final_tie_breakers
-        if sorted_rank_groups[0][1] == 4:
-            final_tie_breakers = [g[0] for g in sorted_rank_groups]
-            return "Kareta", Player.HAND_HIERARCHY["Kareta"], final_tie_breakers
-        if sorted_rank_groups[0][1] == 3 and sorted_rank_groups[1][1] == 2:
-            final_tie_breakers = [g[0] for g in sorted_rank_groups]
-            return "Full", Player.HAND_HIERARCHY["Full"], final_tie_breakers
-        if is_flush:
-            return "Kolor", Player.HAND_HIERARCHY["Kolor"], final_tie_breakers
-        if is_straight:
-            final_tie_breakers = tie_breaker_values_straight
-            return "Strit", Player.HAND_HIERARCHY["Strit"], final_tie_breakers
-        if sorted_rank_groups[0][1] == 3:
-            final_tie_breakers = [g[0] for g in sorted_rank_groups]
-            return "Trójka", Player.HAND_HIERARCHY["Trójka"], final_tie_breakers
-        if sorted_rank_groups[0][1] == 2 and sorted_rank_groups[1][1] == 2:
-            final_tie_breakers = [g[0] for g in sorted_rank_groups]
-            return "Dwie pary", Player.HAND_HIERARCHY["Dwie pary"], final_tie_breakers
-        if sorted_rank_groups[0][1] == 2:
-            final_tie_breakers = [g[0] for g in sorted_rank_groups]
-            return "Para", Player.HAND_HIERARCHY["Para"], final_tie_breakers
-        return "Wysoka karta", Player.HAND_HIERARCHY["Wysoka karta"], final_tie_breakers
+        return describe(self.hand_strength())
 
     def __str__(self) -> str:
         return f"{self.name} (Stack: {self.stack}): {self.cards_to_str()}"
 
 
+class Decision(NamedTuple):
+    """Decyzja, na którą czeka silnik: akcja w licytacji albo wybór kart do wymiany."""
+    ACTION = "action"
+    EXCHANGE = "exchange"
+
+    kind: str
+    seat: int
+    player: Player
+
+
 # --- Klasa GameEngine ---
 class GameEngine:
-    def __init__(self, players: List[Player], deck: Deck, small_blind: int, big_blind: int, logger: GameLogger):
-        self.players = players
+    """Silnik rozgrywki pokera pięciokartowego dobieranego.
+
+    Decyzje przy każdym miejscu przy stole podejmuje obiekt strategii
+    (``decide_action``/``decide_exchange``), a komunikaty dla konsoli trafiają do
+    ``observer`` - domyślnie ``print``; ``observer=None`` wycisza wszystkie komunikaty.
+
+    Silnik ma własny generator ``rng``, z którego losuje ziarno każdego rozdania
+    (``hand_seed``); talia jest nim zasiewana przed tasowaniem. Wraz z decyzjami
+    graczy (``hand_actions``) wystarcza to do dokładnego odtworzenia rozdania
+    (``src.sim.replay``).
+
+    Z ``instrumentation`` (``src.logic.instrumentation``) silnik mierzy czasy faz
+    rozdania, czas decyzji strategii i liczy akcje, oceny układów, utworzone talie
+    i wpisy logu; bez niej nie ponosi żadnego dodatkowego kosztu poza sprawdzeniem ``None``.
+    Podobnie ``stats`` (``src.logic.opponent_stats``) dostaje akcje licytacji, wymiany
+    i układy z showdownu i na bieżąco prowadzi statystyki graczy (VPIP, agresja itd.).
+
+    Stosy, zakłady i karty wszystkich miejsc są kolumnami ``state``
+    (``src.logic.table_state.TableState``), a gracze - widokami jego miejsc.
+    Graczy między rozdaniami dosadza się i usuwa przez ``seat_player``/``remove_player``.
+    """
+    def __init__(self, players: List[Player], deck: Deck, small_blind: int, big_blind: int, logger: GameLogger,
+                 strategies: Optional[List['SeatStrategy']] = None,
+                 observer: Optional[Callable[[str], None]] = print,
+                 rng: Optional[random.Random] = None, instrumentation: Optional[Instrumentation] = None,
+                 stats: Optional[OpponentStats] = None):
+        # Gracze stają się widokami miejsc wspólnego stanu stołu; lista ``players`` pozostaje ta sama.
+        self.state = TableState(players)
+        self.players = self.state.players
         self.deck = deck
         self.small_blind_amount = small_blind
         self.big_blind_amount = big_blind
@@ -241,34 +540,88 @@ class GameEngine:
         self.dealer_button_idx = -1
         self.current_bet_to_match_in_round = 0
         self.logger = logger
+        # Siły układów graczy, którzy doszli do showdownu w ostatniej rundzie.
+        self.last_showdown: List[Tuple[Player, int]] = []
+        # Wygrane w ostatniej rundzie: (miejsce, kwota).
+        self.last_winnings: List[Tuple[int, int]] = []
+        self.rng = rng if rng is not None else random.Random()
+        self.hand_seed = 0
+        # Stosy na początku rozdania i decyzje w kolejności podjęcia: [miejsce, rodzaj, odpowiedź].
+        self.hand_start_stacks: List[int] = []
+        self.hand_actions: List[list] = []
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.track("hand_evaluations", lambda: Player.evaluations)
+            instrumentation.track("deck_allocations", lambda: Deck.allocations)
+            instrumentation.track("log_lines", lambda: self.logger.lines_written)
+        self.stats = stats
+        self.observer = observer
+        if strategies is None:
+            strategies = [RuleBasedBotStrategy() if p.is_bot else ConsoleStrategy() for p in players]
+        if len(strategies) != len(players):
+            raise ValueError("Liczba strategii musi odpowiadać liczbie graczy.")
+        self.strategies = strategies
 
-    def _get_active_players_in_game(self) -> List[Player]:
-        return [p for p in self.players if p.stack > 0]
+    @classmethod
+    def create_headless(cls, players: List[Player], small_blind: int, big_blind: int,
+                        strategies: Optional[List['SeatStrategy']] = None, logger: Optional[GameLogger] = None,
+                        observer: Optional[Callable[[str], None]] = None,
+                        rng: Optional[random.Random] = None,
+                        instrumentation: Optional[Instrumentation] = None,
+                        stats: Optional[OpponentStats] = None) -> 'GameEngine':
+        """Silnik bez wejścia z klawiatury i bez wypisywania - domyślnie wszystkie miejsca zajmują boty."""
+        if strategies is None:
+            strategies = [RuleBasedBotStrategy() for _ in players]
+        if logger is None:
+            logger = GameLogger(None)
+        return cls(players, Deck(), small_blind, big_blind, logger, strategies=strategies, observer=observer, rng=rng,
+                   instrumentation=instrumentation, stats=stats)
+
+    def _say(self, message: str) -> None:
+        if self.observer is not None:
+            self.observer(message)
+
+    def seat_player(self, player: Player, strategy: 'SeatStrategy') -> int:
+        """Sadza gracza na nowym, ostatnim miejscu (między rozdaniami) i zwraca numer miejsca."""
+        self.strategies.append(strategy)
+        return self.state.add_seat(player)
+
+    def remove_player(self, seat: int) -> Tuple[Player, 'SeatStrategy']:
+        """Usuwa gracza z miejsca (między rozdaniami); przycisk zostaje przy tym samym graczu."""
+        player = self.state.remove_seat(seat)
+        strategy = self.strategies.pop(seat)
+        # Przycisk przechodzi na poprzedniego gracza, gdy odszedł rozdający.
+        if seat <= self.dealer_button_idx:
+            self.dealer_button_idx -= 1
+        if self.players:
+            self.dealer_button_idx %= len(self.players)
+        else:
+            self.dealer_button_idx = -1
+        return player, strategy
 
-    def _get_active_players_in_hand(self) -> List[Player]:
-        return [p for p in self.players if not p.is_folded and p.stack >= 0]
+    def table_view(self, player: Player, deadline: Optional[float] = None) -> TableView:
+        """Niezmienna migawka stołu z perspektywy gracza (dla ``ViewStrategy``)."""
+        state = self.state
+        return TableView(player.seat, tuple(player.hand_codes()), player.hand_strength(), player.stack,
+                         player.current_bet_in_round, self.current_bet_to_match_in_round, self.pot,
+                         self.small_blind_amount, self.big_blind_amount, self.dealer_button_idx,
+                         tuple(state.stack), tuple(state.bet), tuple(map(bool, state.folded)), deadline)
 
-    def _find_next_player_idx_with_condition(self, start_idx: int, condition_func: Callable[[Player], bool]) -> int:
-        current_idx = start_idx
-        for _ in range(len(self.players)):
-            if condition_func(self.players[current_idx]):
-                return current_idx
-            current_idx = (current_idx + 1) % len(self.players)
-        return -1
+    def _get_active_players_in_hand(self) -> List[Player]:
+        players = self.players
+        return [players[seat] for seat in self.state.seats_in_hand()]
 
     def _post_blinds(self) -> int:
         self.logger.log("--- Rozpoczęcie stawiania blindów ---")
-        print("\n--- Blindy ---")
-        num_players_with_stack = len(self._get_active_players_in_game())
+        self._say("\n--- Blindy ---")
+        num_players_with_stack = self.state.count_with_chips()
         if num_players_with_stack < 2:
             self.logger.log("Za mało graczy do postawienia blindów.")
-            print("Za mało graczy do postawienia blindów.")
+            self._say("Za mało graczy do postawienia blindów.")
             return (self.dealer_button_idx + 1) % len(self.players)
 
-        sb_idx = self._find_next_player_idx_with_condition(
-            (self.dealer_button_idx + 1) % len(self.players),
-            lambda p: p.stack > 0
-        )
+        state = self.state
+        sb_idx = state.next_seat((self.dealer_button_idx + 1) % len(self.players), chips=True)
         if sb_idx == -1:
             self.logger.log("Nie znaleziono gracza do Small Blind.")
             return (self.dealer_button_idx + 1) % len(self.players)
@@ -277,91 +630,46 @@ class GameEngine:
         sb_paid = sb_player.pay_money(self.small_blind_amount)
         sb_player.current_bet_in_round += sb_paid
         self.pot += sb_paid
-        self.logger.log(f"Gracz {sb_player.name} stawia małą w ciemno: {sb_paid}. Stack: {sb_player.stack}")
-        print(f"{sb_player.name} stawia małą w ciemno: {sb_paid}")
-
-        bb_idx = self._find_next_player_idx_with_condition(
-            (sb_idx + 1) % len(self.players),
-            lambda p: p.stack > 0 and p != sb_player
-        )
-        if num_players_with_stack == 2:
-            bb_idx = self._find_next_player_idx_with_condition(
-                (sb_idx + 1) % len(self.players), lambda p: p.stack > 0
-            )
+        self.logger.log("Gracz %s stawia małą w ciemno: %s. Stack: %s", sb_player.name, sb_paid, sb_player.stack)
+        self.logger.event("small_blind", player=sb_player.name, amount=sb_paid, pot=self.pot)
+        self._say(f"{sb_player.name} stawia małą w ciemno: {sb_paid}")
+
+        # Duży blind to następny gracz z żetonami poza SB (przy dwóch graczach może nim być sam SB).
+        bb_idx = state.next_seat((sb_idx + 1) % len(self.players), chips=True,
+                                 count=None if num_players_with_stack == 2 else len(self.players) - 1)
 
         if bb_idx == -1 or bb_idx == sb_idx:
             self.logger.log(
-                f"Nie znaleziono gracza do Big Blind lub tylko SB może postawić. Aktualny zakład do wyrównania: {sb_paid}")
+                "Nie znaleziono gracza do Big Blind lub tylko SB może postawić. Aktualny zakład do wyrównania: %s", sb_paid)
             self.current_bet_to_match_in_round = sb_paid
-            first_to_act_idx = self._find_next_player_idx_with_condition(
-                (sb_idx + 1) % len(self.players), lambda p: not p.is_folded and p.stack > 0
-            )
+            first_to_act_idx = state.next_seat((sb_idx + 1) % len(self.players), chips=True, in_hand=True)
             return first_to_act_idx if first_to_act_idx != -1 else sb_idx
 
         bb_player = self.players[bb_idx]
         bb_paid = bb_player.pay_money(self.big_blind_amount)
         bb_player.current_bet_in_round += bb_paid
         self.pot += bb_paid
-        self.logger.log(f"Gracz {bb_player.name} stawia dużą w ciemno: {bb_paid}. Stack: {bb_player.stack}")
-        print(f"{bb_player.name} stawia dużą w ciemno: {bb_paid}")
+        self.logger.log("Gracz %s stawia dużą w ciemno: %s. Stack: %s", bb_player.name, bb_paid, bb_player.stack)
+        self.logger.event("big_blind", player=bb_player.name, amount=bb_paid, pot=self.pot)
+        self._say(f"{bb_player.name} stawia dużą w ciemno: {bb_paid}")
 
         self.current_bet_to_match_in_round = max(bb_paid, sb_paid)
         self.logger.log(
-            f"Aktualny zakład do wyrównania po blindach: {self.current_bet_to_match_in_round}. Pula: {self.pot}")
+            "Aktualny zakład do wyrównania po blindach: %s. Pula: %s", self.current_bet_to_match_in_round, self.pot)
 
-        first_to_act_idx = self._find_next_player_idx_with_condition(
-            (bb_idx + 1) % len(self.players), lambda p: not p.is_folded and p.stack > 0
-        )
+        first_to_act_idx = state.next_seat((bb_idx + 1) % len(self.players), chips=True, in_hand=True)
         if first_to_act_idx != -1:
-            self.logger.log(f"Pierwszy do akcji: {self.players[first_to_act_idx].name}")
+            self.logger.log("Pierwszy do akcji: %s", self.players[first_to_act_idx].name)
         else:
-            self.logger.log(f"Brak gracza do pierwszej akcji, prawdopodobnie BB: {self.players[bb_idx].name}")
+            self.logger.log("Brak gracza do pierwszej akcji, prawdopodobnie BB: %s", self.players[bb_idx].name)
             first_to_act_idx = bb_idx
 
         return first_to_act_idx if first_to_act_idx != -1 else bb_idx
 
-    def _get_bot_action(self, bot: Player) -> Tuple[str, int]:
-        self.logger.log(
-            f"Tura bota: {bot.name}. Stack: {bot.stack}, Karty: {bot.cards_to_str(True)}")
-        amount_to_call = self.current_bet_to_match_in_round - bot.current_bet_in_round
-        hand_name, hand_value, _ = bot.hand_rank()
-
-        if amount_to_call <= 0:  # Może check/bet
-            if hand_value >= Player.HAND_HIERARCHY["Para"]:
-                bet_amount = min(self.big_blind_amount * 2, bot.stack)
-                if bet_amount > 0:
-                    self.logger.log(f"Bot {bot.name} ma {hand_name} i decyduje się postawić {bet_amount}.")
-                    return ("bet", bet_amount)
-            self.logger.log(f"Bot {bot.name} ma {hand_name} i decyduje się czekać.")
-            return ("check", 0)
-        else:
-            if hand_value >= Player.HAND_HIERARCHY["Dwie pary"] and bot.stack > amount_to_call + self.big_blind_amount:
-                raise_total_amount = self.current_bet_to_match_in_round + self.big_blind_amount
-                self.logger.log(f"Bot {bot.name} ma {hand_name} i decyduje się przebić do {raise_total_amount}.")
-                return ("raise", raise_total_amount)
-            elif hand_value >= Player.HAND_HIERARCHY[
-                "Para"] and amount_to_call <= bot.stack / 4:
-                if amount_to_call <= bot.stack:
-                    self.logger.log(f"Bot {bot.name} ma {hand_name} i decyduje się sprawdzić {amount_to_call}.")
-                    return ("call", 0)
-
-            if amount_to_call > 0 and (hand_value < Player.HAND_HIERARCHY["Para"] or amount_to_call > bot.stack / 3):
-                self.logger.log(
-                    f"Bot {bot.name} ma {hand_name} i decyduje się spasować wobec zakładu {amount_to_call}.")
-                return ("fold", 0)
-
-            if amount_to_call <= bot.stack:
-                self.logger.log(
-                    f"Bot {bot.name} (ostateczność) ma {hand_name} i decyduje się sprawdzić {amount_to_call}.")
-                return ("call", 0)
-            else:
-                self.logger.log(f"Bot {bot.name} (ostateczność, brak stacka) ma {hand_name} i decyduje się spasować.")
-                return ("fold", 0)
-
     def prompt_human_action(self, player: Player) -> Tuple[str, int]:
         amount_to_call = self.current_bet_to_match_in_round - player.current_bet_in_round
-        self.logger.log(
-            f"Tura gracza: {player.name}. Stack: {player.stack}, Do wyrównania: {max(0, amount_to_call)}, Karty: {player.cards_to_str(True)}")  # Gracz widzi swoje karty
+        self.logger.debug(lambda: f"Tura gracza: {player.name}. Stack: {player.stack}, Do wyrównania: {max(0, amount_to_call)}, "
+                                  f"Karty: {player.cards_to_str(True)}")  # Gracz widzi swoje karty
         print(f"\n{player.name}, twoja kolej (Stack: {player.stack}, Pula: {self.pot})")
         print(
             f"Do tej pory postawiłeś: {player.current_bet_in_round}. Do wyrównania: {self.current_bet_to_match_in_round}.")
@@ -382,7 +690,7 @@ class GameEngine:
 
         while True:
             action_str = input(f"Akcja ({'/'.join(available_actions)}): ").lower().strip()
-            self.logger.log(f"Gracz {player.name} próbuje wykonać akcję: {action_str}")
+            self.logger.debug("Gracz %s próbuje wykonać akcję: %s", player.name, action_str)
 
             if action_str == "fold": return ("fold", 0)
             if action_str == "check" and "check" in available_actions: return ("check", 0)
@@ -392,461 +700,587 @@ class GameEngine:
             if action_str == "bet" and "bet" in available_actions:
                 try:
                     bet_amount_str = input(f"Podaj kwotę zakładu (min {self.big_blind_amount}): ")
-                    self.logger.log(f"Gracz {player.name} podaje kwotę zakładu: {bet_amount_str}")
+                    self.logger.debug("Gracz %s podaje kwotę zakładu: %s", player.name, bet_amount_str)
                     bet_amount = int(bet_amount_str)
                     if bet_amount < self.big_blind_amount and player.stack > bet_amount:
-                        self.logger.log(f"Kwota zakładu {bet_amount} mniejsza niż minimum {self.big_blind_amount}.")
+                        self.logger.debug("Kwota zakładu %s mniejsza niż minimum %s.", bet_amount, self.big_blind_amount)
                         print(f"Minimalny zakład to {self.big_blind_amount}.")
                         continue
                     if bet_amount > player.stack:
-                        self.logger.log(
-                            f"Gracz {player.name} próbuje postawić {bet_amount}, ale ma tylko {player.stack}. Stawia all-in.")
+                        self.logger.log("Gracz %s próbuje postawić %s, ale ma tylko %s. Stawia all-in.",
+                                        player.name, bet_amount, player.stack)
                         print(f"Nie masz tyle żetonów. Stawiasz wszystko: {player.stack}")
                         bet_amount = player.stack
                     return ("bet", bet_amount)
                 except ValueError:
-                    self.logger.log(f"Gracz {player.name} podał nieprawidłową kwotę zakładu.")
+                    self.logger.debug("Gracz %s podał nieprawidłową kwotę zakładu.", player.name)
                     print("Nieprawidłowa kwota.")
 
             if action_str == "raise" and "raise" in available_actions:
                 try:
                     raise_by_amount_str = input(f"O ile chcesz podbić (min {self.big_blind_amount})? ")
-                    self.logger.log(f"Gracz {player.name} podaje kwotę podbicia o: {raise_by_amount_str}")
+                    self.logger.debug("Gracz %s podaje kwotę podbicia o: %s", player.name, raise_by_amount_str)
                     raise_by_amount = int(raise_by_amount_str)
                     if raise_by_amount < self.big_blind_amount and player.stack > (amount_to_call + raise_by_amount):
-                        self.logger.log(
-                            f"Kwota podbicia {raise_by_amount} mniejsza niż minimum {self.big_blind_amount}.")
+                        self.logger.debug(
+                            "Kwota podbicia %s mniejsza niż minimum %s.", raise_by_amount, self.big_blind_amount)
                         print(f"Minimalne podbicie to o {self.big_blind_amount}.")
                         continue
 
                     total_bet_for_player = self.current_bet_to_match_in_round + raise_by_amount
                     if total_bet_for_player - player.current_bet_in_round > player.stack:
-                        self.logger.log(
-                            f"Gracz {player.name} próbuje przebić do {total_bet_for_player}, ale ma za mało. Stawia all-in.")
+                        self.logger.log("Gracz %s próbuje przebić do %s, ale ma za mało. Stawia all-in.",
+                                        player.name, total_bet_for_player)
                         print(f"Nie masz tyle żetonów. Przebijasz o wszystko co masz po wyrównaniu.")
                         return ("raise", player.current_bet_in_round + player.stack)
 
                     return ("raise", total_bet_for_player)
                 except ValueError:
-                    self.logger.log(f"Gracz {player.name} podał nieprawidłową kwotę podbicia.")
+                    self.logger.debug("Gracz %s podał nieprawidłową kwotę podbicia.", player.name)
                     print("Nieprawidłowa kwota.")
 
-            self.logger.log(f"Gracz {player.name} wybrał nieprawidłową akcję: {action_str}")
+            self.logger.debug("Gracz %s wybrał nieprawidłową akcję: %s", player.name, action_str)
             print("Nieprawidłowa akcja.")
 
-    def _betting_round(self, start_player_idx: int):
-        self.logger.log(
-            f"--- Rozpoczęcie rundy licytacji. Pula: {self.pot}, Do wyrównania: {self.current_bet_to_match_in_round} ---")
-        print(f"\n--- Runda Licytacji ---")
-
-        acting_players_indices = []
-        idx = start_player_idx
-        for _ in range(len(self.players)):
-            player = self.players[idx]
-            if not player.is_folded and player.stack >= 0:
-                acting_players_indices.append(idx)
-            idx = (idx + 1) % len(self.players)
-
-        if not acting_players_indices:
-            self.logger.log("Brak graczy do licytacji.")
-            print("Brak graczy do licytacji.")
-            return
-
-        current_actor_queue_idx = 0
+    _BETTING_END_MESSAGES = {
+        betting.ONE_LEFT: "Licytacja zakończona - pozostał jeden lub mniej graczy.",
+        betting.SETTLED: "Licytacja zakończona - wszyscy wyrównali lub są all-in/spasowani.",
+        betting.ORBIT_COMPLETE: "Licytacja zakończona - wszyscy wyrównali po pełnej kolejce.",
+        betting.QUEUE_EMPTY: "Licytacja zakończona - brak graczy w kolejce do akcji.",
+    }
 
-        betting_continues = True
-        while betting_continues:
-            active_in_hand = self._get_active_players_in_hand()
-            if len(active_in_hand) <= 1:
-                self.logger.log("Licytacja zakończona - pozostał jeden lub mniej graczy.")
-                betting_continues = False
-                break
+    def _betting_round(self, start_player_idx: int):
+        self._run_steps(self._betting_round_steps(start_player_idx))
 
-            all_matched_or_folded_or_all_in = True
-            player_to_act_this_loop = False
+    def _betting_round_steps(self, start_player_idx: int) -> Iterator['Decision']:
+        self.logger.log("--- Rozpoczęcie rundy licytacji. Pula: %s, Do wyrównania: %s ---",
+                        self.pot, self.current_bet_to_match_in_round)
+        self._say(f"\n--- Runda Licytacji ---")
 
-            for p_idx_check in acting_players_indices:
-                p_check = self.players[p_idx_check]
-                if not p_check.is_folded:
-                    if p_check.stack > 0 and p_check.current_bet_in_round < self.current_bet_to_match_in_round:
-                        all_matched_or_folded_or_all_in = False
-                    if p_check.stack > 0:
-                        player_to_act_this_loop = True
+        betting_round = BettingRound(self.state, start_player_idx, self.current_bet_to_match_in_round, self.pot)
+        if betting_round.finished:
+            self.logger.log("Brak graczy do licytacji.")
+            self._say("Brak graczy do licytacji.")
+            return
 
-            if all_matched_or_folded_or_all_in and not player_to_act_this_loop:
-                self.logger.log("Licytacja zakończona - wszyscy wyrównali lub są all-in/spasowani.")
-                betting_continues = False
+        stats = self.stats
+        facing_bet = False  # czy w rundzie padł już zakład lub przebicie (dla ``stats``)
+        while True:
+            player_idx = betting_round.next_to_act()
+            if player_idx is None:
                 break
-
-            if current_actor_queue_idx >= len(acting_players_indices):
-                all_bets_equal_final_check = True
-                for p_final_check in self._get_active_players_in_hand():
-                    if p_final_check.stack > 0 and p_final_check.current_bet_in_round < self.current_bet_to_match_in_round:
-                        all_bets_equal_final_check = False
-                        break
-
-                if all_bets_equal_final_check:
-                    self.logger.log("Licytacja zakończona - wszyscy wyrównali po pełnej kolejce.")
-                    betting_continues = False
-                    break
-                else:
-                    current_actor_queue_idx = 0
-                    new_acting_indices = []
-                    first_player_after_last_raiser_or_starter = acting_players_indices[0]
-
-                    idx_rebuild = first_player_after_last_raiser_or_starter
-                    for _ in range(len(self.players)):
-                        player_rebuild = self.players[idx_rebuild]
-                        if not player_rebuild.is_folded and player_rebuild.stack >= 0:
-                            new_acting_indices.append(idx_rebuild)
-                        idx_rebuild = (idx_rebuild + 1) % len(self.players)
-
-                    acting_players_indices = new_acting_indices
-                    if not acting_players_indices:
-                        self.logger.log("Brak aktywnych graczy po resecie kolejki licytacji.")
-                        betting_continues = False;
-                        break
-
-            player_idx = acting_players_indices[current_actor_queue_idx]
             player = self.players[player_idx]
-
-            if player.is_folded or (
-                    player.stack == 0 and player.current_bet_in_round >= self.current_bet_to_match_in_round):
-                current_actor_queue_idx += 1
-                continue
-            if player.stack == 0 and player.current_bet_in_round < self.current_bet_to_match_in_round:  # All-in za mniej
-                current_actor_queue_idx += 1
-                continue
-
-            action, amount = ("", 0)
-            if player.is_bot:
-                action, amount = self._get_bot_action(player)
-            else:
-                action, amount = self.prompt_human_action(player)
-
-            # Logika obsługi akcji (taka sama jak poprzednio)
-            if action == "fold":
-                player.is_folded = True
-                self.logger.log(f"Gracz {player.name} spasował. Stack: {player.stack}")
-                print(f"{player.name} pasuje.")
-            elif action == "check":
-                self.logger.log(f"Gracz {player.name} czeka. Stack: {player.stack}")
-                print(f"{player.name} czeka.")
-            elif action == "call":
-                amount_needed_to_call = self.current_bet_to_match_in_round - player.current_bet_in_round
-                to_pay = min(amount_needed_to_call, player.stack)
-                paid = player.pay_money(to_pay)
-                player.current_bet_in_round += paid
-                self.pot += paid
-                self.logger.log(
-                    f"Gracz {player.name} sprawdza, dokładając {paid}. Całkowity zakład w rundzie: {player.current_bet_in_round}. Pula: {self.pot}. Stack: {player.stack}")
-                print(f"{player.name} sprawdza, dokładając {paid}.")
-            elif action == "bet":
-                money_to_add_to_pot = amount - player.current_bet_in_round
-                paid = player.pay_money(min(money_to_add_to_pot, player.stack))
-                player.current_bet_in_round += paid
-
-                self.pot += paid
-                self.current_bet_to_match_in_round = player.current_bet_in_round
-                self.logger.log(
-                    f"Gracz {player.name} stawia {player.current_bet_in_round} (dokładając {paid}). Pula: {self.pot}. Stack: {player.stack}")
-                print(f"{player.name} stawia {player.current_bet_in_round} (dokładając {paid}).")
-                # Reset kolejki, bo była agresja
-                current_actor_queue_idx = 0
-                new_acting_indices = []
-                start_check_idx = (player_idx + 1) % len(self.players)
-                for i in range(len(self.players)):
-                    p_temp_idx = (start_check_idx + i) % len(self.players)
-                    if p_temp_idx == player_idx: break
-                    p_temp = self.players[p_temp_idx]
-                    if not p_temp.is_folded and p_temp.stack >= 0:
-                        new_acting_indices.append(p_temp_idx)
-                acting_players_indices = new_acting_indices
-                if not acting_players_indices: betting_continues = False; continue
-            elif action == "raise":
-                money_to_add_to_pot = amount - player.current_bet_in_round
-                paid = player.pay_money(min(money_to_add_to_pot, player.stack))
-                player.current_bet_in_round += paid
-
-                self.pot += paid
-                self.current_bet_to_match_in_round = player.current_bet_in_round
-                self.logger.log(
-                    f"Gracz {player.name} przebija do {player.current_bet_in_round} (dokładając {paid}). Pula: {self.pot}. Stack: {player.stack}")
-                print(f"{player.name} przebija do {player.current_bet_in_round} (dokładając {paid}).")
-                # Reset kolejki
-                current_actor_queue_idx = 0
-                new_acting_indices = []
-                start_check_idx = (player_idx + 1) % len(self.players)
-                for i in range(len(self.players)):
-                    p_temp_idx = (start_check_idx + i) % len(self.players)
-                    if p_temp_idx == player_idx: break
-                    p_temp = self.players[p_temp_idx]
-                    if not p_temp.is_folded and p_temp.stack >= 0:
-                        new_acting_indices.append(p_temp_idx)
-                acting_players_indices = new_acting_indices
-                if not acting_players_indices: betting_continues = False; continue
-
-            if betting_continues and action not in ["bet", "raise"]:
-                current_actor_queue_idx += 1
-
-        self.logger.log(f"--- Zakończenie rundy licytacji. Pula: {self.pot} ---")
-
-    def _get_bot_exchange_decision(self, bot: Player) -> List[int]:
-        """Prosta logika wymiany kart dla bota."""
-        self.logger.log(f"Bot {bot.name} decyduje o wymianie. Ręka: {bot.cards_to_str(True)}")
-        hand_cards = bot._Player__hand_[:]
-        hand_name, hand_value, tie_breakers = bot.hand_rank()
-
-        indices_to_discard = []
-
-        if hand_value >= Player.HAND_HIERARCHY["Trójka"]:
-            self.logger.log(f"Bot {bot.name} ma {hand_name}, nie wymienia kart.")
-            return []
-
-        if hand_value == Player.HAND_HIERARCHY["Dwie pary"]:
-            ranks = [card.get_rank_value() for card in hand_cards]
-            rank_counts = {r: ranks.count(r) for r in set(ranks)}
-            kicker_rank_val = -1
-            for r_val, count in rank_counts.items():
-                if count == 1:
-                    kicker_rank_val = r_val
-                    break
-            if kicker_rank_val != -1:
-                for i, card in enumerate(hand_cards):
-                    if card.get_rank_value() == kicker_rank_val:
-                        indices_to_discard.append(i)
-                        self.logger.log(f"Bot {bot.name} ma dwie pary, wymienia kickera: {card}")
-                        break
-            return indices_to_discard
-
-        if hand_value == Player.HAND_HIERARCHY["Para"]:
-            pair_rank_val = -1
-            ranks = [card.get_rank_value() for card in hand_cards]
-            rank_counts = {r: ranks.count(r) for r in set(ranks)}
-            for r_val, count in rank_counts.items():
-                if count == 2:
-                    pair_rank_val = r_val
-                    break
-
-            for i, card in enumerate(hand_cards):
-                if card.get_rank_value() != pair_rank_val:
-                    indices_to_discard.append(i)
-            pair_rank_display_str = Card.VALUE_TO_RANK_STR.get(pair_rank_val, 'NIEZNANA') if pair_rank_val != -1 else ''
+            action, amount = yield Decision(Decision.ACTION, player_idx, player)
+            self.hand_actions.append([player_idx, Decision.ACTION, [action, amount]])
+            action, paid = betting_round.apply_action(action, amount)
+            self.pot = betting_round.pot
+            self.current_bet_to_match_in_round = betting_round.bet_to_match
+            self._report_action(player, action, paid)
+            if self.instrumentation is not None:
+                self.instrumentation.count("actions", street="pre_draw", action=action)
+            if stats is not None:
+                stats.on_action(player.name, action, facing_bet)
+                if action in AGGRESSIVE_ACTIONS:
+                    facing_bet = True
+
+        self.logger.log(self._BETTING_END_MESSAGES[betting_round.end_reason])
+        self.logger.log("--- Zakończenie rundy licytacji. Pula: %s ---", self.pot)
+
+    def _report_action(self, player: Player, action: str, paid: int) -> None:
+        """Zapisuje w logu i pokazuje obserwatorowi akcję wykonaną w licytacji."""
+        if action == "fold":
+            self.logger.log("Gracz %s spasował. Stack: %s", player.name, player.stack)
+            self._say(f"{player.name} pasuje.")
+        elif action == "check":
+            self.logger.log("Gracz %s czeka. Stack: %s", player.name, player.stack)
+            self._say(f"{player.name} czeka.")
+        elif action == "call":
             self.logger.log(
-                f"Bot {bot.name} ma parę {pair_rank_display_str}, wymienia {len(indices_to_discard)} karty.")
-            return indices_to_discard
-
-        if len(hand_cards) == 5:
-            indexed_hand = list(enumerate(bot._Player__hand_))
-            indexed_hand.sort(key=lambda item: item[1].get_rank_value())
+                "Gracz %s sprawdza, dokładając %s. Całkowity zakład w rundzie: %s. Pula: %s. Stack: %s",
+                player.name, paid, player.current_bet_in_round, self.pot, player.stack)
+            self._say(f"{player.name} sprawdza, dokładając {paid}.")
+        elif action == "bet":
+            self.logger.log("Gracz %s stawia %s (dokładając %s). Pula: %s. Stack: %s",
+                            player.name, player.current_bet_in_round, paid, self.pot, player.stack)
+            self._say(f"{player.name} stawia {player.current_bet_in_round} (dokładając {paid}).")
+        elif action == "raise":
+            self.logger.log("Gracz %s przebija do %s (dokładając %s). Pula: %s. Stack: %s",
+                            player.name, player.current_bet_in_round, paid, self.pot, player.stack)
+            self._say(f"{player.name} przebija do {player.current_bet_in_round} (dokładając {paid}).")
+        else:
+            return
+        self.logger.event(action, player=player.name, amount=paid, pot=self.pot)
 
-            num_to_discard_high_card = min(3, len(indexed_hand))
-            for i in range(num_to_discard_high_card):
-                original_index = indexed_hand[i][0]
-                if original_index not in indices_to_discard:
-                    indices_to_discard.append(original_index)
+    def prompt_human_exchange(self, player: Player) -> List[int]:
+        """Pyta gracza ludzkiego o karty do wymiany i zwraca ich indeksy w ręce."""
+        self.logger.debug(lambda: f"Tura wymiany kart dla gracza {player.name}. Ręka: {player.cards_to_str(True)}")
+        print(f"\n{player.name}, twoja ręka: {player.cards_to_str(True)}")
+        current_hand_list = player.hand_cards()
 
-            if indices_to_discard:  # Tylko jeśli faktycznie coś jest do wyrzucenia
-                self.logger.log(f"Bot {bot.name} ma wysoką kartę, wymienia {len(indices_to_discard)} karty.")
-            return indices_to_discard
+        num_exchange_str = input(f"Ile kart chcesz wymienić (0-{len(current_hand_list)}, Enter = 0)? ")
+        try:
+            num_to_exchange = int(num_exchange_str) if num_exchange_str else 0
+            if not 0 <= num_to_exchange <= len(current_hand_list):
+                num_to_exchange = 0
+        except ValueError:
+            num_to_exchange = 0
 
-        return []
+        self.logger.log("Gracz %s decyduje się wymienić %s kart.", player.name, num_to_exchange)
+        if num_to_exchange == 0:
+            return []
 
-    def _perform_card_exchange_for_player(self, player: Player):
-        if player.is_folded: return
+        print("Twoja obecna ręka (indeksy 0-4):")
+        for i, card_obj in enumerate(current_hand_list):
+            print(f"  {i}: {card_obj}")
 
         indices_to_replace: List[int] = []
-        num_to_exchange = 0
+        for i in range(num_to_exchange):
+            while True:
+                try:
+                    idx_str = input(f"Podaj indeks karty #{i + 1} do wymiany (0-{len(current_hand_list) - 1}): ")
+                    idx = int(idx_str)
+                    if not 0 <= idx < len(current_hand_list) or idx in indices_to_replace:
+                        print("Nieprawidłowy lub powtórzony indeks.")
+                        continue
+                    indices_to_replace.append(idx)
+                    break
+                except ValueError:
+                    print("Nieprawidłowy indeks.")
+        self.logger.debug("Gracz %s wymienia karty o indeksach: %s", player.name, indices_to_replace)
+        return indices_to_replace
 
-        if player.is_bot:
-            indices_to_replace = self._get_bot_exchange_decision(player)
-            num_to_exchange = len(indices_to_replace)
-            if num_to_exchange > 0:
-                print(f"{player.name} wymienia {num_to_exchange} kart.")
+    def _perform_card_exchange_for_player(self, player: Player, seat_idx: Optional[int] = None):
+        if player.is_folded: return
+        if seat_idx is None:
+            seat_idx = self.players.index(player)
+        self._apply_card_exchange(player, self.strategies[seat_idx].decide_exchange(self, player))
+
+    def _apply_card_exchange(self, player: Player, indices: List[int]) -> None:
+        """Wymienia karty gracza o podanych indeksach na nowe z talii."""
+        indices_to_replace = list(indices)
+        num_to_exchange = len(indices_to_replace)
+        if self.stats is not None:
+            self.stats.on_exchange(player.name, num_to_exchange)
+        if num_to_exchange == 0:
+            self._say(f"{player.name} nie wymienia kart.")
+            return
+        self._say(f"{player.name} wymienia {num_to_exchange} kart.")
+
+        indices_to_replace.sort(reverse=True)
+        discarded_cards: List[Card] = []
+        for idx_in_hand in indices_to_replace:
+            new_card = self.deck.deal_one()
+            if new_card:
+                old_card = player.change_card(new_card, idx_in_hand)
+                discarded_cards.append(old_card)
+                self.logger.debug("Gracz %s wymienił %s na %s.", player.name, old_card, new_card)
             else:
-                print(f"{player.name} nie wymienia kart.")
-        else:  # Gracz ludzki
-            self.logger.log(f"Tura wymiany kart dla gracza {player.name}. Ręka: {player.cards_to_str(True)}")
-            print(f"\n{player.name}, twoja ręka: {player.cards_to_str(True)}")
-            current_hand_list = player._Player__hand_
-
-            num_exchange_str = input(f"Ile kart chcesz wymienić (0-{len(current_hand_list)}, Enter = 0)? ")
-            try:
-                num_to_exchange = int(num_exchange_str) if num_exchange_str else 0
-                if not 0 <= num_to_exchange <= len(current_hand_list):
-                    num_to_exchange = 0
-            except ValueError:
-                num_to_exchange = 0
-
-            self.logger.log(f"Gracz {player.name} decyduje się wymienić {num_to_exchange} kart.")
-
-            if num_to_exchange == 0:
-                print(f"{player.name} nie wymienia kart.")
-                return
-
-            print("Twoja obecna ręka (indeksy 0-4):")
-            for i, card_obj in enumerate(current_hand_list):
-                print(f"  {i}: {card_obj}")
-
-            for i in range(num_to_exchange):
-                while True:
-                    try:
-                        idx_str = input(f"Podaj indeks karty #{i + 1} do wymiany (0-{len(current_hand_list) - 1}): ")
-                        idx = int(idx_str)
-                        if not 0 <= idx < len(current_hand_list) or idx in indices_to_replace:
-                            print("Nieprawidłowy lub powtórzony indeks.")
-                            continue
-                        indices_to_replace.append(idx)
-                        break
-                    except ValueError:
-                        print("Nieprawidłowy indeks.")
-            self.logger.log(f"Gracz {player.name} wymienia karty o indeksach: {indices_to_replace}")
-
-        if num_to_exchange > 0:
-            indices_to_replace.sort(reverse=True)
-            discarded_cards: List[Card] = []
-            for idx_in_hand in indices_to_replace:
-                new_card = self.deck.deal_one()
-                if new_card:
-                    old_card = player.change_card(new_card, idx_in_hand)
-                    discarded_cards.append(old_card)
-                    self.logger.log(f"Gracz {player.name} wymienił {old_card} na {new_card}.")
-                else:
-                    self.logger.log(f"Talia pusta podczas wymiany dla gracza {player.name}.")
-                    print("Talia jest pusta, nie można dobrać nowych kart.")
-                    break
-            if discarded_cards: self.deck.add_cards_to_bottom(discarded_cards)
+                self.logger.warning("Talia pusta podczas wymiany dla gracza %s.", player.name)
+                self._say("Talia jest pusta, nie można dobrać nowych kart.")
+                break
+        if discarded_cards: self.deck.add_cards_to_bottom(discarded_cards)
+        self.logger.event("exchange", player=player.name, amount=len(discarded_cards), pot=self.pot)
 
-        if not player.is_bot or num_to_exchange > 0:  # Pokaż nową rękę graczowi lub jeśli bot coś wymienił
-            self.logger.log(
-                f"Gracz {player.name} - nowa ręka: {player.cards_to_str(True if not player.is_bot else False)}")
-            print(f"{player.name}, nowa ręka: {player.cards_to_str(True if not player.is_bot else False)}")
+        # Nowe karty widzi tylko gracz ludzki; dla botów wypisujemy zakryte karty.
+        self.logger.debug(lambda: f"Gracz {player.name} - nowa ręka: {player.cards_to_str(not player.is_bot)}")
+        if self.observer is not None:
+            self._say(f"{player.name}, nowa ręka: {player.cards_to_str(not player.is_bot)}")
 
     def showdown(self) -> None:
-        self.logger.log(f"--- Rozpoczęcie Showdown. Pula: {self.pot} ---")
-        print("\n--- Showdown ---")
+        self.logger.log("--- Rozpoczęcie Showdown. Pula: %s ---", self.pot)
+        self._say("\n--- Showdown ---")
         active_players = self._get_active_players_in_hand()
 
         if not active_players:
             self.logger.log("Brak graczy do showdownu (wszyscy spasowali).")
-            print("Brak graczy do showdownu (wszyscy spasowali).")
+            self._say("Brak graczy do showdownu (wszyscy spasowali).")
+            return
+
+        state = self.state
+        committed = state.committed
+        self._return_uncalled()
+        if not any(committed[p.seat] for p in active_players) and state.total_committed():
+            # Wszyscy, którzy wnieśli żetony, spasowali - nikt w grze nie ma prawa do puli, więc wkłady wracają.
+            self._refund_committed()
             return
 
+        pots = build_pots(committed, state.folded)
+        unassigned = self.pot - sum(pot.amount for pot in pots)
+        if unassigned:
+            # Żetony w puli bez wkładu żadnego miejsca (np. pula ustawiona z zewnątrz) trafiają do puli głównej.
+            if pots:
+                pots[0] = Pot(pots[0].amount + unassigned, pots[0].eligible)
+            else:
+                pots = [Pot(unassigned, tuple(p.seat for p in active_players))]
+
         if len(active_players) == 1:
             winner = active_players[0]
+            amount = sum(pot.amount for pot in pots if winner.seat in pot.eligible)
             self.logger.log(
-                f"Gracz {winner.name} wygrywa {self.pot} jako jedyny pozostały. Stack: {winner.stack + self.pot}")
-            print(f"{winner.name} wygrywa {self.pot} jako jedyny pozostały gracz.")
-            winner.receive_money(self.pot)
+                "Gracz %s wygrywa %s jako jedyny pozostały. Stack: %s", winner.name, amount, winner.stack + amount)
+            self.logger.event("win", player=winner.name, amount=amount, pot=amount, hand=None)
+            self._say(f"{winner.name} wygrywa {amount} jako jedyny pozostały gracz.")
+            winner.receive_money(amount)
+            self.last_winnings.append((winner.seat, amount))
             self.pot = 0
             return
 
-        print("Odkrywanie kart:")
-        player_evals: List[Tuple[Player, Tuple[str, int, List[int]]]] = []
-        for player in active_players:
-            eval_result = player.hand_rank()
-            player_evals.append((player, eval_result))
-            self.logger.log(
-                f"Showdown: {player.name} ma {eval_result[0]} ({player.cards_to_str(True)}), Tie-breakers: {eval_result[2]}")
-            print(f"{player.name}: {player.cards_to_str(True)} -> {eval_result[0]} (Tie: {eval_result[2]})")
-
-        player_evals.sort(key=lambda x: (x[1][1], x[1][2]), reverse=True)
-
-        best_eval = player_evals[0][1]
-        winners_data = [pe for pe in player_evals if (pe[1][1], pe[1][2]) == (best_eval[1], best_eval[2])]
-
-        num_winners = len(winners_data)
-        if num_winners > 0:
-            win_amount_base = self.pot // num_winners
-            remainder = self.pot % num_winners
-            self.logger.log(f"Zwycięzcy (liczba: {num_winners}):")
-            print(f"\nZwycięzca/y puli ({self.pot}):")
-            for i, (player_obj, eval_data) in enumerate(winners_data):
-                final_win_amount = win_amount_base + (1 if i < remainder else 0)
-                player_obj.receive_money(final_win_amount)
-                self.logger.log(
-                    f"  - {player_obj.name} z {eval_data[0]}, wygrywa {final_win_amount}. Nowy stack: {player_obj.stack}")
-                print(f"  - {player_obj.name} z {eval_data[0]}, wygrywa {final_win_amount}")
-            self.pot = 0
-        else:
-            self.logger.log("Błąd: Brak zwycięzcy w showdownie.")
-            print("Błąd: Brak zwycięzcy.")
+        contenders = sorted({seat for pot in pots for seat in pot.eligible})
+
+        self._say("Odkrywanie kart:")
+        strengths = [-1] * len(self.players)
+        for seat in contenders:
+            player = self.players[seat]
+            strength = player.hand_strength()
+            strengths[seat] = strength
+            self.last_showdown.append((player, strength))
+            if self.stats is not None:
+                self.stats.on_showdown(player.name, category_of(strength))
+            self.logger.debug(lambda: f"Showdown: {player.name} ma {category_name(strength)} "
+                                      f"({player.cards_to_str(True)}), Tie-breakers: {describe(strength)[2]}")
+            if self.observer is not None:
+                hand_name, _, tie_breakers = describe(strength)
+                self._say(f"{player.name}: {player.cards_to_str(True)} -> {hand_name} (Tie: {tie_breakers})")
+
+        for pot_idx, (pot, awards) in enumerate(zip(pots, award_pots(pots, strengths))):
+            pot_name = "puli" if len(pots) == 1 else "puli głównej" if pot_idx == 0 else f"puli bocznej #{pot_idx}"
+            self.logger.log("Zwycięzcy %s %s (liczba: %s):", pot_name, pot.amount, len(awards))
+            self._say(f"\nZwycięzca/y {pot_name} ({pot.amount}):")
+            winning_hand_name = category_name(strengths[awards[0][0]])
+            for seat, amount in awards:
+                player_obj = self.players[seat]
+                player_obj.receive_money(amount)
+                self.last_winnings.append((seat, amount))
+                self.logger.log("  - %s z %s, wygrywa %s. Nowy stack: %s",
+                                player_obj.name, winning_hand_name, amount, player_obj.stack)
+                self.logger.event("win", player=player_obj.name, amount=amount, pot=pot.amount,
+                                  hand=winning_hand_name)
+                self._say(f"  - {player_obj.name} z {winning_hand_name}, wygrywa {amount}")
+        self.pot = 0
         self.logger.log("--- Zakończenie Showdown ---")
 
+    def _return_uncalled(self) -> None:
+        """Oddaje najwyższemu wkładowi nadwyżkę, której nikt nie sprawdził (``uncalled_bet``)."""
+        seat, amount = uncalled_bet(self.state.committed)
+        if not amount:
+            return
+        player = self.players[seat]
+        self.state.committed[seat] -= amount
+        player.receive_money(amount)
+        self.pot -= amount
+        self.logger.log("Gracz %s odzyskuje niesprawdzony zakład %s. Stack: %s", player.name, amount, player.stack)
+        self._say(f"{player.name} odzyskuje niesprawdzony zakład {amount}.")
+
+    def _refund_committed(self) -> None:
+        """Zwraca każdemu miejscu żetony wniesione w rozdaniu (pula bez uprawnionych graczy)."""
+        for seat, amount in enumerate(self.state.committed):
+            if amount:
+                player = self.players[seat]
+                player.receive_money(amount)
+                self.last_winnings.append((seat, amount))
+                self.logger.log("Gracz %s odzyskuje wkład %s. Stack: %s", player.name, amount, player.stack)
+                self._say(f"{player.name} odzyskuje wkład {amount}.")
+        self.pot = 0
+        self.logger.log("--- Zakończenie Showdown ---")
+
+    def hand_record(self, round_number: int) -> Dict:
+        """Podsumowanie ostatniej rundy w układzie ``SessionManager.append_hand_history``.
+
+        Miejsca to indeksy w ``players``; ``showdown`` zawiera kategorie układów
+        (``src.logic.evaluator``) graczy, którzy odkryli karty. ``seed``, ``blinds``,
+        ``start_stacks`` i ``actions`` pozwalają odtworzyć rozdanie (``src.sim.replay``).
+        """
+        return {
+            "round": round_number,
+            "seed": self.hand_seed,
+            "blinds": [self.small_blind_amount, self.big_blind_amount],
+            "start_stacks": list(self.hand_start_stacks),
+            "actions": [list(action) for action in self.hand_actions],
+            "dealer": self.dealer_button_idx,
+            "pot": sum(amount for _, amount in self.last_winnings),
+            "stacks": [p.stack for p in self.players],
+            "winners": [[seat, amount] for seat, amount in self.last_winnings],
+            "showdown": [[p.seat, category_of(strength)] for p, strength in self.last_showdown],
+        }
+
     def play_round(self, round_number: int) -> None:
-        self.logger.log(f"====== NOWA RUNDA #{round_number} ======")
-        print("\n" + "=" * 10 + f" NOWA RUNDA #{round_number} " + "=" * 10)
+        self._run_steps(self.play_round_steps(round_number))
+
+    def _run_steps(self, steps: Iterator['Decision']) -> None:
+        """Prowadzi rozgrywkę krokową, pytając o każdą decyzję strategię danego miejsca."""
+        inst = self.instrumentation
+        try:
+            decision = next(steps)
+            while True:
+                strategy = self.strategies[decision.seat]
+                start = time.perf_counter() if inst is not None else 0.0
+                if decision.kind == Decision.ACTION:
+                    answer = strategy.decide_action(self, decision.player)
+                else:
+                    answer = strategy.decide_exchange(self, decision.player)
+                if inst is not None:
+                    inst.add_time("decision", time.perf_counter() - start)
+                decision = steps.send(answer)
+        except StopIteration:
+            pass
+
+    def play_round_steps(self, round_number: int, hand_seed: Optional[int] = None) -> Iterator['Decision']:
+        """Rozgrywa rundę jako generator: każda potrzebna decyzja jest zwracana przez ``yield``.
+
+        Odpowiedź przekazuje się przez ``send`` - dla akcji krotkę ``(akcja, kwota)``,
+        dla wymiany listę indeksów kart. Pozwala to prowadzić wiele stołów naraz
+        (np. w pętli asyncio) bez blokowania na decyzjach graczy.
+        Bez ``hand_seed`` ziarno rozdania jest losowane z ``rng`` silnika.
+        """
+        inst = self.instrumentation
+        if inst is None:
+            yield from self._play_round_steps(round_number, hand_seed)
+        else:
+            inst.begin_hand()
+            try:
+                yield from self._play_round_steps(round_number, hand_seed)
+            finally:
+                inst.end_hand()
+        if self.stats is not None:
+            self.stats.end_hand(p.name for p in self.players)
+
+    def _play_round_steps(self, round_number: int, hand_seed: Optional[int]) -> Iterator['Decision']:
+        inst = self.instrumentation
+        if inst is not None:
+            inst.mark("blinds")  # przygotowanie talii, przycisk i blindy
+        self.logger.log("====== NOWA RUNDA #%s ======", round_number)
+        self.logger.event("round_start", round=round_number)
+        self._say("\n" + "=" * 10 + f" NOWA RUNDA #{round_number} " + "=" * 10)
         self.pot = 0
         self.current_bet_to_match_in_round = 0
-        self.deck = Deck()
-        self.logger.log(f"Stworzono nową talię ({len(self.deck.cards)} kart).")
+        self.last_showdown = []
+        self.last_winnings = []
+        self.hand_seed = self.rng.getrandbits(63) if hand_seed is None else hand_seed
+        self.hand_start_stacks = [p.stack for p in self.players]
+        self.hand_actions = []
+        self.deck.reset()
+        self.logger.debug("Przywrócono pełną talię (%s kart).", len(self.deck))
+        self.deck.seed(self.hand_seed)
         self.deck.shuffle()
-        self.logger.log("Talia została potasowana.")
+        self.logger.debug("Talia została potasowana.")
 
-        for p in self.players:
-            discarded = p.clear_hand()
-            if discarded: self.logger.log(f"Gracz {p.name} zrzucił karty: {', '.join(map(str, discarded))}")
-        self.logger.log("Wyczyszczono ręce graczy.")
+        if self.logger.is_enabled_for(GameLogger.DEBUG):
+            for p in self.players:
+                discarded = p.hand_cards()
+                if discarded: self.logger.debug("Gracz %s zrzucił karty: %s", p.name, ', '.join(map(str, discarded)))
+        self.state.new_hand()
+        self.logger.debug("Wyczyszczono ręce graczy.")
 
         self.dealer_button_idx = (self.dealer_button_idx + 1) % len(self.players)
         actual_dealer_idx_candidate = self.dealer_button_idx
-        self.dealer_button_idx = self._find_next_player_idx_with_condition(
-            actual_dealer_idx_candidate, lambda p: p.stack > 0
-        )
+        self.dealer_button_idx = self.state.next_seat(actual_dealer_idx_candidate, chips=True)
         if self.dealer_button_idx == -1:
             self.dealer_button_idx = actual_dealer_idx_candidate  # Wróć do kandydata
 
-        self.logger.log(f"Dealerem jest: {self.players[self.dealer_button_idx].name}")
-        print(f"Dealerem jest: {self.players[self.dealer_button_idx].name}")
+        self.logger.log("Dealerem jest: %s", self.players[self.dealer_button_idx].name)
+        self._say(f"Dealerem jest: {self.players[self.dealer_button_idx].name}")
 
         first_to_act_idx = self._post_blinds()
 
         active_for_blinds = self._get_active_players_in_hand()
         if len(active_for_blinds) < 1:
             self.logger.log("Gra kończy się po blindach, za mało aktywnych graczy lub wszyscy all-in.")
-            print("Gra kończy się po blindach (np. wszyscy all-in).")
+            self._say("Gra kończy się po blindach (np. wszyscy all-in).")
+            if inst is not None:
+                inst.mark("showdown")
             self.showdown()
+            self.logger.event("round_end", round=round_number)
             return
         if len(active_for_blinds) == 1 and self.pot > 0:  # Jeśli został tylko 1 gracz, zgarnia pulę
-            self.logger.log(f"Gra kończy się po blindach, {active_for_blinds[0].name} wygrywa pulę {self.pot}.")
-            print(f"{active_for_blinds[0].name} wygrywa pulę {self.pot} po blindach.")
+            self.logger.log("Gra kończy się po blindach, %s wygrywa pulę %s.", active_for_blinds[0].name, self.pot)
+            self.logger.event("win", player=active_for_blinds[0].name, amount=self.pot, pot=self.pot, hand=None)
+            self._say(f"{active_for_blinds[0].name} wygrywa pulę {self.pot} po blindach.")
             active_for_blinds[0].receive_money(self.pot)
+            self.last_winnings.append((active_for_blinds[0].seat, self.pot))
             self.pot = 0
+            self.logger.event("round_end", round=round_number)
             return
 
+        if inst is not None:
+            inst.mark("deal")
         self.logger.log("--- Rozdawanie kart ---")
-        print("\n--- Rozdawanie kart ---")
-        self.deck.deal(self.players, 5, self.logger)
-        for p in self.players:
-            if not p.is_folded:
+        self._say("\n--- Rozdawanie kart ---")
+        self.deck.deal(self.players, 5, self.logger, self.observer)
+        if self.stats is not None:
+            committed = self.state.committed
+            self.stats.begin_hand(p.name for p in self.players
+                                  if not p.is_folded and (p.stack > 0 or committed[p.seat]))
+        if self.observer is not None:
+            for p in self.players:
                 # Pokaż karty tylko graczowi ludzkiemu
-                if not p.is_bot:
-                    print(p)
+                if not p.is_folded and not p.is_bot:
+                    self._say(str(p))
 
-        if len(self._get_active_players_in_hand()) > 1:
-            self._betting_round(start_player_idx=first_to_act_idx)
+        if self.state.count_in_hand() > 1:
+            if inst is not None:
+                inst.mark("betting")
+            yield from self._betting_round_steps(first_to_act_idx)
 
-        active_after_betting = self._get_active_players_in_hand()
-        if len(active_after_betting) <= 1:
+        if self.state.count_in_hand() <= 1:
             self.logger.log("Gra kończy się po licytacji, jeden lub mniej graczy.")
+            if inst is not None:
+                inst.mark("showdown")
             self.showdown()
+            self.logger.event("round_end", round=round_number)
             return
 
+        if inst is not None:
+            inst.mark("exchange")
         self.logger.log("--- Wymiana Kart ---")
-        print("\n--- Wymiana Kart ---")
-        exchange_start_idx = self._find_next_player_idx_with_condition(
-            (self.dealer_button_idx + 1) % len(self.players),
-            lambda p: not p.is_folded and p.stack >= 0
-        )
+        self._say("\n--- Wymiana Kart ---")
+        exchange_start_idx = self.state.next_seat((self.dealer_button_idx + 1) % len(self.players), in_hand=True)
         if exchange_start_idx != -1:
+            folded = self.state.folded
             for i in range(len(self.players)):
                 player_to_exchange_idx = (exchange_start_idx + i) % len(self.players)
-                player = self.players[player_to_exchange_idx]
-                if not player.is_folded and player.stack >= 0:
-                    self._perform_card_exchange_for_player(player)
-
+                if not folded[player_to_exchange_idx]:
+                    player = self.players[player_to_exchange_idx]
+                    indices = yield Decision(Decision.EXCHANGE, player_to_exchange_idx, player)
+                    self.hand_actions.append([player_to_exchange_idx, Decision.EXCHANGE, list(indices)])
+                    if inst is not None:
+                        inst.count("actions", street="draw", action="exchange")
+                    self._apply_card_exchange(player, indices)
+
+        if inst is not None:
+            inst.mark("showdown")
         self.showdown()
-        self.logger.log(f"====== KONIEC RUNDY #{round_number} ======")
+        self.logger.log("====== KONIEC RUNDY #%s ======", round_number)
+        self.logger.event("round_end", round=round_number)
+
+
+# --- Strategie graczy ---
+class SeatStrategy(ABC):
+    """Interfejs strategii zajmującej miejsce przy stole."""
+
+    @abstractmethod
+    def decide_action(self, engine: GameEngine, player: Player) -> Tuple[str, int]:
+        """Zwraca akcję ("fold", "check", "call", "bet", "raise") i kwotę."""
+
+    @abstractmethod
+    def decide_exchange(self, engine: GameEngine, player: Player) -> List[int]:
+        """Zwraca indeksy kart w ręce gracza, które mają zostać wymienione."""
+
+
+class ConsoleStrategy(SeatStrategy):
+    """Gracz ludzki podejmujący decyzje z klawiatury."""
+
+    def decide_action(self, engine: GameEngine, player: Player) -> Tuple[str, int]:
+        return engine.prompt_human_action(player)
+
+    def decide_exchange(self, engine: GameEngine, player: Player) -> List[int]:
+        return engine.prompt_human_exchange(player)
+
+
+class BudgetedSeat(SeatStrategy):
+    """Miejsce prowadzone przez ``ViewStrategy`` z limitem czasu na każdą decyzję.
+
+    Strategia dostaje ``TableView`` z terminem ``budget`` sekund od chwili zapytania.
+    Bez ``executor`` działa w wątku silnika; z pulą wątków lub procesów
+    (``concurrent.futures``) silnik czeka na wynik najwyżej do terminu. Odpowiedź,
+    która nie zdążyła przed terminem, zastępuje akcja awaryjna strategii
+    (``fallback_action``/``fallback_exchange``); ``timeouts`` liczy takie decyzje.
+    Z pulą procesów strategia musi dać się serializować (``pickle``).
+    """
+
+    def __init__(self, strategy: ViewStrategy, budget: Optional[float] = None, executor: Optional[Executor] = None):
+        self.strategy = strategy
+        self.budget = budget
+        self.executor = executor
+        self.timeouts = 0
+
+    def decide_action(self, engine: GameEngine, player: Player) -> Tuple[str, int]:
+        view = engine.table_view(player, self._deadline())
+        return self._decide(self.strategy.decide_action, self.strategy.fallback_action, view)
+
+    def decide_exchange(self, engine: GameEngine, player: Player) -> List[int]:
+        view = engine.table_view(player, self._deadline())
+        return self._decide(self.strategy.decide_exchange, self.strategy.fallback_exchange, view)
+
+    def _deadline(self) -> Optional[float]:
+        return time.monotonic() + self.budget if self.budget is not None else None
+
+    def _decide(self, decide: Callable[[TableView], object], fallback: Callable[[TableView], object],
+                view: TableView):
+        if self.executor is None:
+            answer = decide(view)
+            if view.deadline is None or time.monotonic() <= view.deadline:
+                return answer
+        else:
+            future = self.executor.submit(decide, view)
+            try:
+                return future.result(timeout=view.remaining())
+            except FutureTimeoutError:
+                future.cancel()
+        self.timeouts += 1
+        return fallback(view)
+
+
+class RuleBasedBotStrategy(SeatStrategy):
+    """Bot z prostymi regułami opartymi na kategorii układu (``src.logic.bots.RuleBasedBot``).
+
+    Z ``draw_table`` wymiana kart jest odczytywana z tablicy optymalnych wymian;
+    dla rąk spoza tablicy (lub bez niej) bot używa reguł.
+
+    Decyzje reguł są zapamiętywane we wspólnych dla wszystkich botów pamięciach LRU:
+    wymiana - pod kluczem kanonicznym ręki (reguły nie zależą od konkretnych kolorów),
+    akcja - pod kategorią układu i stanem licytacji, bo tylko od nich zależy.
+    """
+    exchange_cache = LRUCache(65536)
+    action_cache = LRUCache(65536)
+    rules = RuleBasedBot()
+
+    def __init__(self, draw_table: Optional[DrawTable] = None):
+        self.draw_table = draw_table
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Dict[str, float]]:
+        return {"exchange": cls.exchange_cache.stats(), "action": cls.action_cache.stats()}
+
+    def decide_action(self, engine: GameEngine, player: Player) -> Tuple[str, int]:
+        key = (category_of(player.hand_strength()), engine.current_bet_to_match_in_round,
+               player.current_bet_in_round, player.stack, engine.big_blind_amount)
+        action = self.action_cache.get(key)
+        if action is None:
+            action = self.rules.decide_action(engine.table_view(player))
+            engine.logger.debug("Bot %s ma %s i decyduje: %s %s.", player.name,
+                                category_name(player.hand_strength()), *action)
+            self.action_cache.put(key, action)
+        else:
+            engine.logger.debug("Bot %s powtarza zapamiętaną decyzję: %s %s.", player.name, *action)
+        return action
+
+    def decide_exchange(self, engine: GameEngine, player: Player) -> List[int]:
+        codes = player.hand_codes()
+        if self.draw_table is not None:
+            indices = self.draw_table.best_discard(codes)
+            if indices is not None:
+                engine.logger.debug("Bot %s wymienia karty wg tablicy: %s", player.name, indices)
+                return indices
+        if len(codes) != 5:
+            return self.rules.decide_exchange(engine.table_view(player))
+
+        canonical, order = canonicalize(codes)
+        key = hand_index(canonical)
+        mask = self.exchange_cache.get(key)
+        if mask is None:
+            discarded = self.rules.decide_exchange(engine.table_view(player))
+            engine.logger.debug("Bot %s ma %s i wymienia karty: %s", player.name,
+                                category_name(player.hand_strength()), discarded)
+            mask = 0
+            for pos, idx in enumerate(order):
+                if idx in discarded:
+                    mask |= 1 << pos
+            self.exchange_cache.put(key, mask)
+            # Ta sama kolejność co przy trafieniu w pamięć - zapis rozdania nie zależy od jej stanu.
+            return sorted(discarded)
+        indices = sorted(order[pos] for pos in range(5) if (mask >> pos) & 1)
+        engine.logger.debug("Bot %s wymienia karty wg zapamiętanej decyzji: %s", player.name, indices)
+        return indices
 
 
 if __name__ == "__main__":
@@ -881,14 +1315,23 @@ if __name__ == "__main__":
 
     game_deck = Deck()
 
+    draw_table = DrawTable.open_default()
+    if draw_table is not None:
+        game_logger.log("Wczytano tablicę wymiany kart: %s", draw_table.path)
+    seat_strategies = [RuleBasedBotStrategy(draw_table) if p.is_bot else ConsoleStrategy() for p in player_list]
+
     engine = GameEngine(
         players=player_list,
         deck=game_deck,
         small_blind=config["small_blind"],
         big_blind=config["big_blind"],
-        logger=game_logger
+        logger=game_logger,
+        strategies=seat_strategies,
+        stats=OpponentStats()
     )
 
+    session_manager = SessionManager()
+    game_id = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     round_num = 0
     while True:
         round_num += 1
@@ -906,6 +1349,8 @@ if __name__ == "__main__":
             break
 
         engine.play_round(round_num)
+        session_manager.append_hand_history(game_id, engine.hand_record(round_num))
+        session_manager.save_stats(game_id, engine.stats.to_dict())
 
         game_logger.log("--- Podsumowanie Stacków po rundzie ---")
         print("\n--- Podsumowanie Stacków ---")
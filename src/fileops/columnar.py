@@ -0,0 +1,184 @@
+"""Kolumnowy zapis historii rozdań do analiz (NumPy ``.npz``).
+
+Rekordy z ``SessionManager.append_hand_history`` (``GameEngine.hand_record``)
+są przepisywane na typowane kolumny w jednym pliku ``.npz``:
+
+    round, dealer, pot               - po jednej wartości na rozdanie
+    stacks, stacks_offsets           - stosy wszystkich miejsc po rozdaniu
+    winner_seat, winner_amount,
+    winners_offsets                  - wygrane (miejsce, kwota)
+    showdown_seat, showdown_category,
+    showdown_offsets                 - kategorie układów odkrytych w showdownie
+
+Pola o zmiennej długości są spłaszczone: wiersze rozdania ``i`` to
+``kolumna[offsets[i]:offsets[i + 1]]``. Dzięki temu agregaty (skuteczność miejsc,
+rozkład puli, częstość kategorii) liczone są redukcjami NumPy zamiast
+parsowania tekstu JSON.
+
+NumPy jest zależnością opcjonalną - bez niego moduł się importuje, ale eksport
+i odczyt zgłaszają ``ImportError``.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m src.fileops.columnar export data/session_<id>.jsonl data/session_<id>.npz
+    python -m src.fileops.columnar stats data/session_<id>.npz
+"""
+import argparse
+from array import array
+from typing import Dict, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - zależne od środowiska
+    np = None
+
+from src.fileops.history_reader import HandHistoryReader
+from src.logic.evaluator import CATEGORY_NAMES
+
+FORMAT_VERSION = 1
+
+# Typy kolumn: nazwa -> (kod typu ``array``, typ NumPy).
+_COLUMNS = {
+    "round": ('q', "int64"),
+    "dealer": ('b', "int8"),
+    "pot": ('q', "int64"),
+    "stacks": ('q', "int64"),
+    "stacks_offsets": ('q', "int64"),
+    "winner_seat": ('b', "int8"),
+    "winner_amount": ('q', "int64"),
+    "winners_offsets": ('q', "int64"),
+    "showdown_seat": ('b', "int8"),
+    "showdown_category": ('b', "int8"),
+    "showdown_offsets": ('q', "int64"),
+}
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Kolumnowa historia rozdań wymaga pakietu numpy.")
+
+
+class HandStore:
+    """Kolumny historii rozdań w pamięci wraz z zapytaniami agregującymi."""
+
+    def __init__(self, columns: Dict[str, "np.ndarray"]):
+        _require_numpy()
+        missing = set(_COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Brak kolumn: {', '.join(sorted(missing))}")
+        self.columns = {name: np.asarray(columns[name], dtype=dtype) for name, (_, dtype) in _COLUMNS.items()}
+
+    def __len__(self) -> int:
+        return len(self.columns["round"])
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> 'HandStore':
+        """Czyta historię JSONL strumieniowo, bez trzymania rekordów w pamięci."""
+        _require_numpy()
+        cols = {name: array(code) for name, (code, _) in _COLUMNS.items()}
+        for name in ("stacks_offsets", "winners_offsets", "showdown_offsets"):
+            cols[name].append(0)
+        with HandHistoryReader(path) as reader:
+            for hand in reader:
+                cols["round"].append(hand["round"])
+                cols["dealer"].append(hand.get("dealer", -1))
+                cols["pot"].append(hand.get("pot", 0))
+                cols["stacks"].extend(hand.get("stacks", ()))
+                cols["stacks_offsets"].append(len(cols["stacks"]))
+                for seat, amount in hand.get("winners", ()):
+                    cols["winner_seat"].append(seat)
+                    cols["winner_amount"].append(amount)
+                cols["winners_offsets"].append(len(cols["winner_seat"]))
+                for seat, category in hand.get("showdown", ()):
+                    cols["showdown_seat"].append(seat)
+                    cols["showdown_category"].append(category)
+                cols["showdown_offsets"].append(len(cols["showdown_seat"]))
+        return cls({name: np.frombuffer(col, dtype=_COLUMNS[name][1]) for name, col in cols.items()})
+
+    @classmethod
+    def load(cls, path: str) -> 'HandStore':
+        _require_numpy()
+        with np.load(path) as data:
+            version = int(data["format_version"])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Nieobsługiwana wersja pliku historii: {version}")
+            return cls({name: data[name] for name in _COLUMNS})
+
+    def save(self, path: str) -> None:
+        np.savez(path, format_version=np.array(FORMAT_VERSION), **self.columns)
+
+    def _hand_of(self, offsets_name: str) -> "np.ndarray":
+        """Numer rozdania dla każdego wiersza spłaszczonej kolumny."""
+        return np.repeat(np.arange(len(self)), np.diff(self.columns[offsets_name]))
+
+    def seats_per_hand(self) -> "np.ndarray":
+        return np.diff(self.columns["stacks_offsets"])
+
+    def win_rate_by_seat(self) -> Dict[int, float]:
+        """Odsetek rozdań, w których miejsce zgarnęło (całą lub część) pulę."""
+        num_seats = int(self.seats_per_hand().max(initial=0))
+        if not num_seats:
+            return {}
+        seats = self.columns["winner_seat"].astype(np.int64)
+        # Dzielona pula to jedna wygrana miejsca, nawet jeśli przypadły mu dwa wpisy.
+        won = np.unique(self._hand_of("winners_offsets") * num_seats + seats) % num_seats
+        wins = np.bincount(won, minlength=num_seats)
+        # Miejsce ``s`` brało udział w rozdaniach, w których było więcej niż ``s`` miejsc.
+        played = np.bincount(self.seats_per_hand(), minlength=num_seats + 1)[::-1].cumsum()[::-1][1:]
+        return {seat: float(wins[seat] / played[seat]) if played[seat] else 0.0 for seat in range(num_seats)}
+
+    def winnings_by_seat(self) -> Dict[int, int]:
+        totals = np.bincount(self.columns["winner_seat"].astype(np.int64), weights=self.columns["winner_amount"])
+        return {seat: int(total) for seat, total in enumerate(totals)}
+
+    def pot_distribution(self, percentiles: Sequence[float] = (25, 50, 75, 90, 99)) -> Dict[str, float]:
+        """Średnia, maksimum i percentyle wielkości puli."""
+        pots = self.columns["pot"]
+        if not len(pots):
+            return {}
+        result = {"mean": float(pots.mean()), "max": float(pots.max())}
+        for p, value in zip(percentiles, np.percentile(pots, percentiles)):
+            result[f"p{p:g}"] = float(value)
+        return result
+
+    def pot_histogram(self, bins: int = 10) -> Tuple["np.ndarray", "np.ndarray"]:
+        return np.histogram(self.columns["pot"], bins=bins)
+
+    def category_frequency(self) -> Dict[str, int]:
+        """Liczba układów każdej kategorii odkrytych w showdownie."""
+        counts = np.bincount(self.columns["showdown_category"].astype(np.int64), minlength=len(CATEGORY_NAMES))
+        return {name: int(count) for name, count in zip(CATEGORY_NAMES, counts)}
+
+
+def export_history(jsonl_path: str, npz_path: str) -> HandStore:
+    """Przepisuje historię JSONL na plik kolumnowy i zwraca wczytane kolumny."""
+    store = HandStore.from_jsonl(jsonl_path)
+    store.save(npz_path)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kolumnowa historia rozdań.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export_parser = sub.add_parser("export", help="przepisz historię JSONL do pliku .npz")
+    export_parser.add_argument("jsonl")
+    export_parser.add_argument("npz")
+    stats_parser = sub.add_parser("stats", help="wypisz podstawowe statystyki z pliku .npz")
+    stats_parser.add_argument("npz")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        store = export_history(args.jsonl, args.npz)
+        print(f"Zapisano {len(store)} rozdań do {args.npz}")
+        return
+    store = HandStore.load(args.npz)
+    print(f"Rozdania: {len(store)}")
+    for seat, rate in store.win_rate_by_seat().items():
+        print(f"  miejsce {seat}: wygrane {rate:.1%}")
+    print("Pula: " + ", ".join(f"{key} {value:.1f}" for key, value in store.pot_distribution().items()))
+    for name, count in store.category_frequency().items():
+        if count:
+            print(f"  {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import mmap
+import os
+import json
+import struct
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class HandHistoryReader:
+    """Leniwy odczyt historii rozdań zapisanej przez ``SessionManager.append_hand_history``.
+
+    Obok pliku ``.jsonl`` utrzymywany jest indeks ``.jsonl.idx``: nagłówek oraz tablica
+    przesunięć (uint64) początku każdego rozdania. ``get_hand(n)`` i ``hands(start, stop)``
+    skaczą przez indeks prosto do danych w pliku zmapowanym w pamięci (mmap), więc nie
+    trzeba czytać pliku od początku ani trzymać go w pamięci. Indeks jest uzupełniany
+    przyrostowo o rozdania dopisane od ostatniego odczytu; jeśli plik historii został
+    podmieniony lub skrócony, jest budowany od nowa.
+
+    Rozdania numerowane są od 0, w kolejności zapisu. Niedokończona ostatnia linia
+    (zapis w toku) jest pomijana do czasu kolejnego ``refresh()``.
+    """
+    MAGIC = b"PHIX"
+    VERSION = 1
+    _HEADER = struct.Struct("<4sB3xQQ")  # magic, wersja, liczba rozdań, zaindeksowane bajty danych
+    _OFFSET = struct.Struct("<Q")
+
+    def __init__(self, file_path: str, index_path: Optional[str] = None):
+        self.file_path = file_path
+        self.index_path = index_path or file_path + ".idx"
+        self._data: Optional[mmap.mmap] = None
+        self._index: Optional[mmap.mmap] = None
+        self._count = 0
+        self._indexed_bytes = 0
+        self.refresh()
+
+    def __enter__(self) -> 'HandHistoryReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.hands()
+
+    def close(self) -> None:
+        for mapping in (self._data, self._index):
+            if mapping is not None:
+                mapping.close()
+        self._data = self._index = None
+
+    def refresh(self) -> None:
+        """Mapuje plik na nowo i dopisuje do indeksu rozdania dodane od ostatniego odczytu."""
+        self.close()
+        size = os.path.getsize(self.file_path)
+        if size:
+            with open(self.file_path, 'rb') as f:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self._read_header(size)
+        if header is None:
+            with open(self.index_path, 'wb') as f:
+                f.write(self._HEADER.pack(self.MAGIC, self.VERSION, 0, 0))
+            header = (0, 0)
+        self._count, self._indexed_bytes = self._extend_index(*header, size)
+        if self._count:
+            with open(self.index_path, 'rb') as f:
+                self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read_header(self, data_size: int) -> Optional[Tuple[int, int]]:
+        """(liczba rozdań, zaindeksowane bajty) z istniejącego indeksu; None, gdy trzeba go zbudować."""
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(self._HEADER.size)
+                if len(header) < self._HEADER.size:
+                    return None
+                magic, version, count, indexed = self._HEADER.unpack(header)
+                if magic != self.MAGIC or version != self.VERSION or indexed > data_size:
+                    return None
+                if os.path.getsize(self.index_path) < self._HEADER.size + count * self._OFFSET.size:
+                    return None
+                if count:
+                    # Zaindeksowana część musi kończyć się znakiem nowej linii, a ostatnie rozdanie
+                    # zaczynać tuż za poprzednim - inaczej plik podmieniono i indeks jest nieaktualny.
+                    f.seek(self._HEADER.size + (count - 1) * self._OFFSET.size)
+                    last = self._OFFSET.unpack(f.read(self._OFFSET.size))[0]
+                    if last >= indexed or self._data[indexed - 1] != ord("\n"):
+                        return None
+                    if last and self._data[last - 1] != ord("\n"):
+                        return None
+                return count, indexed
+        except FileNotFoundError:
+            return None
+
+    def _extend_index(self, count: int, indexed: int, size: int) -> Tuple[int, int]:
+        if self._data is None or indexed >= size:
+            return count, indexed
+        data = self._data
+        offsets = bytearray()
+        new_count = count
+        pos = indexed
+        while pos < size:
+            end = data.find(b"\n", pos)
+            if end < 0:
+                break  # ostatnia linia jeszcze się dopisuje
+            if data[pos:end].strip():
+                offsets += self._OFFSET.pack(pos)
+                new_count += 1
+            pos = end + 1
+        if pos == indexed:
+            return count, indexed
+        with open(self.index_path, 'r+b') as f:
+            f.seek(self._HEADER.size + count * self._OFFSET.size)
+            f.write(offsets)
+            f.flush()
+            os.fsync(f.fileno())
+            # Nagłówek zapisywany na końcu: przerwane uzupełnianie zostawia poprawny, krótszy indeks.
+            f.seek(0)
+            f.write(self._HEADER.pack(self.MAGIC, self.VERSION, new_count, pos))
+        return new_count, pos
+
+    def _offset(self, n: int) -> int:
+        return self._OFFSET.unpack_from(self._index, self._HEADER.size + n * self._OFFSET.size)[0]
+
+    def _load(self, n: int) -> Dict:
+        start = self._offset(n)
+        return json.loads(self._data[start:self._data.find(b"\n", start)])
+
+    def get_hand(self, n: int) -> Dict:
+        """Zwraca ``n``-te rozdanie (od 0; ujemne liczone od końca)."""
+        if n < 0:
+            n += self._count
+        if not 0 <= n < self._count:
+            raise IndexError(f"Brak rozdania o numerze {n} (zapisano {self._count}).")
+        return self._load(n)
+
+    def hands(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+        """Leniwie zwraca kolejne rozdania z zakresu ``[start, stop)``."""
+        stop = self._count if stop is None else min(stop, self._count)
+        for n in range(max(start, 0), stop):
+            yield self._load(n)
@@ -0,0 +1,101 @@
+import atexit
+import threading
+from collections import deque
+from typing import Deque, List
+
+
+class BufferedLogWriter:
+    """Zapisuje linie logu do stale otwartego pliku w paczkach, z osobnego wątku.
+
+    Linie trafiają do ograniczonego bufora w pamięci. Wątek zapisujący opróżnia go,
+    gdy uzbiera się ``batch_size`` linii albo minie ``flush_interval`` sekund.
+    Gdy bufor jest pełny, ``overflow`` decyduje, czy ``write`` czeka na zapis
+    (``"block"``), czy odrzuca linię i zwiększa licznik ``dropped`` (``"drop"``).
+    """
+    BLOCK = "block"
+    DROP = "drop"
+
+    def __init__(self, file_path: str, capacity: int = 8192, batch_size: int = 256,
+                 flush_interval: float = 0.5, overflow: str = BLOCK):
+        if overflow not in (self.BLOCK, self.DROP):
+            raise ValueError(f"Nieznany tryb przepełnienia: {overflow}")
+        if capacity < 1 or batch_size < 1:
+            raise ValueError("Pojemność bufora i rozmiar paczki muszą być dodatnie.")
+        self.file_path = file_path
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.dropped = 0
+
+        self._file = open(file_path, 'a', encoding='utf-8')
+        self._buffer: Deque[str] = deque()
+        self._cond = threading.Condition()
+        self._enqueued = 0
+        self._written = 0
+        self._flush_waiters = 0
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="BufferedLogWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, line: str) -> bool:
+        """Dodaje linię do bufora. Zwraca False, jeśli linia została odrzucona."""
+        with self._cond:
+            if self._closing:
+                raise ValueError("Zapis do zamkniętego logu.")
+            if len(self._buffer) >= self.capacity:
+                if self.overflow == self.DROP:
+                    self.dropped += 1
+                    return False
+                while len(self._buffer) >= self.capacity:
+                    self._cond.notify_all()
+                    self._cond.wait()
+            self._buffer.append(line)
+            self._enqueued += 1
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def flush(self) -> None:
+        """Czeka, aż wszystkie przyjęte linie zostaną zapisane na dysk."""
+        with self._cond:
+            target = self._enqueued
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            while self._written < target and self._thread.is_alive():
+                self._cond.wait()
+            self._flush_waiters -= 1
+
+    def close(self) -> None:
+        """Zapisuje resztę bufora, kończy wątek i zamyka plik. Kolejne wywołania nic nie robią."""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._file.close()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if len(self._buffer) < self.batch_size and not self._flush_waiters and not self._closing:
+                    self._cond.wait(self.flush_interval)
+                batch: List[str] = list(self._buffer)
+                self._buffer.clear()
+                closing = self._closing
+                # Budzimy producentów czekających na miejsce w buforze.
+                self._cond.notify_all()
+            if batch:
+                try:
+                    self._file.write(''.join(batch))
+                    self._file.flush()
+                except IOError as e:
+                    print(f"Błąd zapisu logu: {e}")
+            with self._cond:
+                self._written += len(batch)
+                self._cond.notify_all()
+                if closing and not self._buffer:
+                    return
@@ -1,31 +1,108 @@
 import os
 import json
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional
+
+from src.fileops.history_reader import HandHistoryReader
+
+
+def atomic_write(file_path: str, text: str) -> None:
+    """Zapisuje plik tak, by po awarii zawierał albo starą, albo nową treść - nigdy urwaną.
+
+    Treść trafia do pliku tymczasowego w tym samym katalogu, jest utrwalana (fsync),
+    a następnie podmieniana przez ``os.replace``.
+    """
+    tmp_path = file_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+    _fsync_dir(os.path.dirname(file_path) or '.')
+
+
+def _fsync_dir(dir_path: str) -> None:
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return  # np. Windows - katalogów nie da się otworzyć do fsync
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _JournalState:
+    """Co z danej sesji jest już utrwalone w trybie przyrostowym."""
+
+    def __init__(self):
+        self.seq = 0
+        self.history_len = 0
+        self.history_bytes = 0
+        self.bets: List = []
+        self.fields: Dict[str, str] = {}  # pole -> ostatnio zapisany JSON
+        self.saves_since_snapshot = 0
 
 
 class SessionManager:
-    def __init__(self, data_dir: str = 'data'):
+    """Zapis i odczyt sesji gry.
+
+    Domyślnie każdy zapis to pełny plik ``session_<id>.json``, podmieniany atomowo.
+
+    Z ``incremental=True`` koszt zapisu nie rośnie z długością gry:
+      - ``session_<id>.history.jsonl`` - wpisy ``history``, tylko dopisywane;
+      - ``session_<id>.journal.jsonl`` - po jednej linii na zapis: nowe wpisy ``bets``
+        i pola stanu, które zmieniły się od poprzedniego zapisu;
+      - ``session_<id>.snapshot.json`` - zwarty stan bez historii, zapisywany atomowo
+        co ``snapshot_every`` zapisów; po nim dziennik zaczyna się od nowa.
+    Każda linia dziennika jest utrwalana (fsync) przed powrotem z ``save_session``.
+    ``load_session`` odtwarza stan ze snapshotu i dalszej części dziennika, pomijając
+    ewentualnie urwaną ostatnią linię.
+
+    Statystyki graczy (``src.logic.opponent_stats``) zapisuje się osobno do
+    ``session_<id>.stats.json`` przez ``save_stats``/``load_stats``.
+    """
+
+    def __init__(self, data_dir: str = 'data', incremental: bool = False, snapshot_every: int = 100):
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every musi być dodatnie.")
         self.data_dir = data_dir
+        self.incremental = incremental
+        self.snapshot_every = snapshot_every
+        self._journals: Dict[str, _JournalState] = {}
         os.makedirs(data_dir, exist_ok=True)
 
+    def _path(self, game_id: str, suffix: str) -> str:
+        return os.path.join(self.data_dir, f'session_{game_id}{suffix}')
+
     def save_session(self, session: Dict) -> None:
         """Zapisuje stan gry i historię zakończonych rozdań do pliku."""
         game_id = session.get("game_id")
         if not game_id:
             raise ValueError("Brak game_id w danych sesji.")
-        file_path = os.path.join(self.data_dir, f'session_{game_id}.json')
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(session, f, indent=4, ensure_ascii=False)
+            if self.incremental:
+                self._save_incremental(game_id, session)
+            else:
+                atomic_write(self._path(game_id, '.json'), json.dumps(session, indent=4, ensure_ascii=False))
         except IOError as e:
             print(f"Błąd zapisu sesji: {e}")
 
     def load_session(self, game_id: str) -> Dict:
         """Ładuje sesję gry z pliku i zwraca strukturę pozwalającą na kontynuację rozgrywki."""
-        file_path = os.path.join(self.data_dir, f'session_{game_id}.json')
+        if os.path.exists(self._path(game_id, '.snapshot.json')):
+            try:
+                session, state = self._load_incremental(game_id)
+            except (IOError, ValueError) as e:
+                print(f"Błąd odczytu sesji: {e}")
+                return {}
+            self._journals[game_id] = state
+            return session
 
+        file_path = self._path(game_id, '.json')
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
@@ -36,6 +113,160 @@ class SessionManager:
             print(f"Błąd odczytu sesji: {e}")
             return {}
 
+    # --- Tryb przyrostowy ---
+
+    def _save_incremental(self, game_id: str, session: Dict) -> None:
+        state = self._journals.get(game_id)
+        if state is None:
+            if os.path.exists(self._path(game_id, '.snapshot.json')):
+                _, state = self._load_incremental(game_id)
+            else:
+                state = self._start_journal(game_id)
+            self._journals[game_id] = state
+
+        history = session.get("history", [])
+        if len(history) < state.history_len:
+            # Historia została skrócona - zapisujemy ją od nowa (rzadki, kosztowny przypadek).
+            state.history_len = state.history_bytes = 0
+        self._append_history(game_id, state, history)
+
+        bets = session.get("bets", [])
+        record: Dict = {"seq": state.seq + 1, "history_len": state.history_len,
+                        "history_bytes": state.history_bytes}
+        if len(bets) >= len(state.bets) and bets[:len(state.bets)] == state.bets:
+            new_bets = bets[len(state.bets):]
+        else:
+            new_bets = bets
+            record["bets_reset"] = True
+        if new_bets:
+            record["bets"] = new_bets
+        changed = {}
+        for key, value in session.items():
+            if key in ("history", "bets"):
+                continue
+            encoded = json.dumps(value, ensure_ascii=False, sort_keys=True)
+            if state.fields.get(key) != encoded:
+                changed[key] = value
+                state.fields[key] = encoded
+        removed = [key for key in state.fields if key not in session]
+        for key in removed:
+            del state.fields[key]
+        if changed:
+            record["state"] = changed
+        if removed:
+            record["removed"] = removed
+
+        with open(self._path(game_id, '.journal.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        state.seq += 1
+        state.bets = list(bets)
+        state.saves_since_snapshot += 1
+        if state.saves_since_snapshot >= self.snapshot_every:
+            self._write_snapshot(game_id, session, state)
+
+    def _start_journal(self, game_id: str) -> _JournalState:
+        state = _JournalState()
+        for suffix in ('.history.jsonl', '.journal.jsonl'):
+            open(self._path(game_id, suffix), 'w').close()
+        self._write_snapshot(game_id, {"game_id": game_id}, state)
+        return state
+
+    def _append_history(self, game_id: str, state: _JournalState, history: List) -> None:
+        path = self._path(game_id, '.history.jsonl')
+        mode = 'r+b' if os.path.exists(path) else 'wb'
+        with open(path, mode) as f:
+            # Wszystko za ostatnim potwierdzonym wpisem to pozostałość po przerwanym zapisie.
+            f.truncate(state.history_bytes)
+            f.seek(state.history_bytes)
+            if len(history) > state.history_len:
+                data = ''.join(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+                               for entry in history[state.history_len:]).encode('utf-8')
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                state.history_bytes += len(data)
+                state.history_len = len(history)
+
+    def _write_snapshot(self, game_id: str, session: Dict, state: _JournalState) -> None:
+        snapshot = {key: value for key, value in session.items() if key != "history"}
+        snapshot["_journal"] = {"seq": state.seq, "history_len": state.history_len,
+                                "history_bytes": state.history_bytes}
+        atomic_write(self._path(game_id, '.snapshot.json'),
+                     json.dumps(snapshot, ensure_ascii=False, separators=(',', ':')))
+        # Linie dziennika sprzed snapshotu są już zbędne; gdyby obcięcie nie doszło do skutku,
+        # przy odczycie i tak zostaną pominięte dzięki numerom ``seq``.
+        open(self._path(game_id, '.journal.jsonl'), 'w').close()
+        state.saves_since_snapshot = 0
+
+    def _load_incremental(self, game_id: str):
+        with open(self._path(game_id, '.snapshot.json'), 'r', encoding='utf-8') as f:
+            session = json.load(f)
+        meta = session.pop("_journal")
+        state = _JournalState()
+        state.seq, state.history_len, state.history_bytes = meta["seq"], meta["history_len"], meta["history_bytes"]
+
+        journal_path = self._path(game_id, '.journal.jsonl')
+        if os.path.exists(journal_path):
+            with open(journal_path, 'rb') as f:
+                valid_bytes = 0
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # urwana linia z przerwanego zapisu
+                    valid_bytes += len(line)
+                    if record["seq"] <= state.seq:
+                        continue
+                    self._apply_record(session, record)
+                    state.seq = record["seq"]
+                    state.history_len, state.history_bytes = record["history_len"], record["history_bytes"]
+                    state.saves_since_snapshot += 1
+            if valid_bytes != os.path.getsize(journal_path):
+                with open(journal_path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+
+        history: List = []
+        history_path = self._path(game_id, '.history.jsonl')
+        if state.history_len:
+            with open(history_path, 'rb') as f:
+                data = f.read(state.history_bytes)
+            history = [json.loads(line) for line in data.splitlines()]
+        session["history"] = history
+        session.setdefault("bets", [])
+        state.bets = list(session["bets"])
+        state.fields = {key: json.dumps(value, ensure_ascii=False, sort_keys=True)
+                        for key, value in session.items() if key not in ("history", "bets")}
+        return session, state
+
+    @staticmethod
+    def _apply_record(session: Dict, record: Dict) -> None:
+        if record.get("bets_reset"):
+            session["bets"] = []
+        session.setdefault("bets", []).extend(record.get("bets", ()))
+        session.update(record.get("state", {}))
+        for key in record.get("removed", ()):
+            session.pop(key, None)
+
+    def save_stats(self, game_id: str, stats: Dict) -> None:
+        """Zapisuje atomowo statystyki graczy (``OpponentStats.to_dict``) obok sesji gry."""
+        try:
+            atomic_write(self._path(game_id, '.stats.json'), json.dumps(stats, ensure_ascii=False))
+        except IOError as e:
+            print(f"Błąd zapisu statystyk: {e}")
+
+    def load_stats(self, game_id: str) -> Dict:
+        """Statystyki graczy zapisane przez ``save_stats``; pusty słownik, gdy ich brak."""
+        try:
+            with open(self._path(game_id, '.stats.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (IOError, ValueError) as e:
+            print(f"Błąd odczytu statystyk: {e}")
+            return {}
+
     def append_hand_history(self, game_id: str, hand_data: dict) -> None:
         """Dodaje zakończone rozdanie do historii jako JSON Lines."""
         file_path = os.path.join(self.data_dir, f'session_{game_id}.jsonl')
@@ -46,3 +277,7 @@ class SessionManager:
                 f.write('\n')
         except IOError as e:
             print(f"Błąd zapisu historii rozdania: {e}")
+
+    def read_hand_history(self, game_id: str) -> HandHistoryReader:
+        """Otwiera historię rozdań z ``append_hand_history`` do leniwego, indeksowanego odczytu."""
+        return HandHistoryReader(os.path.join(self.data_dir, f'session_{game_id}.jsonl'))
@@ -0,0 +1,80 @@
+"""Wektorowa ocena wielu rąk naraz (NumPy).
+
+Działa na tych samych tablicach co ``src.logic.evaluator`` i zwraca identyczne
+siły układów, ale bez pętli Pythona po rękach: maska rang i test koloru indeksują
+tablice koloru i rang unikalnych, a ręce z powtórzoną rangą są wyszukiwane
+binarnie (``searchsorted``) po posortowanych iloczynach liczb pierwszych.
+
+NumPy jest zależnością opcjonalną - bez niego moduł się importuje, ale
+``evaluate_array`` zgłasza ``ImportError``.
+"""
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - zależne od środowiska
+    np = None
+
+from src.logic.cards import RANK_INDEX, SUIT_INDEX
+from src.logic.evaluator import CARD_PRIME, CATEGORY_SHIFT, FLUSH_TABLE, PAIRED_TABLE, UNIQUE_TABLE
+
+_tables = None
+
+
+def _get_tables():
+    global _tables
+    if _tables is None:
+        if np is None:
+            raise ImportError("Wektorowa ocena rąk wymaga pakietu numpy.")
+        paired_keys = np.array(sorted(PAIRED_TABLE), dtype=np.int64)
+        _tables = {
+            "rank_bit": np.array([1 << RANK_INDEX[code] for code in range(len(RANK_INDEX))], dtype=np.int32),
+            "suit": np.array(SUIT_INDEX, dtype=np.int8),
+            "prime": np.array(CARD_PRIME, dtype=np.int64),
+            "flush": np.array(FLUSH_TABLE, dtype=np.int32),
+            "unique": np.array(UNIQUE_TABLE, dtype=np.int32),
+            "paired_keys": paired_keys,
+            "paired_values": np.array([PAIRED_TABLE[int(key)] for key in paired_keys], dtype=np.int32),
+        }
+    return _tables
+
+
+def warm_up() -> None:
+    """Buduje tablice z wyprzedzeniem, żeby pierwsza ocena z limitem czasu nie płaciła za ich budowę.
+
+    Przydatne np. jako ``initializer`` puli procesów; bez NumPy nic nie robi.
+    """
+    if np is not None:
+        _get_tables()
+
+
+def evaluate_array(codes: Any) -> Any:
+    """Siły układów dla tablicy ``(N, 5)`` kodów kart 0..51; zwraca tablicę ``(N,)`` int32.
+
+    Wartości są równe ``evaluate5`` dla każdego wiersza, więc można je porównywać
+    z siłami liczonymi pojedynczo (m.in. ``Player.hand_strength``).
+    """
+    t = _get_tables()
+    codes = np.asarray(codes)
+    if codes.ndim != 2 or codes.shape[1] != 5:
+        raise ValueError(f"Oczekiwano tablicy o kształcie (N, 5), otrzymano {codes.shape}.")
+    if codes.size and (codes.min() < 0 or codes.max() >= len(t["suit"])):
+        raise ValueError("Kody kart muszą należeć do zakresu 0..51.")
+
+    mask = np.bitwise_or.reduce(t["rank_bit"][codes], axis=1)
+    suits = t["suit"][codes]
+    is_flush = (suits == suits[:, :1]).all(axis=1)
+    strength = np.where(is_flush, t["flush"][mask], t["unique"][mask])
+
+    paired = strength == 0
+    if paired.any():
+        products = t["prime"][codes[paired]].prod(axis=1)
+        strength[paired] = t["paired_values"][np.searchsorted(t["paired_keys"], products)]
+    return strength
+
+
+def categories_of(strengths: Any) -> Any:
+    """Kategorie układów (indeksy w ``CATEGORY_NAMES``) dla tablicy sił."""
+    if np is None:
+        raise ImportError("Wektorowa ocena rąk wymaga pakietu numpy.")
+    return np.asarray(strengths) >> CATEGORY_SHIFT
@@ -0,0 +1,161 @@
+"""Runda licytacji jako maszyna stanów sterowana pojedynczymi akcjami.
+
+``BettingRound`` prowadzi jawną kolejkę miejsc do akcji, ostatniego agresora oraz
+liczniki graczy w grze, graczy all-in i graczy, którzy muszą jeszcze wyrównać.
+Liczniki są aktualizowane przyrostowo przy każdej akcji, a kolejka jest budowana
+od nowa tylko po zakładzie/przebiciu i po pełnym okrążeniu, więc zwykła akcja
+(pas, czekanie, sprawdzenie) kosztuje O(1), a agresja O(liczba graczy).
+
+Runda działa bezpośrednio na kolumnach stanu stołu (``src.logic.table_state.TableState``):
+``stack``, ``bet`` i ``folded`` indeksowanych numerem miejsca oraz ``pay(seat, amount)``,
+bez pobierania atrybutów obiektów graczy.
+Kolejność akcji i przepływ żetonów odpowiadają dotychczasowej pętli
+``GameEngine._betting_round`` (patrz ``tests/data/betting_corpus.json``).
+"""
+from typing import List, Optional, Tuple
+
+FOLD, CHECK, CALL, BET, RAISE = "fold", "check", "call", "bet", "raise"
+
+# Powody zakończenia rundy (``BettingRound.end_reason``).
+NO_PLAYERS = "no_players"
+ONE_LEFT = "one_left"
+SETTLED = "settled"  # nikt w kolejce nie może już działać (wszyscy wyrównali, są all-in lub spasowali)
+ORBIT_COMPLETE = "orbit_complete"
+QUEUE_EMPTY = "queue_empty"
+
+
+class BettingRound:
+    """Stan jednej rundy licytacji.
+
+    Użycie: ``next_to_act()`` zwraca miejsce gracza, który ma podjąć decyzję
+    (lub None po zakończeniu rundy), a ``apply_action(action, amount)`` wykonuje
+    ją i przesuwa kolejkę. Kwota w ``bet``/``raise`` to łączny zakład gracza w rundzie.
+    """
+
+    def __init__(self, state, start_idx: int, bet_to_match: int, pot: int = 0):
+        self.state = state
+        self._stack, self._bet, self._folded = state.stack, state.bet, state.folded
+        self.bet_to_match = bet_to_match
+        self.pot = pot
+        self.last_aggressor: Optional[int] = None
+        self.end_reason: Optional[str] = None
+        self.active_count = self._folded.count(0)
+        self.all_in_count = 0
+        for folded, stack in zip(self._folded, self._stack):
+            if stack == 0 and not folded:
+                self.all_in_count += 1
+        self._unmatched = self._count_unmatched()
+        self._queue: List[int] = []
+        self._pos = 0
+        self._live_in_queue = 0
+        self._rebuild_queue(start_idx, include_start=True)
+        if not self._queue:
+            self.end_reason = NO_PLAYERS
+
+    @property
+    def finished(self) -> bool:
+        return self.end_reason is not None
+
+    @property
+    def queue(self) -> Tuple[int, ...]:
+        """Miejsca pozostałe w bieżącym okrążeniu kolejki (łącznie z tymi, które zostaną pominięte)."""
+        return tuple(self._queue[self._pos:])
+
+    def _rebuild_queue(self, start_idx: int, include_start: bool) -> None:
+        folded, stack = self._folded, self._stack
+        n = len(stack)
+        first = start_idx if include_start else start_idx + 1
+        queue = []
+        live = 0
+        for offset in range(n if include_start else n - 1):
+            seat = (first + offset) % n
+            if not folded[seat]:
+                queue.append(seat)
+                if stack[seat] > 0:
+                    live += 1
+        self._queue = queue
+        self._pos = 0
+        self._live_in_queue = live
+
+    def _count_unmatched(self) -> int:
+        """Gracze w grze z żetonami, których zakład jest niższy niż stawka."""
+        bet_to_match = self.bet_to_match
+        return sum(1 for folded, stack, bet in zip(self._folded, self._stack, self._bet)
+                   if not folded and stack > 0 and bet < bet_to_match)
+
+    def _needs_to_match(self, seat: int) -> bool:
+        return not self._folded[seat] and self._stack[seat] > 0 and self._bet[seat] < self.bet_to_match
+
+    def next_to_act(self) -> Optional[int]:
+        """Miejsce następnego gracza do decyzji albo None, gdy licytacja się zakończyła."""
+        folded, stack = self._folded, self._stack
+        while self.end_reason is None:
+            if self.active_count <= 1:
+                self.end_reason = ONE_LEFT
+                break
+            if self._live_in_queue == 0:
+                self.end_reason = SETTLED
+                break
+            if self._pos >= len(self._queue):
+                if self._unmatched == 0:
+                    self.end_reason = ORBIT_COMPLETE
+                    break
+                # Ktoś nadal musi wyrównać: kolejne okrążenie od tego samego miejsca.
+                self._rebuild_queue(self._queue[0], include_start=True)
+                if not self._queue:
+                    self.end_reason = QUEUE_EMPTY
+                    break
+            seat = self._queue[self._pos]
+            if folded[seat] or stack[seat] == 0:
+                self._pos += 1
+                continue
+            return seat
+        return None
+
+    def apply_action(self, action: str, amount: int = 0) -> Tuple[str, int]:
+        """Wykonuje akcję gracza zwróconego przez ``next_to_act``.
+
+        Zwraca faktycznie wykonaną akcję (zakład, który nie podnosi stawki - także
+        all-in za mniej niż stawka - staje się sprawdzeniem lub czekaniem) oraz liczbę żetonów dołożonych do puli.
+        """
+        if self.end_reason is not None or self._pos >= len(self._queue):
+            raise RuntimeError("Brak gracza oczekującego na akcję w tej rundzie licytacji.")
+        seat = self._queue[self._pos]
+        stack, bet = self._stack, self._bet
+        if action in (BET, RAISE) and (amount <= self.bet_to_match or bet[seat] + stack[seat] <= self.bet_to_match):
+            # Zakład, który nie podnosi stawki (także all-in za mniej niż stawka), nie obniża jej
+            # ani nie wznawia licytacji - bez tego kolejka resetowałaby się i licytacja mogła się nie kończyć.
+            action = CALL if bet[seat] < self.bet_to_match else CHECK
+
+        was_unmatched = self._needs_to_match(seat)
+        paid = 0
+        if action == FOLD:
+            self._folded[seat] = True
+            self.active_count -= 1
+            self._live_in_queue -= 1  # gracz przy głosie zawsze ma żetony
+            if was_unmatched:
+                self._unmatched -= 1
+        elif action == CALL:
+            paid = self.state.pay(seat, self.bet_to_match - bet[seat])
+            bet[seat] += paid
+            self.pot += paid
+            if stack[seat] == 0:
+                self._live_in_queue -= 1
+                self.all_in_count += 1
+            self._unmatched += self._needs_to_match(seat) - was_unmatched
+        elif action in (BET, RAISE):
+            paid = self.state.pay(seat, amount - bet[seat])
+            bet[seat] += paid
+            self.pot += paid
+            self.bet_to_match = bet[seat]
+            self.last_aggressor = seat
+            if stack[seat] == 0:
+                self.all_in_count += 1
+            self._unmatched = self._count_unmatched()
+            # Po agresji do akcji wracają wszyscy pozostali w grze, zaczynając od następnego miejsca.
+            self._rebuild_queue(seat, include_start=False)
+            if not self._queue:
+                self.end_reason = QUEUE_EMPTY
+            return action, paid
+        self._pos += 1
+        return action, paid
@@ -0,0 +1,84 @@
+"""Strategie botów działające na ``TableView``.
+
+``RuleBasedBot`` to reguły dotychczasowego bota silnika (kategoria układu
+i stan licytacji). ``EquityBot`` licytuje według equity ręki
+(``src.logic.equity``) liczonej w czasie pozostałym do terminu decyzji -
+nadaje się do uruchamiania w puli wątków lub procesów (``main.BudgetedSeat``).
+"""
+from typing import List, Optional, Tuple
+
+from src.logic.batch_eval import warm_up
+from src.logic.equity import hand_equity
+from src.logic.evaluator import PAIR, THREE_OF_A_KIND, TWO_PAIR, category_of
+from src.logic.table_view import TableView, ViewStrategy
+
+HAND_SIZE = 5
+
+
+class RuleBasedBot(ViewStrategy):
+    """Proste reguły oparte na kategorii układu."""
+
+    def decide_action(self, view: TableView) -> Tuple[str, int]:
+        to_call, stack, big_blind = view.to_call, view.stack, view.big_blind
+        category = category_of(view.strength)
+        if to_call <= 0:
+            if category >= PAIR:
+                bet_amount = min(big_blind * 2, stack)
+                if bet_amount > 0:
+                    return ("bet", bet_amount)
+            return ("check", 0)
+        if category >= TWO_PAIR and stack > to_call + big_blind:
+            return ("raise", view.bet_to_match + big_blind)
+        if category >= PAIR and to_call <= stack / 4:
+            return ("call", 0)
+        if category < PAIR or to_call > stack / 3:
+            return ("fold", 0)
+        # Ostateczność: para i zakład między 1/4 a 1/3 stosu.
+        return ("call", 0) if to_call <= stack else ("fold", 0)
+
+    def decide_exchange(self, view: TableView) -> List[int]:
+        hand = view.hand
+        category = category_of(view.strength)
+        if len(hand) != HAND_SIZE or category >= THREE_OF_A_KIND:
+            return []
+        ranks = [code % 13 for code in hand]
+        if category == TWO_PAIR:
+            # Wymiana kickera.
+            return [next(i for i, rank in enumerate(ranks) if ranks.count(rank) == 1)]
+        if category == PAIR:
+            return [i for i, rank in enumerate(ranks) if ranks.count(rank) == 1]
+        # Wysoka karta: trzy najniższe karty.
+        return sorted(sorted(range(HAND_SIZE), key=ranks.__getitem__)[:3])
+
+
+class EquityBot(RuleBasedBot):
+    """Licytacja według equity ręki i szans z puli; wymiana kart jak w ``RuleBasedBot``.
+
+    Equity liczone jest w ``time_share`` czasu pozostałego do terminu decyzji
+    (bez terminu - w ramach ``samples`` próbek).
+    """
+
+    def __init__(self, samples: int = 2000, time_share: float = 0.8, seed: Optional[int] = None):
+        self.samples = samples
+        self.time_share = time_share
+        self.seed = seed
+        warm_up()
+
+    def equity(self, view: TableView) -> float:
+        remaining = view.remaining()
+        budget = None if remaining is None else remaining * self.time_share
+        return hand_equity(view.hand, max(1, view.opponents_in_hand), samples=self.samples, time_budget=budget,
+                           seed=self.seed).equity
+
+    def decide_action(self, view: TableView) -> Tuple[str, int]:
+        if len(view.hand) != HAND_SIZE:
+            return self.fallback_action(view)
+        equity = self.equity(view)
+        to_call, stack, big_blind = view.to_call, view.stack, view.big_blind
+        if equity > 0.75 and stack > to_call + big_blind:
+            action = "bet" if to_call == 0 else "raise"
+            return (action, view.bet_to_match + min(stack - to_call, max(big_blind, view.pot // 2)))
+        if to_call == 0:
+            return ("check", 0)
+        # Sprawdzenie opłaca się, gdy equity przewyższa udział dopłaty w puli po sprawdzeniu.
+        return ("call", 0) if equity >= to_call / (view.pot + to_call) else ("fold", 0)
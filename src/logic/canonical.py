@@ -0,0 +1,41 @@
+"""Kanonizacja rąk względem izomorfizmu kolorów.
+
+Dwie ręce różniące się tylko permutacją kolorów mają tę samą wartość, więc
+kolory przenumerowuje się w ustalonej kolejności (wg maski rang w danym kolorze),
+a karty sortuje. Z 2 598 960 rąk pięciokartowych zostaje 134 459 klas.
+"""
+from math import comb
+from typing import List, Sequence, Tuple
+
+from src.logic.cards import NUM_CARDS, RANK_INDEX, SUIT_INDEX
+
+# _COLEX[k][c] = C(c, k + 1) - składniki indeksu kombinatorycznego.
+_COLEX = [[comb(c, k + 1) for c in range(NUM_CARDS)] for k in range(5)]
+
+
+def canonicalize(codes: Sequence[int]) -> Tuple[Tuple[int, ...], List[int]]:
+    """Zwraca kanoniczną rękę (posortowane kody) oraz permutację pozycji.
+
+    ``order[i]`` to indeks w ``codes`` karty, która w ręce kanonicznej stoi na pozycji ``i``.
+    """
+    suit_masks = [0, 0, 0, 0]
+    for code in codes:
+        suit_masks[SUIT_INDEX[code]] |= 1 << RANK_INDEX[code]
+    # Kolory z "większą" maską rang dostają niższe numery; kolory o równych maskach są wymienne.
+    suit_order = sorted(range(4), key=lambda s: suit_masks[s], reverse=True)
+    new_suit = [0, 0, 0, 0]
+    for new_idx, suit in enumerate(suit_order):
+        new_suit[suit] = new_idx
+    relabelled = sorted((new_suit[SUIT_INDEX[code]] * 13 + RANK_INDEX[code], idx) for idx, code in enumerate(codes))
+    return tuple(code for code, _ in relabelled), [idx for _, idx in relabelled]
+
+
+def hand_index(sorted_codes: Sequence[int]) -> int:
+    """Indeks colex ręki o rosnąco posortowanych kodach, z zakresu 0..C(52,5)-1."""
+    a, b, c, d, e = sorted_codes
+    return _COLEX[0][a] + _COLEX[1][b] + _COLEX[2][c] + _COLEX[3][d] + _COLEX[4][e]
+
+
+def canonical_key(codes: Sequence[int]) -> int:
+    """Liczba całkowita wspólna dla wszystkich rąk z tej samej klasy izomorfizmu kolorów."""
+    return hand_index(canonicalize(codes)[0])
@@ -0,0 +1,35 @@
+"""Zwarta reprezentacja kart jako liczb całkowitych 0..51.
+
+Kod karty to ``indeks_koloru * 13 + indeks_rangi``, więc kolejne kody
+odpowiadają kolejności kart w nowej, nieprzetasowanej talii. Wszystkie
+właściwości karty są odczytywane z tablic wyliczonych raz przy imporcie.
+"""
+from typing import Tuple
+
+RANKS: Tuple[str, ...] = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS: Tuple[str, ...] = ('s', 'h', 'd', 'c')
+NUM_CARDS = len(RANKS) * len(SUITS)
+
+_RANK_INDEX = {rank: idx for idx, rank in enumerate(RANKS)}
+_SUIT_INDEX = {suit: idx for idx, suit in enumerate(SUITS)}
+
+# Tablice indeksowane kodem karty.
+RANK_INDEX: Tuple[int, ...] = tuple(code % 13 for code in range(NUM_CARDS))
+RANK_VALUE: Tuple[int, ...] = tuple(idx + 2 for idx in RANK_INDEX)
+RANK_STR: Tuple[str, ...] = tuple(RANKS[idx] for idx in RANK_INDEX)
+SUIT_INDEX: Tuple[int, ...] = tuple(code // 13 for code in range(NUM_CARDS))
+SUIT_STR: Tuple[str, ...] = tuple(SUITS[idx] for idx in SUIT_INDEX)
+RANK_BIT: Tuple[int, ...] = tuple(1 << idx for idx in RANK_INDEX)
+
+
+def encode(rank: str, suit: str) -> int:
+    """Zwraca kod karty o podanej randze (np. '10', 'K') i kolorze ('s', 'h', 'd', 'c')."""
+    try:
+        return _SUIT_INDEX[suit] * 13 + _RANK_INDEX[rank]
+    except KeyError:
+        raise ValueError(f"Niepoprawna karta: {rank}{suit}") from None
+
+
+def decode(code: int) -> Tuple[str, str]:
+    """Zwraca krotkę (ranga, kolor) dla kodu karty."""
+    return RANK_STR[code], SUIT_STR[code]
@@ -0,0 +1,197 @@
+"""Tablica optymalnej wymiany kart dla botów, generowana offline.
+
+Dla każdej klasy rąk (po kanonizacji kolorów) zapisywany jest jeden bajt:
+maska 5 bitów wskazująca karty ręki kanonicznej do wymiany, która daje największą
+oczekiwaną wartość ręki końcowej. Wartością ręki jest jej percentyl wśród wszystkich
+2 598 960 rąk. Bajty leżą pod indeksem kombinatorycznym (colex) ręki kanonicznej,
+więc odczyt to kanonizacja i jeden dostęp do pliku zmapowanego w pamięci.
+
+Generowanie (wsadowo, w wielu procesach):
+    python -m src.logic.draw_table --out data/draw_table.bin --samples 64 --workers 8
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.logic.canonical import canonicalize, hand_index
+from src.logic.cards import NUM_CARDS
+from src.logic.evaluator import FLUSH_TABLE, PAIRED_TABLE, PRIMES, UNIQUE_TABLE, evaluate5
+
+MAGIC = b"PDRW"
+VERSION = 1
+_HEADER = struct.Struct("<4sB3xI")  # magic, wersja, liczba zapisanych klas
+NO_ENTRY = 0xFF
+NUM_HANDS = comb(NUM_CARDS, 5)
+DEFAULT_PATH = os.path.join("data", "draw_table.bin")
+
+@lru_cache(maxsize=None)
+def strength_percentiles() -> Dict[int, float]:
+    """Dla każdej siły układu: odsetek rąk słabszych (remisy liczone w połowie)."""
+    counts: Dict[int, int] = {}
+    for mask, strength in enumerate(FLUSH_TABLE):
+        if strength:
+            counts[strength] = counts.get(strength, 0) + 4
+            unique = UNIQUE_TABLE[mask]
+            counts[unique] = counts.get(unique, 0) + 4 ** 5 - 4
+    for product, strength in PAIRED_TABLE.items():
+        suit_choices = 1
+        for prime in PRIMES:
+            multiplicity = 0
+            while product % prime == 0:
+                product //= prime
+                multiplicity += 1
+            suit_choices *= comb(4, multiplicity)
+        counts[strength] = counts.get(strength, 0) + suit_choices
+
+    total = sum(counts.values())
+    percentiles: Dict[int, float] = {}
+    below = 0
+    for strength in sorted(counts):
+        percentiles[strength] = (below + counts[strength] / 2) / total
+        below += counts[strength]
+    return percentiles
+
+
+def discard_values(codes: Sequence[int], samples: int, rng: random.Random,
+                   exact_max_draw: int = 1) -> List[float]:
+    """Oczekiwany percentyl ręki końcowej dla każdej z 32 masek wymiany.
+
+    Dobór do ``exact_max_draw`` kart jest przeliczany dokładnie, większe - na ``samples``
+    losowych dobraniach, wspólnych dla wszystkich masek o tej samej liczbie kart.
+    """
+    pct = strength_percentiles()
+    used = set(codes)
+    remaining = [c for c in range(NUM_CARDS) if c not in used]
+    draws_by_size: Dict[int, List[Tuple[int, ...]]] = {}
+    for k in range(1, 6):
+        if k <= exact_max_draw:
+            draws_by_size[k] = list(combinations(remaining, k))
+        else:
+            draws_by_size[k] = [tuple(rng.sample(remaining, k)) for _ in range(samples)]
+
+    values = [0.0] * 32
+    for mask in range(32):
+        keep = tuple(codes[i] for i in range(5) if not (mask >> i) & 1)
+        if len(keep) == 5:
+            values[mask] = pct[evaluate5(*keep)]
+            continue
+        draws = draws_by_size[5 - len(keep)]
+        total = 0.0
+        for drawn in draws:
+            total += pct[evaluate5(*keep, *drawn)]
+        values[mask] = total / len(draws)
+    return values
+
+
+def best_discard_mask(codes: Sequence[int], samples: int, rng: random.Random, exact_max_draw: int = 1) -> int:
+    """Maska wymiany o najwyższej wartości; przy remisie wygrywa wymiana mniejszej liczby kart."""
+    values = discard_values(codes, samples, rng, exact_max_draw)
+    return max(range(32), key=lambda mask: (values[mask], -bin(mask).count("1"), -mask))
+
+
+def canonical_classes(limit: Optional[int] = None) -> List[Tuple[int, ...]]:
+    """Ręce kanoniczne wszystkich klas (lub pierwszych ``limit`` napotkanych)."""
+    seen = set()
+    classes = []
+    for hand in combinations(range(NUM_CARDS), 5):
+        canonical, _ = canonicalize(hand)
+        if canonical not in seen:
+            seen.add(canonical)
+            classes.append(canonical)
+            if limit is not None and len(classes) >= limit:
+                break
+    return classes
+
+
+def _solve_chunk(classes: Sequence[Tuple[int, ...]], samples: int, exact_max_draw: int,
+                 seed: int) -> List[Tuple[int, int]]:
+    solved = []
+    for canonical in classes:
+        index = hand_index(canonical)
+        # Ziarno zależy tylko od klasy, więc wynik nie zależy od podziału na procesy.
+        rng = random.Random(seed * NUM_HANDS + index)
+        solved.append((index, best_discard_mask(canonical, samples, rng, exact_max_draw)))
+    return solved
+
+
+def build_table(path: str, samples: int = 64, exact_max_draw: int = 1, workers: Optional[int] = None,
+                seed: int = 0, limit: Optional[int] = None, chunk_size: int = 512) -> int:
+    """Generuje tablicę i zapisuje ją do ``path``. Zwraca liczbę rozwiązanych klas."""
+    classes = canonical_classes(limit)
+    chunks = [classes[i:i + chunk_size] for i in range(0, len(classes), chunk_size)]
+    data = bytearray([NO_ENTRY]) * NUM_HANDS
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [_solve_chunk(chunk, samples, exact_max_draw, seed) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_solve_chunk, chunks, [samples] * len(chunks),
+                                    [exact_max_draw] * len(chunks), [seed] * len(chunks)))
+    for solved in results:
+        for index, mask in solved:
+            data[index] = mask
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(classes)))
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(classes)
+
+
+class DrawTable:
+    """Tablica wymiany zmapowana w pamięci (tylko do odczytu)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) != _HEADER.size + NUM_HANDS:
+            self._mmap.close()
+            raise ValueError(f"Nieprawidłowy rozmiar pliku tablicy wymiany: {path}")
+        magic, version, self.num_classes = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Nieobsługiwany format tablicy wymiany: {path}")
+
+    @classmethod
+    def open_default(cls, path: str = DEFAULT_PATH) -> Optional['DrawTable']:
+        """Otwiera tablicę, jeśli plik istnieje; w przeciwnym razie zwraca None."""
+        if not os.path.exists(path):
+            return None
+        return cls(path)
+
+    def best_discard(self, codes: Sequence[int]) -> Optional[List[int]]:
+        """Indeksy kart ręki ``codes`` do wymiany lub None, gdy klasy nie ma w tablicy."""
+        canonical, order = canonicalize(codes)
+        mask = self._mmap[_HEADER.size + hand_index(canonical)]
+        if mask == NO_ENTRY:
+            return None
+        return sorted(order[i] for i in range(5) if (mask >> i) & 1)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generowanie tablicy optymalnej wymiany kart.")
+    parser.add_argument("--out", default=DEFAULT_PATH)
+    parser.add_argument("--samples", type=int, default=64, help="Liczba losowych dobrań dla wymiany 2+ kart.")
+    parser.add_argument("--exact-max-draw", type=int, default=1, help="Do ilu kart dobranie liczyć dokładnie.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=None, help="Rozwiąż tylko pierwsze N klas (do testów).")
+    args = parser.parse_args(argv)
+    solved = build_table(args.out, args.samples, args.exact_max_draw, args.workers, args.seed, args.limit)
+    print(f"Zapisano {solved} klas rąk do {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Kalkulator equity ręki pięciokartowej przeciwko losowym rękom przeciwników.
+
+Equity liczona jest dla ręki w obecnym kształcie (bez dalszej wymiany kart).
+Gdy liczba możliwych rozdań przeciwnikom nie przekracza ``exact_limit``,
+wszystkie są przeliczane dokładnie; w przeciwnym razie wynik jest szacowany
+metodą Monte Carlo w ramach limitu próbek lub czasu, opcjonalnie w kilku procesach.
+Z NumPy próbki są losowane i oceniane paczkami (``batch_eval.evaluate_array``);
+bez niego - ręka po ręce w pętli Pythona.
+"""
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import comb
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.logic.batch_eval import evaluate_array, np
+from src.logic.cards import NUM_CARDS
+from src.logic.evaluator import evaluate5
+
+HAND_SIZE = 5
+DEFAULT_SAMPLES = 10_000
+DEFAULT_EXACT_LIMIT = 200_000
+_BATCH_SIZE = 1024
+_DEADLINE_STEP = 64  # pierwsza (i najmniejsza) paczka próbek przy limicie czasu
+
+
+class Equity(NamedTuple):
+    win: float
+    tie: float
+    loss: float
+    equity: float  # wygrane + udział w podzielonych pulach
+    samples: int
+    exact: bool
+
+
+def _to_code(card) -> int:
+    return card if isinstance(card, int) else card.code
+
+
+def count_deals(num_remaining: int, num_opponents: int) -> int:
+    """Liczba (uporządkowanych) rozdań ``num_opponents`` rąk z ``num_remaining`` kart."""
+    total = 1
+    for i in range(num_opponents):
+        total *= comb(num_remaining - HAND_SIZE * i, HAND_SIZE)
+    return total
+
+
+def evaluate_batch(hands: Iterable[Sequence[int]]) -> List[int]:
+    """Siły wielu rąk naraz (kody kart)."""
+    ev = evaluate5
+    return [ev(a, b, c, d, e) for a, b, c, d, e in hands]
+
+
+def _score(hero: int, opponent_strengths: Sequence[int]) -> Tuple[int, int, int, float]:
+    best = max(opponent_strengths)
+    if hero > best:
+        return 1, 0, 0, 1.0
+    if hero < best:
+        return 0, 0, 1, 0.0
+    tied = sum(1 for s in opponent_strengths if s == best)
+    return 0, 1, 0, 1.0 / (tied + 1)
+
+
+def _ordered_deals(remaining: Sequence[int], num_opponents: int) -> Iterator[List[Tuple[int, ...]]]:
+    if num_opponents == 0:
+        yield []
+        return
+    for hand in combinations(remaining, HAND_SIZE):
+        used = set(hand)
+        rest = [c for c in remaining if c not in used]
+        for others in _ordered_deals(rest, num_opponents - 1):
+            yield [hand] + others
+
+
+def _enumerate(hero: int, remaining: Sequence[int], num_opponents: int) -> Tuple[int, int, int, float, int]:
+    wins = ties = losses = 0
+    share = 0.0
+    n = 0
+    if num_opponents == 1 and np is not None:
+        strengths = evaluate_array(np.array(list(combinations(remaining, HAND_SIZE)), dtype=np.int8))
+        wins = int((strengths < hero).sum())
+        losses = int((strengths > hero).sum())
+        n = len(strengths)
+        ties = n - wins - losses
+        return wins, ties, losses, wins + ties / 2, n
+    if num_opponents == 1:
+        # Jeden przeciwnik: wszystkie jego ręce oceniamy jedną paczką.
+        for strength in evaluate_batch(combinations(remaining, HAND_SIZE)):
+            n += 1
+            if hero > strength:
+                wins += 1
+            elif hero < strength:
+                losses += 1
+            else:
+                ties += 1
+        return wins, ties, losses, wins + ties / 2, n
+    for deal in _ordered_deals(remaining, num_opponents):
+        w, t, l, s = _score(hero, evaluate_batch(deal))
+        wins += w
+        ties += t
+        losses += l
+        share += s
+        n += 1
+    return wins, ties, losses, share, n
+
+
+def _score_python(hero: int, remaining: Sequence[int], num_opponents: int, rng: random.Random,
+                  size: int) -> Tuple[int, int, int, float]:
+    cards_needed = HAND_SIZE * num_opponents
+    wins = ties = losses = 0
+    share = 0.0
+    for _ in range(size):
+        drawn = rng.sample(remaining, cards_needed)
+        w, t, l, s = _score(hero, evaluate_batch(drawn[i:i + HAND_SIZE] for i in range(0, cards_needed, HAND_SIZE)))
+        wins += w
+        ties += t
+        losses += l
+        share += s
+    return wins, ties, losses, share
+
+
+def _score_array(hero: int, deck, num_opponents: int, rng, size: int) -> Tuple[int, int, int, float]:
+    """Paczka ``size`` losowań naraz: ręce przeciwników jako tablica oceniana przez ``evaluate_array``."""
+    cards_needed = HAND_SIZE * num_opponents
+    keys = rng.random((size, len(deck)))
+    if num_opponents == 1:
+        # Jedna ręka: wystarczy losowy podzbiór kart, kolejność w nim nie ma znaczenia.
+        picked = np.argpartition(keys, cards_needed - 1, axis=1)[:, :cards_needed]
+    else:
+        # Kilka rąk: losowa permutacja, żeby podział podzbioru na ręce też był losowy.
+        picked = keys.argsort(axis=1)[:, :cards_needed]
+    strengths = evaluate_array(deck[picked].reshape(-1, HAND_SIZE)).reshape(size, num_opponents)
+    best = strengths.max(axis=1)
+    won = best < hero
+    tied = best == hero
+    wins = int(won.sum())
+    ties = int(tied.sum())
+    tied_with = (strengths[tied] == hero).sum(axis=1)
+    return wins, ties, size - wins - ties, wins + float((1.0 / (tied_with + 1)).sum())
+
+
+def _sample(hero: int, remaining: Sequence[int], num_opponents: int, samples: Optional[int],
+            time_budget: Optional[float], seed: Optional[int]) -> Tuple[int, int, int, float, int]:
+    """Monte Carlo w paczkach; z NumPy paczka jest oceniana wektorowo, bez niego - w pętli.
+
+    Przy limicie czasu pierwsza paczka ma ``_DEADLINE_STEP`` próbek, a kolejne są
+    dobierane ze zmierzonej przepustowości tak, by zmieścić się w pozostałym czasie.
+    """
+    if np is not None:
+        score, source, rng = _score_array, np.array(remaining, dtype=np.int8), np.random.default_rng(seed)
+    else:
+        score, source, rng = _score_python, remaining, random.Random(seed)
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    wins = ties = losses = 0
+    share = 0.0
+    n = 0
+    step = _BATCH_SIZE if deadline is None else _DEADLINE_STEP
+    while samples is None or n < samples:
+        batch = step if samples is None else min(step, samples - n)
+        started = time.perf_counter()
+        w, t, l, s = score(hero, source, num_opponents, rng, batch)
+        wins += w
+        ties += t
+        losses += l
+        share += s
+        n += batch
+        if deadline is not None:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            rate = batch / max(now - started, 1e-9)
+            step = int(min(_BATCH_SIZE, max(_DEADLINE_STEP, rate * (deadline - now))))
+    return wins, ties, losses, share, n
+
+
+def hand_equity(hand: Sequence, num_opponents: int = 1, dead: Sequence = (), samples: Optional[int] = None,
+                time_budget: Optional[float] = None, exact_limit: int = DEFAULT_EXACT_LIMIT, workers: int = 1,
+                seed: Optional[int] = None) -> Equity:
+    """Zwraca prawdopodobieństwo wygranej, remisu i przegranej ręki ``hand``.
+
+    ``hand`` i ``dead`` (karty znane jako niedostępne) mogą zawierać obiekty ``Card``
+    albo kody 0..51. ``samples`` i ``time_budget`` ograniczają próbkowanie Monte Carlo;
+    gdy nie podano żadnego, używane jest ``DEFAULT_SAMPLES`` próbek.
+    """
+    hero_codes = [_to_code(c) for c in hand]
+    if len(hero_codes) != HAND_SIZE:
+        raise ValueError("Ręka musi mieć dokładnie 5 kart.")
+    if num_opponents < 1:
+        raise ValueError("Wymagany jest co najmniej jeden przeciwnik.")
+    excluded = set(hero_codes) | {_to_code(c) for c in dead}
+    remaining = [c for c in range(NUM_CARDS) if c not in excluded]
+    if len(remaining) < HAND_SIZE * num_opponents:
+        raise ValueError("Za mało kart w talii dla podanej liczby przeciwników.")
+    hero = evaluate5(*hero_codes)
+
+    exact = count_deals(len(remaining), num_opponents) <= exact_limit
+    if exact:
+        wins, ties, losses, share, n = _enumerate(hero, remaining, num_opponents)
+    else:
+        if samples is None and time_budget is None:
+            samples = DEFAULT_SAMPLES
+        if workers <= 1:
+            wins, ties, losses, share, n = _sample(hero, remaining, num_opponents, samples, time_budget, seed)
+        else:
+            seed_rng = random.Random(seed)
+            seeds = [seed_rng.getrandbits(63) for _ in range(workers)]
+            per_worker = None if samples is None else [samples // workers + (i < samples % workers)
+                                                        for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_sample, hero, remaining, num_opponents,
+                                       None if per_worker is None else per_worker[i], time_budget, seeds[i])
+                           for i in range(workers)]
+                parts = [f.result() for f in futures]
+            wins, ties, losses, n = (sum(p[i] for p in parts) for i in (0, 1, 2, 4))
+            share = sum(p[3] for p in parts)
+
+    n = max(n, 1)
+    return Equity(wins / n, ties / n, losses / n, share / n, n, exact)
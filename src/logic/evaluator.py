@@ -0,0 +1,165 @@
+"""Ewaluator układów pięciokartowych oparty na tablicach wyliczanych przy imporcie.
+
+Każdy układ zamieniany jest na jedną liczbę całkowitą (siłę), którą można
+porównywać zwykłymi operatorami: silniejszy układ ma większą wartość.
+Kategoria układu zajmuje bity od ``CATEGORY_SHIFT`` w górę, a rozstrzygacze
+(tie-breakers) są zapisane po 4 bity każdy, od najstarszego.
+"""
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, List, Sequence, Tuple
+
+from src.logic.cards import NUM_CARDS, RANK_BIT, RANK_INDEX, SUIT_INDEX
+
+CATEGORY_NAMES: Tuple[str, ...] = (
+    "Wysoka karta", "Para", "Dwie pary", "Trójka", "Strit",
+    "Kolor", "Full", "Kareta", "Poker", "Poker królewski",
+)
+(HIGH_CARD, PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT,
+ FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH) = range(len(CATEGORY_NAMES))
+
+INCOMPLETE_HAND_NAME = "Niepełna ręka"
+CATEGORY_SHIFT = 20
+
+# Liczba rozstrzygaczy zapisanych dla każdej kategorii.
+_TIE_BREAKER_COUNTS = (5, 4, 3, 3, 5, 5, 2, 2, 5, 5)
+
+# Liczby pierwsze dla rang 2..A - iloczyn jednoznacznie opisuje multizbiór rang.
+PRIMES: Tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_WHEEL = [14, 5, 4, 3, 2]
+_ROYAL = [14, 13, 12, 11, 10]
+
+
+def _pack(category: int, tie_breakers: Sequence[int]) -> int:
+    strength = category << CATEGORY_SHIFT
+    shift = 16
+    for value in tie_breakers:
+        strength |= value << shift
+        shift -= 4
+    return strength
+
+
+def _classify(values: List[int], is_flush: bool) -> int:
+    """Wolna, czytelna klasyfikacja używana wyłącznie do budowy tablic."""
+    is_straight = all(values[i] == values[i + 1] + 1 for i in range(4))
+    straight_values = values
+    if values == _WHEEL:
+        is_straight = True
+        straight_values = [5, 4, 3, 2, 1]
+
+    rank_counts: Dict[int, int] = {}
+    for value in values:
+        rank_counts[value] = rank_counts.get(value, 0) + 1
+    groups = sorted(rank_counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    grouped_values = [g[0] for g in groups]
+
+    if is_flush and is_straight:
+        if values == _ROYAL:
+            return _pack(ROYAL_FLUSH, straight_values)
+        return _pack(STRAIGHT_FLUSH, straight_values)
+    if groups[0][1] == 4:
+        return _pack(FOUR_OF_A_KIND, grouped_values)
+    if groups[0][1] == 3 and groups[1][1] == 2:
+        return _pack(FULL_HOUSE, grouped_values)
+    if is_flush:
+        return _pack(FLUSH, values)
+    if is_straight:
+        return _pack(STRAIGHT, straight_values)
+    if groups[0][1] == 3:
+        return _pack(THREE_OF_A_KIND, grouped_values)
+    if groups[0][1] == 2 and groups[1][1] == 2:
+        return _pack(TWO_PAIR, grouped_values)
+    if groups[0][1] == 2:
+        return _pack(PAIR, grouped_values)
+    return _pack(HIGH_CARD, values)
+
+
+def _build_tables() -> Tuple[List[int], List[int], Dict[int, int]]:
+    flush_table = [0] * (1 << 13)
+    unique_table = [0] * (1 << 13)
+    paired_table: Dict[int, int] = {}
+
+    for rank_idxs in combinations(range(12, -1, -1), 5):
+        values = [r + 2 for r in rank_idxs]
+        mask = 0
+        for r in rank_idxs:
+            mask |= 1 << r
+        flush_table[mask] = _classify(values, True)
+        unique_table[mask] = _classify(values, False)
+
+    for rank_idxs in combinations_with_replacement(range(12, -1, -1), 5):
+        if len(set(rank_idxs)) == 5 or rank_idxs.count(rank_idxs[0]) == 5:
+            continue
+        product = 1
+        for r in rank_idxs:
+            product *= PRIMES[r]
+        paired_table[product] = _classify([r + 2 for r in rank_idxs], False)
+
+    return flush_table, unique_table, paired_table
+
+
+# Tablice budowane raz, przy imporcie modułu.
+FLUSH_TABLE, UNIQUE_TABLE, PAIRED_TABLE = _build_tables()
+CARD_PRIME: Tuple[int, ...] = tuple(PRIMES[RANK_INDEX[code]] for code in range(NUM_CARDS))
+
+
+def evaluate(values: Sequence[int], suits: Sequence[str]) -> int:
+    """Zwraca siłę układu pięciu kart o rangach 2..14 i podanych kolorach."""
+    mask = 0
+    for value in values:
+        mask |= 1 << (value - 2)
+    s = suits[0]
+    if suits[1] == s and suits[2] == s and suits[3] == s and suits[4] == s:
+        return FLUSH_TABLE[mask]
+    strength = UNIQUE_TABLE[mask]
+    if strength:
+        return strength
+    product = 1
+    for value in values:
+        product *= PRIMES[value - 2]
+    return PAIRED_TABLE[product]
+
+
+def evaluate5(a: int, b: int, c: int, d: int, e: int) -> int:
+    """Zwraca siłę układu pięciu kart podanych jako kody 0..51 (patrz ``src.logic.cards``)."""
+    mask = RANK_BIT[a] | RANK_BIT[b] | RANK_BIT[c] | RANK_BIT[d] | RANK_BIT[e]
+    s = SUIT_INDEX[a]
+    if SUIT_INDEX[b] == s and SUIT_INDEX[c] == s and SUIT_INDEX[d] == s and SUIT_INDEX[e] == s:
+        return FLUSH_TABLE[mask]
+    strength = UNIQUE_TABLE[mask]
+    if strength:
+        return strength
+    return PAIRED_TABLE[CARD_PRIME[a] * CARD_PRIME[b] * CARD_PRIME[c] * CARD_PRIME[d] * CARD_PRIME[e]]
+
+
+def evaluate_codes(codes: Sequence[int]) -> int:
+    """Jak ``evaluate5``, dla sekwencji dokładnie pięciu kodów kart."""
+    a, b, c, d, e = codes
+    return evaluate5(a, b, c, d, e)
+
+
+def category_of(strength: int) -> int:
+    """Zwraca kategorię układu (indeks w ``CATEGORY_NAMES``) lub -1 dla niepełnej ręki."""
+    if strength < 0:
+        return -1
+    return strength >> CATEGORY_SHIFT
+
+
+def category_name(strength: int) -> str:
+    if strength < 0:
+        return INCOMPLETE_HAND_NAME
+    return CATEGORY_NAMES[strength >> CATEGORY_SHIFT]
+
+
+def tie_breakers_of(strength: int) -> List[int]:
+    if strength < 0:
+        return []
+    category = strength >> CATEGORY_SHIFT
+    return [(strength >> (16 - 4 * i)) & 0xF for i in range(_TIE_BREAKER_COUNTS[category])]
+
+
+def describe(strength: int) -> Tuple[str, int, List[int]]:
+    """Odtwarza krotkę (nazwa, kategoria, rozstrzygacze) z liczbowej siły układu."""
+    if strength < 0:
+        return INCOMPLETE_HAND_NAME, -1, []
+    return category_name(strength), category_of(strength), tie_breakers_of(strength)
@@ -0,0 +1,153 @@
+"""Pomiary pracy silnika gry: czasy faz rozdania, liczniki i okresowe profilowanie.
+
+``Instrumentation`` przekazuje się do ``GameEngine(instrumentation=...)``. Silnik
+oznacza granice faz (``mark``), a czas między kolejnymi znacznikami trafia do
+licznika danej fazy. Czas fazy ``betting`` obejmuje oczekiwanie na decyzje
+graczy - sam czas strategii mierzony jest osobno jako ``decision``.
+
+Liczniki źródeł zewnętrznych (``track``, np. liczba ocen układów) są próbkowane
+na początku i końcu rozdania, a do liczników dopisywana jest różnica. Dla
+wartości wspólnych dla procesu przy wielu stołach prowadzonych naprzemiennie
+różnica obejmuje też pracę innych stołów.
+
+Z ``profile_every=N`` co N-te rozdanie jest profilowane przez ``cProfile``;
+najdroższe funkcje trafiają do migawki, a z ``profile_dir`` pełne statystyki
+są zapisywane do plików ``hand_<numer>.prof`` (do obejrzenia w ``pstats``/snakeviz).
+"""
+import cProfile
+import io
+import os
+import pstats
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Instrumentation:
+    """Czasy faz, liczniki z etykietami i profil co ``profile_every`` rozdań."""
+
+    def __init__(self, profile_every: int = 0, profile_dir: Optional[str] = None, profile_top: int = 15):
+        if profile_every < 0:
+            raise ValueError("profile_every nie może być ujemne.")
+        self.profile_every = profile_every
+        self.profile_dir = profile_dir
+        self.profile_top = profile_top
+        self.hands_started = 0
+        # faza -> [liczba, suma sekund, maksimum sekund]
+        self.timers: Dict[str, List[float]] = {}
+        self.counters: Dict[Tuple[str, LabelKey], int] = {}
+        self.last_profile: List[Dict] = []
+        self.profiled_hands = 0
+        self._sources: Dict[str, Callable[[], int]] = {}
+        self._source_start: Dict[str, int] = {}
+        self._phase: Optional[str] = None
+        self._phase_start = 0.0
+        self._hand_start = 0.0
+        self._profiler: Optional[cProfile.Profile] = None
+
+    def track(self, name: str, read: Callable[[], int]) -> None:
+        """Rejestruje licznik zewnętrzny; na koniec rozdania dopisywany jest jego przyrost."""
+        self._sources[name] = read
+
+    def count(self, name: str, n: int = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    def add_time(self, name: str, seconds: float) -> None:
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds, seconds]
+            return
+        timer[0] += 1
+        timer[1] += seconds
+        if seconds > timer[2]:
+            timer[2] = seconds
+
+    def mark(self, phase: Optional[str]) -> None:
+        """Kończy bieżącą fazę i zaczyna ``phase`` (None - żadnej)."""
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.add_time(self._phase, now - self._phase_start)
+        self._phase = phase
+        self._phase_start = now
+
+    def begin_hand(self) -> None:
+        self.hands_started += 1
+        for name, read in self._sources.items():
+            self._source_start[name] = read()
+        if self.profile_every and self.hands_started % self.profile_every == 0:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                pass  # działa już inny profiler (np. drugi stół w tym samym wątku)
+            else:
+                self._profiler = profiler
+        self._hand_start = time.perf_counter()
+
+    def end_hand(self) -> None:
+        self.mark(None)
+        self.add_time("hand", time.perf_counter() - self._hand_start)
+        self.count("hands_played")
+        for name, read in self._sources.items():
+            self.count(name, read() - self._source_start.get(name, 0))
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._store_profile(self._profiler)
+            self._profiler = None
+
+    def _store_profile(self, profiler: cProfile.Profile) -> None:
+        self.profiled_hands += 1
+        if self.profile_dir is not None:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profiler.dump_stats(os.path.join(self.profile_dir, f"hand_{self.hands_started}.prof"))
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:self.profile_top]
+        self.last_profile = [{"function": f"{os.path.basename(path)}:{line}({func})", "calls": calls,
+                              "tottime": tottime, "cumtime": cumtime}
+                             for (path, line, func), (_, calls, tottime, cumtime, _) in rows]
+
+    def snapshot(self) -> Dict:
+        """Stan wszystkich pomiarów jako słownik (np. do JSON)."""
+        counters: Dict[str, object] = {}
+        for (name, labels), value in sorted(self.counters.items()):
+            if labels:
+                counters.setdefault(name, {})[",".join(f"{k}={v}" for k, v in labels)] = value
+            else:
+                counters[name] = value
+        return {
+            "hands_started": self.hands_started,
+            "counters": counters,
+            "timers": {name: {"count": int(count), "total_s": total, "mean_s": total / count, "max_s": peak}
+                       for name, (count, total, peak) in sorted(self.timers.items())},
+            "profiled_hands": self.profiled_hands,
+            "last_profile": list(self.last_profile),
+        }
+
+    def prometheus(self, prefix: str = "poker") -> str:
+        """Pomiary w formacie tekstowym Prometheusa."""
+        lines: List[str] = []
+        seen = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            metric = f"{prefix}_{name}_total"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_labels(labels)} {value}")
+        if self.timers:
+            metric = f"{prefix}_phase_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for name, (count, total, _) in sorted(self.timers.items()):
+                lines.append(f'{metric}_sum{{phase="{name}"}} {total:.9f}')
+                lines.append(f'{metric}_count{{phase="{name}"}} {int(count)}')
+            lines.append(f"# TYPE {metric}_max gauge")
+            for name, (_, _, peak) in sorted(self.timers.items()):
+                lines.append(f'{metric}_max{{phase="{name}"}} {peak:.9f}')
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: LabelKey) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
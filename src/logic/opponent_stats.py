@@ -0,0 +1,177 @@
+"""Statystyki graczy liczone na bieżąco z akcji w rozdaniach.
+
+``OpponentStats`` przekazuje się do ``GameEngine(stats=...)``. Silnik zgłasza
+każdą akcję licytacji, wymianę kart i odkryte układy, a tracker aktualizuje
+liczniki gracza w czasie O(1) na zdarzenie - bez przeglądania historii rozdań.
+Pamięć na gracza jest stała: kilka liczników, histogram liczby wymienianych
+kart i histogram kategorii układów na showdownie.
+
+Dla każdego gracza prowadzone są:
+  - VPIP - odsetek rozdań, w których gracz dobrowolnie włożył żetony do puli
+    (sprawdzenie, zakład lub przebicie; blindy się nie liczą);
+  - współczynnik agresji - (zakłady + przebicia) / sprawdzenia;
+  - pas na zakład - odsetek sytuacji, w których gracz spasował, gdy przed nim
+    padł zakład lub przebicie;
+  - rozkład liczby wymienianych kart i kategorii układów odkrytych na showdownie.
+Oprócz sum od początku gry każdy współczynnik ma wersję wykładniczo ważoną
+(``decay`` na zdarzenie), opisującą ostatnie mniej więcej ``1 / (1 - decay)``
+zdarzeń - przydatną, gdy gracz zmienia styl gry.
+
+Gracze są identyfikowani po nazwie, więc jeden tracker może obsługiwać wiele
+stołów, dopóki gracz siedzi naraz przy jednym z nich. Stan zapisuje się przez
+``to_dict``/``from_dict`` (``SessionManager.save_stats``/``load_stats``).
+"""
+from typing import Dict, Iterable, Optional, Union
+
+from src.logic.evaluator import CATEGORY_NAMES
+
+HAND_SIZE = 5
+AGGRESSIVE_ACTIONS = ("bet", "raise")
+
+Rates = Dict[str, Union[None, int, float, list, Dict[str, int]]]
+
+
+def _ratio(numerator: float, denominator: float) -> Optional[float]:
+    return numerator / denominator if denominator else None
+
+
+class PlayerStats:
+    """Liczniki jednego gracza: sumy od początku gry i wartości wykładniczo ważone."""
+
+    _COUNTERS = ("hands", "voluntary_hands", "aggressive", "calls", "faced_bets", "folds_to_bet", "showdowns")
+    _DECAYED = ("w_hands", "w_voluntary", "w_aggressive", "w_calls", "w_faced", "w_folds", "w_draws", "w_drawn")
+    __slots__ = _COUNTERS + _DECAYED + ("draws", "categories", "in_hand", "voluntary")
+
+    def __init__(self):
+        for name in self._COUNTERS:
+            setattr(self, name, 0)
+        for name in self._DECAYED:
+            setattr(self, name, 0.0)
+        self.draws = [0] * (HAND_SIZE + 1)  # liczba wymian po 0..5 kart
+        self.categories = [0] * len(CATEGORY_NAMES)  # kategorie układów odkrytych na showdownie
+        # Stan bieżącego rozdania.
+        self.in_hand = False
+        self.voluntary = False
+
+    def rates(self) -> Rates:
+        """Współczynniki od początku gry i ważone (``recent_*``); None, gdy brak danych.
+
+        ``draws`` to liczba wymian po 0..5 kart, a ``showdown_categories`` - liczba
+        odkrytych układów według nazwy kategorii.
+        """
+        draws = sum(self.draws)
+        return {
+            "hands": self.hands,
+            "vpip": _ratio(self.voluntary_hands, self.hands),
+            "aggression": _ratio(self.aggressive, self.calls),
+            "fold_to_bet": _ratio(self.folds_to_bet, self.faced_bets),
+            "avg_draw": _ratio(sum(n * count for n, count in enumerate(self.draws)), draws),
+            "recent_vpip": _ratio(self.w_voluntary, self.w_hands),
+            "recent_aggression": _ratio(self.w_aggressive, self.w_calls),
+            "recent_fold_to_bet": _ratio(self.w_folds, self.w_faced),
+            "recent_avg_draw": _ratio(self.w_drawn, self.w_draws),
+            "draws": list(self.draws),
+            "showdowns": self.showdowns,
+            "showdown_categories": {CATEGORY_NAMES[category]: count
+                                    for category, count in enumerate(self.categories) if count},
+        }
+
+    def to_dict(self) -> Dict:
+        data = {name: getattr(self, name) for name in self._COUNTERS + self._DECAYED}
+        data["draws"] = list(self.draws)
+        data["categories"] = list(self.categories)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PlayerStats':
+        stats = cls()
+        for name in cls._COUNTERS + cls._DECAYED:
+            setattr(stats, name, data.get(name, getattr(stats, name)))
+        for i, count in enumerate(data.get("draws", ())[:len(stats.draws)]):
+            stats.draws[i] = count
+        for i, count in enumerate(data.get("categories", ())[:len(stats.categories)]):
+            stats.categories[i] = count
+        return stats
+
+
+class OpponentStats:
+    """Tracker statystyk wszystkich graczy zasilany zdarzeniami silnika."""
+
+    def __init__(self, decay: float = 0.98):
+        if not 0.0 < decay < 1.0:
+            raise ValueError("decay musi należeć do przedziału (0, 1).")
+        self.decay = decay
+        self.players: Dict[str, PlayerStats] = {}
+
+    def player(self, name: str) -> PlayerStats:
+        stats = self.players.get(name)
+        if stats is None:
+            stats = self.players[name] = PlayerStats()
+        return stats
+
+    def begin_hand(self, names: Iterable[str]) -> None:
+        """Oznacza graczy, którzy dostali karty w rozdaniu."""
+        for name in names:
+            stats = self.player(name)
+            stats.in_hand = True
+            stats.voluntary = False
+
+    def on_action(self, name: str, action: str, facing_bet: bool) -> None:
+        """Akcja licytacji; ``facing_bet`` - czy w tej rundzie padł już zakład lub przebicie."""
+        stats = self.player(name)
+        decay = self.decay
+        if action in AGGRESSIVE_ACTIONS:
+            stats.aggressive += 1
+            stats.w_aggressive = stats.w_aggressive * decay + 1.0
+            stats.w_calls *= decay
+            stats.voluntary = True
+        elif action == "call":
+            stats.calls += 1
+            stats.w_calls = stats.w_calls * decay + 1.0
+            stats.w_aggressive *= decay
+            stats.voluntary = True
+        if facing_bet:
+            folded = action == "fold"
+            stats.faced_bets += 1
+            stats.folds_to_bet += folded
+            stats.w_faced = stats.w_faced * decay + 1.0
+            stats.w_folds = stats.w_folds * decay + folded
+
+    def on_exchange(self, name: str, count: int) -> None:
+        stats = self.player(name)
+        count = min(max(count, 0), HAND_SIZE)
+        stats.draws[count] += 1
+        stats.w_draws = stats.w_draws * self.decay + 1.0
+        stats.w_drawn = stats.w_drawn * self.decay + count
+
+    def on_showdown(self, name: str, category: int) -> None:
+        stats = self.player(name)
+        stats.showdowns += 1
+        if category >= 0:
+            stats.categories[category] += 1
+
+    def end_hand(self, names: Iterable[str]) -> None:
+        """Zamyka rozdanie graczy z ``begin_hand`` - dopiero tu liczy się VPIP (raz na rozdanie)."""
+        decay = self.decay
+        for name in names:
+            stats = self.players.get(name)
+            if stats is None or not stats.in_hand:
+                continue
+            stats.in_hand = False
+            stats.hands += 1
+            stats.voluntary_hands += stats.voluntary
+            stats.w_hands = stats.w_hands * decay + 1.0
+            stats.w_voluntary = stats.w_voluntary * decay + stats.voluntary
+
+    def snapshot(self) -> Dict[str, Rates]:
+        """Współczynniki wszystkich graczy (``PlayerStats.rates``), np. dla panelu lub botów."""
+        return {name: stats.rates() for name, stats in self.players.items()}
+
+    def to_dict(self) -> Dict:
+        return {"decay": self.decay, "players": {name: stats.to_dict() for name, stats in self.players.items()}}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'OpponentStats':
+        tracker = cls(data.get("decay", 0.98))
+        tracker.players = {name: PlayerStats.from_dict(entry) for name, entry in data.get("players", {}).items()}
+        return tracker
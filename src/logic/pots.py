@@ -0,0 +1,83 @@
+"""Podział puli na pulę główną i pule boczne oraz wybór zwycięzców każdej z nich.
+
+Pule buduje się z żetonów wniesionych przez każde miejsce w rozdaniu
+(``TableState.committed``). Poziomy puli to różne wkłady graczy, którzy nie
+spasowali: pula ``i`` zbiera od każdego gracza (także tego, który spasował)
+wkład między poziomem ``i - 1`` a ``i``, a wygrać mogą ją tylko gracze w grze
+z wkładem co najmniej ``i``. Żetony ponad najwyższy wkład gracza w grze (np.
+zakład gracza, który potem spasował) trafiają do ostatniej puli. Niesprawdzona
+część zakładu - nadwyżka najwyższego wkładu ponad drugi najwyższy
+(``uncalled_bet``) - nie trafia do żadnej puli, tylko wraca do właściciela.
+
+Zwycięzców wszystkich pul wyznacza jedno sortowanie miejsc po sile układu
+(liczby całkowite z ``src.logic.evaluator``): dla każdej puli wygrywa pierwszy
+uprawniony gracz z tej kolejności i gracze z tą samą siłą. Przy podziale puli
+nieparzyste żetony dostają zwycięzcy z najniższymi numerami miejsc.
+"""
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class Pot(NamedTuple):
+    amount: int
+    eligible: Tuple[int, ...]  # miejsca uprawnione do wygrania puli, rosnąco
+
+
+def uncalled_bet(contributions: Sequence[int]) -> Tuple[int, int]:
+    """Miejsce z najwyższym wkładem i nadwyżka ponad drugi najwyższy wkład; ``(-1, 0)``, gdy jej brak."""
+    top = second = 0
+    top_seat = -1
+    for seat, c in enumerate(contributions):
+        if c > top:
+            top, second, top_seat = c, top, seat
+        elif c > second:
+            second = c
+    return (top_seat, top - second) if top > second else (-1, 0)
+
+
+def build_pots(contributions: Sequence[int], folded: Sequence[bool]) -> List[Pot]:
+    """Pula główna i pule boczne (od głównej) z wkładów miejsc w rozdaniu, bez niesprawdzonej nadwyżki."""
+    top_seat, uncalled = uncalled_bet(contributions)
+    if uncalled:
+        contributions = list(contributions)
+        contributions[top_seat] -= uncalled
+    levels = sorted({c for c, out in zip(contributions, folded) if c > 0 and not out})
+    pots: List[Pot] = []
+    previous = 0
+    for level in levels:
+        amount = 0
+        eligible = []
+        for seat, c in enumerate(contributions):
+            if c > previous:
+                amount += (c if c < level else level) - previous
+                if c >= level and not folded[seat]:
+                    eligible.append(seat)
+        pots.append(Pot(amount, tuple(eligible)))
+        previous = level
+    # Wkłady ponad najwyższy poziom mają tylko gracze, którzy spasowali.
+    rest = sum(c - previous for c in contributions if c > previous)
+    if rest and pots:
+        pots[-1] = Pot(pots[-1].amount + rest, pots[-1].eligible)
+    return pots
+
+
+def award_pots(pots: Sequence[Pot], strengths: Sequence[int]) -> List[List[Tuple[int, int]]]:
+    """Wygrane (miejsce, kwota) w każdej puli; ``strengths[seat]`` to siła układu miejsca."""
+    ranked = sorted(range(len(strengths)), key=strengths.__getitem__, reverse=True)
+    awards = []
+    for pot in pots:
+        eligible = set(pot.eligible)
+        winners: List[int] = []
+        best = None
+        for seat in ranked:
+            if best is not None and strengths[seat] != best:
+                break
+            if seat in eligible:
+                best = strengths[seat]
+                winners.append(seat)
+        if not winners:
+            awards.append([])
+            continue
+        winners.sort()
+        share, remainder = divmod(pot.amount, len(winners))
+        awards.append([(seat, share + (1 if i < remainder else 0)) for i, seat in enumerate(winners)])
+    return awards
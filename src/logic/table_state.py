@@ -0,0 +1,239 @@
+"""Zwarty stan stołu: kolumny miejsc zamiast atrybutów pojedynczych graczy.
+
+``TableState`` trzyma dane wszystkich miejsc w tablicach ``array`` (po jednej
+wartości na miejsce):
+
+    stack      - żetony gracza
+    bet        - zakład w bieżącej rundzie licytacji
+    committed  - żetony wniesione do puli w całym rozdaniu
+    folded     - czy gracz spasował
+    all_in     - czy gracz wszedł za wszystko w tym rozdaniu
+    hand       - kody kart (``src.logic.cards``), po ``HAND_SIZE`` pól na miejsce
+    hand_len   - liczba kart w ręce
+    strength   - zapamiętana siła układu (``UNKNOWN`` - jeszcze nie liczona)
+
+``main.Player`` jest cienkim widokiem na jedno miejsce (``state``, ``seat``), więc
+przeglądanie miejsc, liczniki i sumy żetonów to przejścia po kolumnach (``count``
+i ``sum`` na tablicach działają w C), bez pobierania atrybutów obiektów graczy.
+Licytacja (``src.logic.betting.BettingRound``) też działa bezpośrednio na kolumnach.
+
+Gracze poza stołem (utworzeni samodzielnie albo usunięci ze stołu) zajmują
+wiersz we wspólnym stanie ``DETACHED``; wiersz jest zwalniany, gdy gracz
+siada przy stole (``GameEngine`` przenosi graczy do stanu stołu) albo znika.
+
+Z NumPy ``arrays()`` zwraca widoki kolumn bez kopiowania (np. do ocen
+``src.logic.batch_eval``). Widoki blokują zmianę rozmiaru tablic, dlatego
+trzeba je zwolnić przed dodaniem lub usunięciem miejsca. NumPy jest zależnością
+opcjonalną - bez niego ``arrays()`` zgłasza ``ImportError``.
+"""
+import threading
+from array import array
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - zależne od środowiska
+    np = None
+
+HAND_SIZE = 5
+UNKNOWN = -1
+
+# Kolumny jednej wartości na miejsce: nazwa -> kod typu ``array``.
+_SEAT_COLUMNS = {"stack": 'q', "bet": 'q', "committed": 'q', "folded": 'b', "all_in": 'b', "hand_len": 'b',
+                 "strength": 'i'}
+
+
+class TableState:
+    """Kolumny stanu wszystkich miejsc przy stole; ``players[seat]`` to widok miejsca."""
+    __slots__ = ('players', 'stack', 'bet', 'committed', 'folded', 'all_in', 'hand', 'hand_len', 'strength')
+
+    def __init__(self, players: Optional[List] = None):
+        """Przenosi ``players`` (lista zostaje ta sama) do nowego stanu, zachowując ich dane."""
+        for name, code in _SEAT_COLUMNS.items():
+            setattr(self, name, array(code))
+        self.hand = array('b')
+        self.players = players if players is not None else []
+        for seat, player in enumerate(self.players):
+            self._import(player, seat)
+
+    def __len__(self) -> int:
+        return len(self.stack)
+
+    def _import(self, player, seat: int) -> None:
+        """Dopisuje kolumny miejsca ``seat``, kopiując dane z dotychczasowego stanu gracza."""
+        old: Optional[TableState] = getattr(player, '_state', None)
+        if old is None:
+            for name in _SEAT_COLUMNS:
+                getattr(self, name).append(0)
+            self.strength[-1] = UNKNOWN
+            self.hand.extend(bytes(HAND_SIZE))
+        else:
+            old_seat = player._seat
+            for name in _SEAT_COLUMNS:
+                getattr(self, name).append(getattr(old, name)[old_seat])
+            start = old_seat * HAND_SIZE
+            self.hand.extend(old.hand[start:start + HAND_SIZE])
+            old.release(old_seat)
+        player._state = self
+        player._seat = seat
+
+    def release(self, seat: int) -> None:
+        """Gracz z miejsca ``seat`` przeszedł do innego stanu (miejsca stołu usuwa ``remove_seat``)."""
+
+    def row(self, seat: int) -> Dict[str, object]:
+        """Kopia danych miejsca: wartości kolumn i ``hand`` (lista ``HAND_SIZE`` kodów)."""
+        data: Dict[str, object] = {name: getattr(self, name)[seat] for name in _SEAT_COLUMNS}
+        data["hand"] = self.hand[seat * HAND_SIZE:(seat + 1) * HAND_SIZE].tolist()
+        return data
+
+    def set_row(self, seat: int, data: Dict[str, object]) -> None:
+        """Wpisuje dane z ``row`` do miejsca ``seat``."""
+        for name in _SEAT_COLUMNS:
+            getattr(self, name)[seat] = data[name]
+        self.hand[seat * HAND_SIZE:(seat + 1) * HAND_SIZE] = array('b', data["hand"])
+
+    def add_seat(self, player) -> int:
+        """Sadza gracza na nowym, ostatnim miejscu i zwraca jego numer."""
+        self.players.append(player)
+        seat = len(self.players) - 1
+        self._import(player, seat)
+        return seat
+
+    def remove_seat(self, seat: int):
+        """Usuwa miejsce; gracz przechodzi do ``DETACHED`` z tymi samymi danymi, kolejni przesuwają się o jedno."""
+        player = self.players[seat]
+        DETACHED.attach(player)
+        del self.players[seat]
+        for name in _SEAT_COLUMNS:
+            getattr(self, name).pop(seat)
+        del self.hand[seat * HAND_SIZE:(seat + 1) * HAND_SIZE]
+        for next_seat in range(seat, len(self.players)):
+            self.players[next_seat]._seat = next_seat
+        return player
+
+    # --- Przeglądanie miejsc ---
+
+    def seats_with_chips(self) -> List[int]:
+        return [seat for seat, chips in enumerate(self.stack) if chips > 0]
+
+    def seats_in_hand(self) -> List[int]:
+        """Miejsca graczy, którzy nie spasowali (także bez żetonów)."""
+        return [seat for seat, folded in enumerate(self.folded) if not folded]
+
+    def count_with_chips(self) -> int:
+        return len(self.stack) - self.stack.count(0)
+
+    def count_in_hand(self) -> int:
+        return self.folded.count(0)
+
+    def next_seat(self, start: int, chips: bool = False, in_hand: bool = False, count: Optional[int] = None) -> int:
+        """Pierwsze miejsce od ``start`` (zgodnie z ruchem wskazówek) spełniające warunki albo -1.
+
+        ``chips`` - gracz ma żetony, ``in_hand`` - nie spasował; ``count`` ogranicza
+        liczbę sprawdzanych miejsc (domyślnie cały stół).
+        """
+        n = len(self.stack)
+        stack, folded = self.stack, self.folded
+        for offset in range(n if count is None else count):
+            seat = (start + offset) % n
+            if (chips and stack[seat] <= 0) or (in_hand and folded[seat]):
+                continue
+            return seat
+        return -1
+
+    # --- Żetony ---
+
+    def total_chips(self) -> int:
+        """Żetony na stole: stosy graczy i zakłady wniesione w tym rozdaniu."""
+        return sum(self.stack) + sum(self.committed)
+
+    def total_committed(self) -> int:
+        return sum(self.committed)
+
+    def pay(self, seat: int, amount: int) -> int:
+        """Przenosi do puli do ``amount`` żetonów miejsca; zwraca faktycznie wpłaconą kwotę."""
+        stack = self.stack[seat]
+        to_pay = amount if amount < stack else stack
+        self.stack[seat] = stack - to_pay
+        self.committed[seat] += to_pay
+        if to_pay > 0 and to_pay == stack:
+            self.all_in[seat] = True
+        return to_pay
+
+    def new_hand(self) -> None:
+        """Czyści ręce, zakłady i znaczniki wszystkich miejsc przed rozdaniem.
+
+        Miejsca bez żetonów od razu są oznaczane jako spasowane - nie dostają kart
+        i nie mogą wygrać puli, do której nic nie wniosły.
+        """
+        n = len(self.stack)
+        self.bet[:] = array('q', bytes(8 * n))
+        self.committed[:] = array('q', bytes(8 * n))
+        self.folded[:] = array('b', [chips <= 0 for chips in self.stack])
+        self.all_in[:] = array('b', bytes(n))
+        self.hand_len[:] = array('b', bytes(n))
+        self.strength[:] = array('i', [UNKNOWN]) * n
+
+    # --- Karty ---
+
+    def hand_codes(self, seat: int) -> List[int]:
+        start = seat * HAND_SIZE
+        return self.hand[start:start + self.hand_len[seat]].tolist()
+
+    def arrays(self) -> Dict[str, "np.ndarray"]:
+        """Widoki NumPy kolumn bez kopiowania; ``hand`` ma kształt (miejsca, ``HAND_SIZE``)."""
+        if np is None:
+            raise ImportError("Widoki kolumn stołu wymagają pakietu numpy.")
+        views = {name: np.frombuffer(getattr(self, name), dtype=np.dtype(code)) if len(self.stack) else
+                 np.zeros(0, dtype=np.dtype(code)) for name, code in _SEAT_COLUMNS.items()}
+        views["hand"] = (np.frombuffer(self.hand, dtype=np.int8) if len(self.hand) else
+                         np.zeros(0, dtype=np.int8)).reshape(-1, HAND_SIZE)
+        return views
+
+
+class DetachedSeats(TableState):
+    """Wspólny stan graczy poza stołem: po wierszu na gracza, zwolnione wiersze są używane ponownie.
+
+    Stan nie trzyma referencji do graczy (``players`` jest puste), więc wiersz
+    gracza, który nie usiadł przy stole, zwalnia ``main.Player.__del__``. Kopia
+    gracza (``copy``, ``pickle``) dostaje własny wiersz - dwa obiekty nigdy nie
+    dzielą jednego wiersza, bo zwolnienie go przez jeden nadpisałoby dane drugiego.
+    """
+    __slots__ = ('_free', '_lock')
+
+    def __init__(self):
+        super().__init__()
+        self._free: List[int] = []
+        self._lock = threading.Lock()
+
+    def attach(self, player, stack: int = 0) -> None:
+        """Zajmuje wiersz dla gracza, kopiując dane z jego dotychczasowego stanu (bez stanu - ``stack``)."""
+        old: Optional[TableState] = getattr(player, '_state', None)
+        try:
+            seat = self._free.pop()
+        except IndexError:
+            # Dopisanie wiersza zmienia wszystkie kolumny - nie może przeplatać się z innym wątkiem.
+            with self._lock:
+                seat = len(self.stack)
+                for name in _SEAT_COLUMNS:
+                    getattr(self, name).append(0)
+                self.hand.extend(bytes(HAND_SIZE))
+        if old is None:
+            start = seat * HAND_SIZE
+            for name in _SEAT_COLUMNS:
+                getattr(self, name)[seat] = 0
+            self.stack[seat] = stack
+            self.strength[seat] = UNKNOWN
+            self.hand[start:start + HAND_SIZE] = array('b', bytes(HAND_SIZE))
+        else:
+            old_seat = player._seat
+            self.set_row(seat, old.row(old_seat))
+            old.release(old_seat)
+        player._state = self
+        player._seat = seat
+
+    def release(self, seat: int) -> None:
+        self._free.append(seat)
+
+
+DETACHED = DetachedSeats()
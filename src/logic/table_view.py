@@ -0,0 +1,68 @@
+"""Niezmienny widok stołu dla strategii botów i interfejs strategii na nim opartych.
+
+``TableView`` to migawka stanu stołu z perspektywy jednego miejsca: własna ręka
+(kody kart), stosy, zakłady i znaczniki pasów wszystkich miejsc oraz stan
+licytacji. Silnik buduje ją z kolumn ``TableState`` (``GameEngine.table_view``),
+więc jest tania, a ponieważ zawiera tylko liczby i krotki, można ją przekazać
+do wątku albo innego procesu.
+
+``ViewStrategy`` podejmuje decyzje wyłącznie na podstawie widoku. ``deadline``
+(czas ``time.monotonic``, wspólny dla procesów) to termin decyzji - strategia
+wykonująca kosztowne obliczenia (np. próbkowanie equity) powinna się w nim
+zmieścić, a ``fallback_action``/``fallback_exchange`` zwracają odpowiedź
+używaną, gdy termin minie. Przy stole strategię sadza się przez
+``main.BudgetedSeat``.
+"""
+import time
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class TableView(NamedTuple):
+    seat: int
+    hand: Tuple[int, ...]  # kody kart w kolejności ręki (indeksy jak przy wymianie)
+    strength: int  # siła układu (``src.logic.evaluator``), -1 dla niepełnej ręki
+    stack: int
+    bet: int  # zakład gracza w bieżącej rundzie licytacji
+    bet_to_match: int
+    pot: int
+    small_blind: int
+    big_blind: int
+    dealer: int
+    stacks: Tuple[int, ...]
+    bets: Tuple[int, ...]
+    folded: Tuple[bool, ...]
+    deadline: Optional[float] = None
+
+    @property
+    def to_call(self) -> int:
+        return max(0, self.bet_to_match - self.bet)
+
+    @property
+    def opponents_in_hand(self) -> int:
+        return sum(1 for seat, out in enumerate(self.folded) if not out and seat != self.seat)
+
+    def remaining(self) -> Optional[float]:
+        """Sekundy do terminu decyzji (nie mniej niż 0) albo None bez terminu."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+
+class ViewStrategy(ABC):
+    """Strategia decydująca na podstawie ``TableView``."""
+
+    @abstractmethod
+    def decide_action(self, view: TableView) -> Tuple[str, int]:
+        """Zwraca akcję ("fold", "check", "call", "bet", "raise") i łączny zakład w rundzie."""
+
+    @abstractmethod
+    def decide_exchange(self, view: TableView) -> List[int]:
+        """Zwraca indeksy kart w ręce, które mają zostać wymienione."""
+
+    def fallback_action(self, view: TableView) -> Tuple[str, int]:
+        """Akcja po upływie terminu: czekanie, jeśli nic nie trzeba dopłacać, inaczej pas."""
+        return ("check", 0) if view.to_call == 0 else ("fold", 0)
+
+    def fallback_exchange(self, view: TableView) -> List[int]:
+        return []
@@ -0,0 +1,168 @@
+"""Klient serwera stołów (``src.net.server``): gracz z konsoli albo bot.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m src.net.client --name Ala                  # gra z klawiatury
+    python -m src.net.client --bots 200 --port 8765     # obciążenie serwera botami
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from src.logic.evaluator import PAIR, TWO_PAIR, THREE_OF_A_KIND, category_of, evaluate_codes
+from src.net.server import MAX_LINE, dump_message, load_message
+
+ActionDecider = Callable[[Dict], Union[Tuple[str, int], Awaitable[Tuple[str, int]]]]
+ExchangeDecider = Callable[[Dict], Union[List[int], Awaitable[List[int]]]]
+
+
+def bot_decide_action(request: Dict) -> Tuple[str, int]:
+    """Reguły jak u ``RuleBasedBotStrategy``, liczone wyłącznie z danych żądania."""
+    category = category_of(evaluate_codes(request["codes"]))
+    to_call, stack, big_blind = request["to_call"], request["stack"], request["big_blind"]
+    if to_call <= 0:
+        if category >= PAIR and stack > 0:
+            return "bet", request["bet_to_match"] + min(2 * big_blind, stack)
+        return "check", 0
+    if category >= TWO_PAIR and stack > to_call + big_blind:
+        return "raise", request["bet_to_match"] + big_blind
+    if category >= PAIR and to_call <= stack / 4:
+        return "call", 0
+    return "fold", 0
+
+
+def bot_decide_exchange(request: Dict) -> List[int]:
+    """Zatrzymuje karty tworzące pary i lepsze układy; przy wysokiej karcie wymienia trzy najniższe."""
+    codes = request["codes"]
+    if category_of(evaluate_codes(codes)) >= THREE_OF_A_KIND:
+        return []
+    ranks = [code % 13 for code in codes]
+    singles = [i for i, rank in enumerate(ranks) if ranks.count(rank) == 1]
+    if len(singles) == 5:
+        return sorted(singles, key=lambda i: ranks[i])[:3]
+    return singles
+
+
+async def console_decide_action(request: Dict) -> Tuple[str, int]:
+    loop = asyncio.get_running_loop()
+    print(f"Twoje karty: {', '.join(request['hand'])} | stack {request['stack']}, pula {request['pot']}, "
+          f"do wyrównania {request['to_call']} (limit {request['timeout']:.0f} s)")
+    answer = await loop.run_in_executor(None, input, "Akcja (fold/check/call/bet N/raise N): ")
+    parts = answer.strip().lower().split()
+    if not parts:
+        return ("check", 0) if request["to_call"] == 0 else ("call", 0)
+    amount = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+    return parts[0], amount
+
+
+async def console_decide_exchange(request: Dict) -> List[int]:
+    loop = asyncio.get_running_loop()
+    for i, card in enumerate(request["hand"]):
+        print(f"  {i}: {card}")
+    answer = await loop.run_in_executor(None, input, "Indeksy kart do wymiany (np. 0 3, Enter = żadna): ")
+    return [int(part) for part in answer.split() if part.isdigit()]
+
+
+class PokerClient:
+    """Połączenie z serwerem; decyzje podejmują przekazane funkcje (zwykłe lub async)."""
+
+    def __init__(self, name: str, decide_action: ActionDecider = bot_decide_action,
+                 decide_exchange: ExchangeDecider = bot_decide_exchange,
+                 on_message: Optional[Callable[[Dict], None]] = None):
+        self.name = name
+        self.decide_action = decide_action
+        self.decide_exchange = decide_exchange
+        self.on_message = on_message
+        self.table: Optional[int] = None
+        self.seat: Optional[int] = None
+        self.decisions = 0
+        self.think_time = 0.0
+
+    async def play(self, host: str, port: int) -> Optional[Dict]:
+        """Dołącza do stołu i gra do jego końca. Zwraca komunikat ``table_end`` (lub None po rozłączeniu)."""
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        try:
+            writer.write(dump_message({"type": "join", "name": self.name}))
+            await writer.drain()
+            while True:
+                try:
+                    line = await reader.readline()
+                except ConnectionError:
+                    return None
+                if not line:
+                    return None
+                message = load_message(line)
+                kind = message.get("type")
+                if kind == "request":
+                    reply = await self._answer(message)
+                    try:
+                        writer.write(dump_message(reply))
+                        await writer.drain()
+                    except ConnectionError:
+                        pass  # serwer mógł już zamknąć stół; doczytujemy pozostałe komunikaty
+                elif kind == "welcome":
+                    self.table, self.seat = message["table"], message["seat"]
+                elif kind == "table_end":
+                    if self.on_message is not None:
+                        self.on_message(message)
+                    return message
+                if self.on_message is not None and kind != "request":
+                    self.on_message(message)
+        finally:
+            writer.close()
+
+    async def _answer(self, request: Dict) -> Dict:
+        started = time.perf_counter()
+        if request["kind"] == "exchange":
+            indices = self.decide_exchange(request)
+            if inspect.isawaitable(indices):
+                indices = await indices
+            reply = {"type": "exchange", "id": request["id"], "indices": list(indices)}
+        else:
+            result = self.decide_action(request)
+            if inspect.isawaitable(result):
+                result = await result
+            action, amount = result
+            reply = {"type": "action", "id": request["id"], "action": action, "amount": amount}
+        self.decisions += 1
+        self.think_time += time.perf_counter() - started
+        return reply
+
+
+async def run_bots(num_bots: int, host: str, port: int, name_prefix: str = "Zdalny") -> List[Optional[Dict]]:
+    """Uruchamia ``num_bots`` botów-klientów jednocześnie i zwraca ich wyniki końcowe."""
+    clients = [PokerClient(f"{name_prefix}_{i}") for i in range(num_bots)]
+    return await asyncio.gather(*(client.play(host, port) for client in clients))
+
+
+def _print_message(message: Dict) -> None:
+    if message.get("type") == "message":
+        print(message["text"])
+    elif message.get("type") == "table_end":
+        print(f"Koniec gry po {message['hands']} rozdaniach. Stosy: {message['stacks']}")
+    elif message.get("type") == "error":
+        print(f"Błąd serwera: {message['message']}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Klient serwera pokera dobieranego.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--name", default="Gracz")
+    parser.add_argument("--bots", type=int, default=0, help="Zamiast gry z konsoli uruchom N botów.")
+    args = parser.parse_args(argv)
+    if args.bots:
+        started = time.perf_counter()
+        results = asyncio.run(run_bots(args.bots, args.host, args.port))
+        finished = sum(1 for result in results if result is not None)
+        print(json.dumps({"bots": args.bots, "finished": finished,
+                          "seconds": round(time.perf_counter() - started, 3)}))
+        return
+    client = PokerClient(args.name, console_decide_action, console_decide_exchange, on_message=_print_message)
+    asyncio.run(client.play(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Zwarty, binarny format komunikatów o przebiegu gry (zdarzenia akcji i zmiany stanu).
+
+Ramka:
+    varint długość | u8 wersja | u8 typ | treść
+
+Liczby nieujemne (kwoty, pula, stosy, numery) zapisywane są jako varint
+(7 bitów na bajt, najstarszy bit = "dalej"), karty jako pojedyncze bajty
+z kodem 0..51 (``src.logic.cards``), a akcje jako jeden bajt.
+
+Typy:
+    MSG_ACTION       - ``{"type": "action_event", "table", "hand", "seat", "action", "amount", "pot", "stack"}``
+    MSG_STATE_DELTA  - ``{"type": "state_delta", "table", "hand", "pot", "current_player",
+                          "stacks": [[miejsce, stos], ...], "hands": [[miejsce, [kody kart]], ...]}``
+    MSG_JSON         - dowolny słownik jako JSON w UTF-8 (fallback do debugowania
+                       i dla komunikatów bez formatu binarnego)
+
+Ramka uszkodzona (za krótka, z treścią niezgodną z długością, z nieznanym typem
+lub wersją) zgłasza ``ProtocolError``.
+"""
+import json
+from typing import Dict, List, Optional, Tuple
+
+from src.logic import cards
+
+PROTOCOL_VERSION = 1
+
+MSG_JSON = 0
+MSG_ACTION = 1
+MSG_STATE_DELTA = 2
+
+ACTION_NAMES: Tuple[str, ...] = ("fold", "check", "call", "bet", "raise", "small_blind", "big_blind",
+                                 "exchange", "win")
+ACTION_CODES: Dict[str, int] = {name: code for code, name in enumerate(ACTION_NAMES)}
+NO_PLAYER = 0xFF
+
+
+class ProtocolError(ValueError):
+    """Uszkodzona lub nieobsługiwana ramka."""
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise ValueError(f"Varint nie obsługuje liczb ujemnych: {value}")
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Zwraca (wartość, pozycja za varintem); IndexError, gdy dane się urwały."""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def card_to_code(card: str) -> int:
+    """Karta w zapisie sesji (``"AS"``, ``"10H"``) na kod 0..51."""
+    return cards.encode(card[:-1], card[-1].lower())
+
+
+def code_to_card(code: int) -> str:
+    rank, suit = cards.decode(code)
+    return rank + suit.upper()
+
+
+def _frame(msg_type: int, body: bytes) -> bytes:
+    out = bytearray()
+    write_varint(out, len(body) + 2)
+    out.append(PROTOCOL_VERSION)
+    out.append(msg_type)
+    out += body
+    return bytes(out)
+
+
+def _encode_action(message: Dict) -> bytes:
+    body = bytearray()
+    write_varint(body, message.get("table", 0))
+    write_varint(body, message.get("hand", 0))
+    body.append(message["seat"])
+    body.append(ACTION_CODES[message["action"]])
+    write_varint(body, message.get("amount", 0))
+    write_varint(body, message.get("pot", 0))
+    write_varint(body, message.get("stack", 0))
+    return _frame(MSG_ACTION, body)
+
+
+def _encode_state_delta(message: Dict) -> bytes:
+    body = bytearray()
+    write_varint(body, message.get("table", 0))
+    write_varint(body, message.get("hand", 0))
+    write_varint(body, message.get("pot", 0))
+    current = message.get("current_player")
+    body.append(NO_PLAYER if current is None else current)
+    stacks = message.get("stacks", ())
+    body.append(len(stacks))
+    for seat, stack in stacks:
+        body.append(seat)
+        write_varint(body, stack)
+    hands = message.get("hands", ())
+    body.append(len(hands))
+    for seat, codes in hands:
+        body.append(seat)
+        body.append(len(codes))
+        body += bytes(codes)
+    return _frame(MSG_STATE_DELTA, body)
+
+
+def encode_json(message: Dict) -> bytes:
+    return _frame(MSG_JSON, json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def encode(message: Dict, binary: bool = True) -> bytes:
+    """Koduje komunikat do ramki. Z ``binary=False`` (lub dla nieznanych typów) używa JSON-a."""
+    if binary:
+        msg_type = message.get("type")
+        if msg_type == "action_event" and message.get("action") in ACTION_CODES:
+            return _encode_action(message)
+        if msg_type == "state_delta":
+            return _encode_state_delta(message)
+    return encode_json(message)
+
+
+def _decode_body(msg_type: int, data: bytes, pos: int, end: int) -> Tuple[Dict, int]:
+    """Zwraca (komunikat, pozycja za treścią); odczyt może wyjść poza ``end`` - sprawdza to ``read_frame``."""
+    if msg_type == MSG_JSON:
+        return json.loads(data[pos:end].decode("utf-8")), end
+    if msg_type == MSG_ACTION:
+        table, pos = read_varint(data, pos)
+        hand, pos = read_varint(data, pos)
+        seat, action = data[pos], ACTION_NAMES[data[pos + 1]]
+        amount, pos = read_varint(data, pos + 2)
+        pot, pos = read_varint(data, pos)
+        stack, pos = read_varint(data, pos)
+        return {"type": "action_event", "table": table, "hand": hand, "seat": seat, "action": action,
+                "amount": amount, "pot": pot, "stack": stack}, pos
+    if msg_type == MSG_STATE_DELTA:
+        table, pos = read_varint(data, pos)
+        hand, pos = read_varint(data, pos)
+        pot, pos = read_varint(data, pos)
+        current = data[pos]
+        count = data[pos + 1]
+        pos += 2
+        stacks: List[List[int]] = []
+        for _ in range(count):
+            seat = data[pos]
+            stack, pos = read_varint(data, pos + 1)
+            stacks.append([seat, stack])
+        count = data[pos]
+        pos += 1
+        hands: List[list] = []
+        for _ in range(count):
+            seat, num_cards = data[pos], data[pos + 1]
+            hands.append([seat, list(data[pos + 2:pos + 2 + num_cards])])
+            pos += 2 + num_cards
+        return {"type": "state_delta", "table": table, "hand": hand, "pot": pot,
+                "current_player": None if current == NO_PLAYER else current, "stacks": stacks, "hands": hands}, pos
+    raise ProtocolError(f"Nieznany typ komunikatu: {msg_type}")
+
+
+def read_frame(data: bytes, pos: int = 0) -> Optional[Tuple[Dict, int]]:
+    """Dekoduje ramkę zaczynającą się na ``pos``; None, gdy dane są jeszcze niepełne."""
+    try:
+        length, body_start = read_varint(data, pos)
+    except IndexError:
+        return None
+    if length < 2:
+        raise ProtocolError(f"Ramka krótsza niż nagłówek: {length} B.")
+    end = body_start + length
+    if end > len(data):
+        return None
+    if data[body_start] != PROTOCOL_VERSION:
+        raise ProtocolError(f"Nieobsługiwana wersja protokołu: {data[body_start]}")
+    msg_type = data[body_start + 1]
+    try:
+        message, body_end = _decode_body(msg_type, data, body_start + 2, end)
+    except ProtocolError:
+        raise
+    except (IndexError, ValueError) as e:
+        raise ProtocolError(f"Uszkodzona treść ramki typu {msg_type}: {e}") from e
+    if body_end != end:
+        raise ProtocolError(f"Treść ramki typu {msg_type} ma {body_end - body_start - 2} B zamiast {length - 2} B.")
+    return message, end
+
+
+def decode(frame: bytes) -> Dict:
+    """Dekoduje pojedynczą, kompletną ramkę."""
+    result = read_frame(frame)
+    if result is None:
+        raise ProtocolError("Niepełna ramka.")
+    return result[0]
+
+
+def to_debug_json(frame: bytes) -> str:
+    """Czytelna postać ramki (np. do logów) - ten sam słownik, który zwraca ``decode``."""
+    return json.dumps(decode(frame), ensure_ascii=False)
+
+
+class FrameReader:
+    """Składa ramki z kolejnych fragmentów strumienia (np. danych z gniazda)."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Dict]:
+        """Dodaje dane i zwraca wszystkie komunikaty, które są już kompletne."""
+        self._buffer += data
+        messages = []
+        pos = 0
+        while True:
+            result = read_frame(self._buffer, pos)
+            if result is None:
+                break
+            message, pos = result
+            messages.append(message)
+        del self._buffer[:pos]
+        return messages
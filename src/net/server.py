@@ -0,0 +1,432 @@
+"""Serwer stołów pokerowych oparty na asyncio.
+
+Jeden proces i jedna pętla zdarzeń obsługują wiele stołów naraz. Każdy stół
+prowadzi ``GameEngine.play_round_steps`` - decyzje botów są podejmowane od razu,
+a na decyzje graczy zdalnych stół czeka asynchronicznie (z limitem czasu na akcję),
+nie blokując pozostałych stołów.
+
+Protokół: obiekty JSON, po jednym w linii (UTF-8).
+    klient -> serwer: {"type": "join", "name": "Ala"}
+                      {"type": "action", "id": 7, "action": "raise", "amount": 200}
+                      {"type": "exchange", "id": 8, "indices": [0, 3]}
+    serwer -> klient: {"type": "welcome", "table": 0, "seat": 1}
+                      {"type": "request", "id": 7, "kind": "action", "hand": [...], ...}
+                      {"type": "message", "text": "..."}
+                      {"type": "table_end", "stacks": {...}, "hands": 100}
+
+Wolni klienci nie blokują serwera: komunikaty informacyjne trafiają do ograniczonej
+kolejki wyjściowej i są odrzucane, gdy jest pełna, a klient, który nie odbiera
+nawet żądań decyzji, jest rozłączany.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m src.net.server --port 8765 --seats 4 --remote-seats 1
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from main import Card, Deck, Decision, GameEngine, GameLogger, Player, RuleBasedBotStrategy, SeatStrategy
+
+ACTIONS = ("fold", "check", "call", "bet", "raise")
+MAX_LINE = 64 * 1024
+
+
+def dump_message(message: Dict) -> bytes:
+    return (json.dumps(message, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def load_message(line: bytes) -> Dict:
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Komunikat musi być obiektem JSON.")
+    return message
+
+
+class LatencyRecorder:
+    """Czasy odpowiedzi z ostatnich ``max_samples`` decyzji i ich percentyle."""
+
+    def __init__(self, max_samples: int = 100_000):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.count += 1
+
+    def percentiles(self, points: Tuple[int, ...] = (50, 90, 99)) -> Dict[str, float]:
+        """Percentyle w milisekundach, np. ``{"p50": 1.2, "p99": 8.5}``."""
+        if not self._samples:
+            return {f"p{p}": 0.0 for p in points}
+        ordered = sorted(self._samples)
+        last = len(ordered) - 1
+        return {f"p{p}": ordered[min(last, round(p / 100 * last))] * 1000 for p in points}
+
+
+class Connection:
+    """Połączenie klienta z ograniczoną kolejką wyjściową i osobnym zadaniem zapisującym."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, outbox_size: int):
+        self.reader = reader
+        self.writer = writer
+        self.outbox: asyncio.Queue = asyncio.Queue(maxsize=outbox_size)
+        self.replies: asyncio.Queue = asyncio.Queue(maxsize=16)
+        self.dropped = 0
+        self.closed = False
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                data = await self.outbox.get()
+                if data is None:
+                    break
+                chunks = [data]
+                # Wszystko, co już czeka w kolejce, wysyłamy jednym zapisem.
+                while not self.outbox.empty():
+                    data = self.outbox.get_nowait()
+                    if data is None:
+                        break
+                    chunks.append(data)
+                self.writer.write(b"".join(chunks))
+                await self.writer.drain()
+                if data is None:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.closed = True
+            self.writer.close()
+
+    def send_nowait(self, message: Dict) -> bool:
+        """Komunikat informacyjny - odrzucany (i liczony), gdy klient nie nadąża."""
+        if self.closed:
+            return False
+        try:
+            self.outbox.put_nowait(dump_message(message))
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+    async def send(self, message: Dict, timeout: float) -> bool:
+        """Komunikat, który musi dotrzeć - czeka na miejsce w kolejce najwyżej ``timeout`` sekund."""
+        if self.closed:
+            return False
+        try:
+            await asyncio.wait_for(self.outbox.put(dump_message(message)), timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.close()
+            return False
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.outbox.put_nowait(None)
+        except asyncio.QueueFull:
+            self._writer_task.cancel()
+
+    async def wait_closed(self) -> None:
+        await asyncio.gather(self._writer_task, return_exceptions=True)
+
+
+class RemoteSeat:
+    def __init__(self, connection: Connection, player: Player, seat: int):
+        self.connection = connection
+        self.player = player
+        self.seat = seat
+
+
+class Table:
+    """Stół z ``seats`` miejscami; ``remote_seats`` z nich zajmują klienci, resztę boty."""
+
+    def __init__(self, table_id: int, server: 'TableServer'):
+        self.table_id = table_id
+        self.server = server
+        self.remote: Dict[int, RemoteSeat] = {}
+        self.hands_played = 0
+        self.final_stacks: Dict[str, int] = {}
+        self.finished = False
+        self._next_request_id = 0
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.remote) >= self.server.remote_seats_per_table
+
+    def seat_client(self, connection: Connection, name: str) -> int:
+        seat = len(self.remote)
+        # Karty graczy zdalnych nie mogą trafić do komunikatów dla całego stołu,
+        # dlatego w silniku są oznaczeni jak boty; własną rękę dostają w żądaniach decyzji.
+        player = Player(self.server.initial_stack, name, is_bot=True)
+        self.remote[seat] = RemoteSeat(connection, player, seat)
+        return seat
+
+    def broadcast(self, message: Dict) -> None:
+        for remote in self.remote.values():
+            remote.connection.send_nowait(message)
+
+    async def run(self) -> None:
+        server = self.server
+        players = [remote.player for remote in self.remote.values()]
+        for i in range(len(players), server.seats_per_table):
+            players.append(Player(server.initial_stack, f"Bot_{self.table_id}_{i}", is_bot=True))
+        strategies: List[SeatStrategy] = [RuleBasedBotStrategy() for _ in players]
+        rng = random.Random(server.seed * 1_000_003 + self.table_id) if server.seed is not None else None
+        engine = GameEngine(players, Deck(), server.small_blind, server.big_blind, GameLogger(None),
+                            strategies=strategies,
+                            observer=lambda text: self.broadcast({"type": "message", "text": text}), rng=rng)
+        try:
+            for hand_number in range(1, server.max_hands + 1):
+                if sum(1 for p in players if p.stack > 0) < 2:
+                    break
+                await self._drive(engine, engine.play_round_steps(hand_number))
+                self.hands_played = hand_number
+                # Stoły bez graczy zdalnych nie czekają na nic - oddajemy pętlę innym stołom.
+                await asyncio.sleep(0)
+            self.final_stacks = {p.name: p.stack for p in players}
+            self.broadcast({"type": "table_end", "hands": self.hands_played, "stacks": self.final_stacks})
+        finally:
+            self.finished = True
+            for remote in self.remote.values():
+                remote.connection.close()
+
+    async def _drive(self, engine: GameEngine, steps) -> None:
+        try:
+            decision = next(steps)
+            while True:
+                remote = self.remote.get(decision.seat)
+                if remote is None:
+                    strategy = engine.strategies[decision.seat]
+                    if decision.kind == Decision.ACTION:
+                        answer = strategy.decide_action(engine, decision.player)
+                    else:
+                        answer = strategy.decide_exchange(engine, decision.player)
+                else:
+                    answer = await self._ask(engine, remote, decision)
+                decision = steps.send(answer)
+        except StopIteration:
+            pass
+
+    async def _ask(self, engine: GameEngine, remote: RemoteSeat, decision: Decision):
+        server = self.server
+        player = decision.player
+        to_call = max(0, engine.current_bet_to_match_in_round - player.current_bet_in_round)
+        fallback = ([] if decision.kind == Decision.EXCHANGE
+                    else ("check", 0) if to_call == 0 else ("fold", 0))
+        connection = remote.connection
+        if connection.closed:
+            return fallback
+
+        codes = player.hand_codes()
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        request = {
+            "type": "request", "id": request_id, "kind": decision.kind,
+            "hand": [str(Card.from_code(code)) for code in codes], "codes": codes,
+            "stack": player.stack, "pot": engine.pot, "to_call": to_call,
+            "bet_to_match": engine.current_bet_to_match_in_round, "big_blind": engine.big_blind_amount,
+            "timeout": server.action_timeout,
+        }
+        sent_at = time.perf_counter()
+        if not await connection.send(request, server.action_timeout):
+            return fallback
+        deadline = sent_at + server.action_timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                reply = await asyncio.wait_for(connection.replies.get(), remaining)
+            except asyncio.TimeoutError:
+                server.timeouts += 1
+                server.latency.add(time.perf_counter() - sent_at)
+                return fallback
+            if reply is None:  # klient się rozłączył
+                return fallback
+            if reply.get("id") == request_id:
+                break
+        server.latency.add(time.perf_counter() - sent_at)
+        return self._parse_reply(decision.kind, reply, fallback, to_call, engine.current_bet_to_match_in_round)
+
+    @staticmethod
+    def _parse_reply(kind: str, reply: Dict, fallback, to_call: int = 0, bet_to_match: int = 0):
+        """Odpowiedź klienta jako decyzja dla silnika; niedozwolona akcja zamienia się w ``fallback``.
+
+        Czekanie jest dozwolone tylko, gdy nie ma nic do wyrównania, a zakład lub przebicie
+        nie wyższe niż stawka to sprawdzenie (albo czekanie) - inaczej klient odpowiadający
+        w kółko "check" na zakład zatrzymałby licytację przy stole.
+        """
+        try:
+            if kind == Decision.EXCHANGE:
+                indices = sorted({int(i) for i in reply.get("indices", [])})
+                if all(0 <= i < 5 for i in indices):
+                    return indices
+                return fallback
+            action = reply.get("action")
+            amount = int(reply.get("amount", 0))
+            if action in ("bet", "raise") and amount <= bet_to_match:
+                action = "call"
+            if action == "call" and to_call == 0:
+                action = "check"
+            if action == "check" and to_call > 0:
+                return fallback
+            if action in ACTIONS:
+                return action, amount if action in ("bet", "raise") else 0
+        except (TypeError, ValueError):
+            pass
+        return fallback
+
+
+class TableServer:
+    """Serwer TCP przydzielający klientów do stołów i prowadzący wszystkie stoły w jednej pętli."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, seats_per_table: int = 4,
+                 remote_seats_per_table: int = 1, initial_stack: int = 1000, small_blind: int = 25,
+                 big_blind: int = 50, max_hands: int = 100, action_timeout: float = 10.0,
+                 outbox_size: int = 256, seed: Optional[int] = None):
+        if not 1 <= remote_seats_per_table <= seats_per_table or seats_per_table < 2:
+            raise ValueError("Nieprawidłowa liczba miejsc przy stole.")
+        self.host = host
+        self.port = port
+        self.seats_per_table = seats_per_table
+        self.remote_seats_per_table = remote_seats_per_table
+        self.initial_stack = initial_stack
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.max_hands = max_hands
+        self.action_timeout = action_timeout
+        self.outbox_size = outbox_size
+        self.seed = seed
+        self.tables: List[Table] = []
+        self.latency = LatencyRecorder()
+        self.timeouts = 0
+        self.dropped_messages = 0
+        self._connections: List[Connection] = []
+        self._table_tasks: List[asyncio.Task] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port, limit=MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._table_tasks:
+            task.cancel()
+        await asyncio.gather(*self._table_tasks, return_exceptions=True)
+        for connection in self._connections:
+            connection.close()
+        await asyncio.gather(*(c.wait_closed() for c in self._connections), return_exceptions=True)
+
+    async def wait_tables(self) -> None:
+        """Czeka na zakończenie wszystkich rozpoczętych stołów."""
+        await asyncio.gather(*self._table_tasks, return_exceptions=True)
+
+    def _seat(self, connection: Connection, name: str) -> Tuple[Table, int]:
+        table = self.tables[-1] if self.tables and not self.tables[-1].is_full else None
+        if table is None:
+            table = Table(len(self.tables), self)
+            self.tables.append(table)
+        seat = table.seat_client(connection, name)
+        if table.is_full:
+            self._table_tasks.append(asyncio.create_task(table.run()))
+        return table, seat
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = Connection(reader, writer, self.outbox_size)
+        self._connections.append(connection)
+        try:
+            join = load_message(await reader.readline())
+            if join.get("type") != "join":
+                raise ValueError("Pierwszym komunikatem musi być join.")
+            table, seat = self._seat(connection, str(join.get("name") or f"Gracz_{len(self._connections)}"))
+            connection.send_nowait({"type": "welcome", "table": table.table_id, "seat": seat})
+            while not connection.closed:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = load_message(line)
+                if message.get("type") in ("action", "exchange"):
+                    try:
+                        connection.replies.put_nowait(message)
+                    except asyncio.QueueFull:
+                        connection.dropped += 1  # klient zasypuje serwer odpowiedziami - nadmiar pomijamy
+        except (ValueError, ConnectionError, asyncio.LimitOverrunError, asyncio.IncompleteReadError) as e:
+            connection.send_nowait({"type": "error", "message": str(e)})
+        finally:
+            try:
+                connection.replies.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+            connection.close()
+            self._connections.remove(connection)
+            self.dropped_messages += connection.dropped
+
+    def stats(self) -> Dict:
+        return {
+            "tables": len(self.tables),
+            "running_tables": sum(1 for t in self.tables if t.is_full and not t.finished),
+            "finished_tables": sum(1 for t in self.tables if t.finished),
+            "connections": len(self._connections),
+            "hands": sum(t.hands_played for t in self.tables),
+            "remote_actions": self.latency.count,
+            "timeouts": self.timeouts,
+            "dropped_messages": self.dropped_messages + sum(c.dropped for c in self._connections),
+            "action_latency_ms": self.latency.percentiles(),
+        }
+
+
+async def _report(server: TableServer, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        print(json.dumps(server.stats(), ensure_ascii=False))
+
+
+async def _serve(args) -> None:
+    server = TableServer(args.host, args.port, args.seats, args.remote_seats, args.stack, args.small_blind,
+                         args.big_blind, args.max_hands, args.timeout, seed=args.seed)
+    await server.start()
+    print(f"Serwer nasłuchuje na {server.host}:{server.port}")
+    reporter = asyncio.create_task(_report(server, args.report_interval))
+    try:
+        await server.serve_forever()
+    finally:
+        reporter.cancel()
+        await server.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serwer stołów pokera dobieranego (asyncio, JSON w liniach).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seats", type=int, default=4)
+    parser.add_argument("--remote-seats", type=int, default=1)
+    parser.add_argument("--stack", type=int, default=1000)
+    parser.add_argument("--small-blind", type=int, default=25)
+    parser.add_argument("--big-blind", type=int, default=50)
+    parser.add_argument("--max-hands", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Limit czasu na decyzję gracza (s).")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--report-interval", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Dokładne odtwarzanie zapisanych rozdań przez ``GameEngine``.
+
+Rekord rozdania (``GameEngine.hand_record``) zawiera ziarno talii, blindy, stosy
+na początku rozdania i wszystkie decyzje graczy w kolejności ich podjęcia.
+``replay_hand`` odtwarza z nich rozdanie w silniku bez konsoli: talia jest
+zasiewana tym samym ziarnem, a zamiast strategii odpowiedzi podaje zapis.
+``verify_hand`` porównuje wynik z zapisanym - zmiana w silniku, która zmienia
+przebieg gry, daje ``ReplayMismatch``.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m src.sim.replay data/session_<id>.jsonl [--hand N]
+"""
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence
+
+from main import Decision, GameEngine, Player
+from src.fileops.history_reader import HandHistoryReader
+
+# Pola wyniku rozdania, które musi odtworzyć silnik.
+RESULT_FIELDS = ("dealer", "pot", "stacks", "winners", "showdown")
+
+
+class ReplayMismatch(ValueError):
+    """Odtworzone rozdanie rozeszło się z zapisem."""
+
+
+def replay_hand(record: Dict, names: Optional[List[str]] = None) -> GameEngine:
+    """Odtwarza rozdanie z rekordu i zwraca silnik w stanie po jego zakończeniu."""
+    stacks = record["start_stacks"]
+    if names is None:
+        names = [f"Gracz_{seat + 1}" for seat in range(len(stacks))]
+    players = [Player(stack, name, is_bot=True) for stack, name in zip(stacks, names)]
+    small_blind, big_blind = record["blinds"]
+    engine = GameEngine.create_headless(players, small_blind, big_blind)
+    # Silnik przesuwa przycisk o jedno miejsce na początku rozdania.
+    engine.dealer_button_idx = (record["dealer"] - 1) % len(players)
+
+    actions = iter(record["actions"])
+    steps = engine.play_round_steps(record["round"], hand_seed=record["seed"])
+    try:
+        decision = next(steps)
+        while True:
+            entry = next(actions, None)
+            if entry is None:
+                raise ReplayMismatch(f"Rozdanie #{record['round']}: silnik czeka na decyzję "
+                                     f"({decision.kind}, miejsce {decision.seat}), a zapis się skończył.")
+            seat, kind, answer = entry
+            if (seat, kind) != (decision.seat, decision.kind):
+                raise ReplayMismatch(f"Rozdanie #{record['round']}: silnik czeka na ({decision.kind}, miejsce "
+                                     f"{decision.seat}), a zapis zawiera ({kind}, miejsce {seat}).")
+            decision = steps.send(tuple(answer) if kind == Decision.ACTION else answer)
+    except StopIteration:
+        pass
+    if next(actions, None) is not None:
+        raise ReplayMismatch(f"Rozdanie #{record['round']} zakończyło się przed wykorzystaniem całego zapisu.")
+    return engine
+
+
+def verify_hand(record: Dict) -> None:
+    """Odtwarza rozdanie i sprawdza, czy wynik zgadza się z zapisanym."""
+    result = replay_hand(record).hand_record(record["round"])
+    differences = [field for field in RESULT_FIELDS if field in record and result[field] != record[field]]
+    if differences:
+        raise ReplayMismatch(f"Rozdanie #{record['round']}: różne pola: "
+                             + ", ".join(f"{f} (zapis {record[f]}, odtworzenie {result[f]})" for f in differences))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Odtwarzanie i weryfikacja zapisanych rozdań.")
+    parser.add_argument("history", help="Plik historii rozdań (JSONL).")
+    parser.add_argument("--hand", type=int, default=None, help="Numer rozdania w pliku (od 0).")
+    args = parser.parse_args(argv)
+
+    with HandHistoryReader(args.history) as reader:
+        records = [reader.get_hand(args.hand)] if args.hand is not None else reader.hands()
+        replayed = failed = 0
+        start = time.perf_counter()
+        for record in records:
+            try:
+                verify_hand(record)
+            except ReplayMismatch as e:
+                failed += 1
+                print(e)
+            replayed += 1
+        elapsed = time.perf_counter() - start
+    print(f"Odtworzono {replayed} rozdań ({replayed / max(elapsed, 1e-9):.0f}/s), niezgodnych: {failed}")
+
+
+if __name__ == "__main__":
+    main()
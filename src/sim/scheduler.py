@@ -0,0 +1,269 @@
+"""Wiele stołów w jednym procesie: kooperacyjne prowadzenie ``GameEngine`` krok po kroku.
+
+Każdy stół to generator ``GameEngine.play_round_steps``. Jeden takt (``tick``)
+wykonuje dokładnie jeden krok jednego stołu: odpowiedź na jedną decyzję albo
+rozpoczęcie nowego rozdania (do pierwszej decyzji). Stoły gotowe do ruchu czekają
+w dwóch kolejkach obsługiwanych po kolei (round-robin):
+
+  - szybkiej - następną decyzję podejmuje bot, więc krok zajmie chwilę;
+  - zwykłej - odpowiedź gracza zewnętrznego (``ExternalSeat``) właśnie nadeszła
+    przez ``submit``.
+
+Na ``fast_weight`` kroków z kolejki szybkiej przypada jeden z kolejki zwykłej,
+więc stoły z graczami zewnętrznymi nie są zagłodzone. Stół czekający na gracza
+zewnętrznego nie zajmuje żadnej kolejki (``waiting``).
+
+Po każdym rozdaniu gracze bez żetonów opuszczają stół. Gdy przy stole zostaje
+mniej niż dwóch graczy z żetonami, pozostały gracz przesiada się do stołu
+z wolnym miejscem (dołącza na początku jego następnego rozdania); stół bez
+graczy jest zamykany, a jeśli wolnego miejsca nie ma, stół czeka bezczynnie,
+aż dosiądzie się ktoś z innego stołu. Stoły z wolnymi miejscami są w kopcu
+uporządkowanym jak przy wyborze stołu docelowego, więc przesiadka nie wymaga
+przeglądania wszystkich stołów.
+
+Przykład:
+    scheduler = TableScheduler()
+    for table in range(1000):
+        scheduler.add_table(GameEngine.create_headless(Player.create_players(6, 1000), 25, 50))
+    scheduler.run()
+"""
+import heapq
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from main import Decision, GameEngine, Player, SeatStrategy
+
+
+class ExternalSeat(SeatStrategy):
+    """Miejsce, którego decyzje przychodzą z zewnątrz (``TableScheduler.submit``)."""
+
+    def decide_action(self, engine: GameEngine, player: Player):
+        raise RuntimeError("Decyzję gracza zewnętrznego przekazuje się przez TableScheduler.submit.")
+
+    decide_exchange = decide_action
+
+
+class ScheduledTable:
+    """Stan stołu w harmonogramie: silnik, bieżące rozdanie i oczekujący gracze."""
+    __slots__ = ('table_id', 'engine', 'steps', 'decision', 'answer', 'hands_played', 'max_hands',
+                 'arrivals', 'state', 'open_key')
+
+    READY = "ready"
+    WAITING = "waiting"  # czeka na odpowiedź gracza zewnętrznego
+    IDLE = "idle"  # za mało graczy, czeka na przesiadkę z innego stołu
+    FINISHED = "finished"
+
+    def __init__(self, table_id: int, engine: GameEngine, max_hands: Optional[int]):
+        self.table_id = table_id
+        self.engine = engine
+        self.steps = None  # generator bieżącego rozdania
+        self.decision: Optional[Decision] = None
+        self.answer: Any = None
+        self.hands_played = 0
+        self.max_hands = max_hands
+        self.arrivals: List[tuple] = []  # (gracz, strategia) dosiadający się od następnego rozdania
+        self.state = ScheduledTable.READY
+        self.open_key: Optional[Tuple[bool, int, int]] = None  # aktualny wpis w kopcu wolnych miejsc
+
+    @property
+    def seat_key(self) -> Tuple[bool, int, int]:
+        """Kolejność wyboru stołu docelowego: najpierw grające, najmniej obsadzone, o najniższym numerze."""
+        return (self.state == ScheduledTable.IDLE, self.seated, self.table_id)
+
+    @property
+    def seated(self) -> int:
+        return len(self.engine.players) + len(self.arrivals)
+
+
+class TableScheduler:
+    """Prowadzi wiele stołów w jednym wątku, po jednym kroku na takt."""
+
+    def __init__(self, max_seats: int = 6, fast_weight: int = 4,
+                 on_hand_end: Optional[Callable[[ScheduledTable], None]] = None):
+        if fast_weight < 1:
+            raise ValueError("fast_weight musi być dodatnie.")
+        self.max_seats = max_seats
+        self.fast_weight = fast_weight
+        self.on_hand_end = on_hand_end
+        self.tables: Dict[int, ScheduledTable] = {}
+        self._fast: Deque[ScheduledTable] = deque()
+        self._normal: Deque[ScheduledTable] = deque()
+        self._fast_streak = 0
+        # Kopiec wolnych miejsc: wpisy ``seat_key``; nieaktualne (stół zmienił ``open_key``) są pomijane.
+        self._open: List[Tuple[bool, int, int]] = []
+        self._next_id = 0
+        self.ticks = 0
+        self.hands_played = 0
+        self.moves = 0
+        self.eliminated: List[Player] = []
+
+    def add_table(self, engine: GameEngine, max_hands: Optional[int] = None) -> int:
+        if len(engine.players) > self.max_seats:
+            raise ValueError(f"Stół ma więcej graczy ({len(engine.players)}) niż max_seats={self.max_seats}.")
+        table = ScheduledTable(self._next_id, engine, max_hands)
+        self._next_id += 1
+        self.tables[table.table_id] = table
+        self._fast.append(table)
+        self._index(table)
+        return table.table_id
+
+    @property
+    def waiting(self) -> Dict[int, Decision]:
+        """Decyzje, na które czekają stoły z graczami zewnętrznymi (numer stołu -> decyzja)."""
+        return {t.table_id: t.decision for t in self.tables.values() if t.state == ScheduledTable.WAITING}
+
+    def submit(self, table_id: int, answer: Any) -> None:
+        """Przekazuje odpowiedź gracza zewnętrznego; stół trafia do kolejki zwykłej."""
+        table = self.tables[table_id]
+        if table.state != ScheduledTable.WAITING:
+            raise ValueError(f"Stół {table_id} nie czeka na decyzję.")
+        table.answer = answer
+        table.state = ScheduledTable.READY
+        self._normal.append(table)
+
+    def tick(self) -> bool:
+        """Wykonuje jeden krok jednego stołu; False, gdy żaden stół nie jest gotowy."""
+        if self._normal and (not self._fast or self._fast_streak >= self.fast_weight):
+            table = self._normal.popleft()
+            self._fast_streak = 0
+        elif self._fast:
+            table = self._fast.popleft()
+            self._fast_streak += 1
+        else:
+            return False
+        self.ticks += 1
+        self._step(table)
+        return True
+
+    def run(self, max_ticks: Optional[int] = None) -> int:
+        """Wykonuje takty, dopóki są gotowe stoły (lub do ``max_ticks``); zwraca ich liczbę."""
+        done = 0
+        tick = self.tick
+        while max_ticks is None or done < max_ticks:
+            if not tick():
+                break
+            done += 1
+        return done
+
+    def stats(self) -> Dict[str, int]:
+        states = [t.state for t in self.tables.values()]
+        return {
+            "tables": len(states),
+            "ready": states.count(ScheduledTable.READY),
+            "waiting": states.count(ScheduledTable.WAITING),
+            "idle": states.count(ScheduledTable.IDLE),
+            "finished": states.count(ScheduledTable.FINISHED),
+            "ticks": self.ticks,
+            "hands_played": self.hands_played,
+            "moves": self.moves,
+            "eliminated": len(self.eliminated),
+        }
+
+    # --- Kroki stołu ---
+
+    def _step(self, table: ScheduledTable) -> None:
+        engine = table.engine
+        try:
+            if table.steps is None:
+                self._seat_arrivals(table)
+                table.steps = engine.play_round_steps(table.hands_played + 1)
+                decision = next(table.steps)
+            else:
+                if table.answer is not None:
+                    answer, table.answer = table.answer, None
+                else:
+                    decision = table.decision
+                    strategy = engine.strategies[decision.seat]
+                    if decision.kind == Decision.ACTION:
+                        answer = strategy.decide_action(engine, decision.player)
+                    else:
+                        answer = strategy.decide_exchange(engine, decision.player)
+                decision = table.steps.send(answer)
+        except StopIteration:
+            table.steps = table.decision = None
+            self._finish_hand(table)
+            return
+        table.decision = decision
+        if isinstance(engine.strategies[decision.seat], ExternalSeat):
+            table.state = ScheduledTable.WAITING
+        else:
+            self._fast.append(table)
+
+    def _finish_hand(self, table: ScheduledTable) -> None:
+        table.hands_played += 1
+        self.hands_played += 1
+        if self.on_hand_end is not None:
+            self.on_hand_end(table)
+        engine = table.engine
+        eliminated = len(self.eliminated)
+        for idx in range(len(engine.players) - 1, -1, -1):
+            if engine.players[idx].stack <= 0:
+                self.eliminated.append(engine.remove_player(idx)[0])
+        if table.max_hands is not None and table.hands_played >= table.max_hands:
+            table.state = ScheduledTable.FINISHED
+            return
+        if len(self.eliminated) != eliminated:
+            self._index(table)
+        if len(engine.players) + len(table.arrivals) >= 2:
+            self._fast.append(table)
+            return
+        self._rebalance(table)
+
+    def _rebalance(self, table: ScheduledTable) -> None:
+        """Przesadza ostatniego gracza stołu do innego stołu albo zostawia stół bezczynny."""
+        engine = table.engine
+        if engine.players:
+            target = self._find_seat(table)
+            if target is None:
+                table.state = ScheduledTable.IDLE
+                self._index(table)
+                return
+            target.arrivals.append(engine.remove_player(0))
+            self.moves += 1
+            if target.state == ScheduledTable.IDLE and target.seated >= 2:
+                target.state = ScheduledTable.READY
+                self._fast.append(target)
+            self._index(target)
+        table.state = ScheduledTable.FINISHED
+
+    def _index(self, table: ScheduledTable) -> None:
+        """Dopisuje stół do kopca wolnych miejsc po zmianie obsady lub stanu."""
+        key = table.seat_key
+        if key == table.open_key:
+            return
+        table.open_key = key
+        heapq.heappush(self._open, key)
+        if len(self._open) > 4 * len(self.tables) + 64:
+            # Zbyt wiele nieaktualnych wpisów - kopiec budowany od nowa z bieżących.
+            self._open = [t.open_key for t in self.tables.values()
+                          if t.open_key is not None and t.state != ScheduledTable.FINISHED]
+            heapq.heapify(self._open)
+
+    def _find_seat(self, source: ScheduledTable) -> Optional[ScheduledTable]:
+        """Stół z wolnym miejscem: najpierw grający (najmniej obsadzony), potem bezczynny."""
+        heap = self._open
+        found = None
+        source_key = None
+        while heap:
+            key = heap[0]
+            table = self.tables[key[2]]
+            if key != table.open_key:
+                heapq.heappop(heap)  # nieaktualny wpis
+            elif table.state == ScheduledTable.FINISHED or table.seated >= self.max_seats:
+                heapq.heappop(heap)
+                table.open_key = None  # wróci do kopca przy zmianie obsady
+            elif table is source:
+                source_key = heapq.heappop(heap)
+            else:
+                found = table
+                break
+        if source_key is not None:
+            heapq.heappush(heap, source_key)
+        return found
+
+    @staticmethod
+    def _seat_arrivals(table: ScheduledTable) -> None:
+        engine = table.engine
+        for player, strategy in table.arrivals:
+            engine.seat_player(player, strategy)
+        table.arrivals.clear()
@@ -0,0 +1,160 @@
+"""Wsadowy symulator turniejów botów rozgrywanych w wielu procesach.
+
+Każda gra dostaje własne ziarno wyprowadzone z ziarna głównego, a wyniki są
+sumowane niezależnie od kolejności zakończenia gier, więc dla tego samego
+``master_seed`` wynik nie zależy od liczby procesów.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python -m src.sim.simulate --games 1000 --players 4 --workers 8 --seed 1
+"""
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from main import GameEngine, Player
+from src.logic.evaluator import CATEGORY_NAMES, category_of
+
+
+def game_seeds(master_seed: int, num_games: int) -> List[int]:
+    """Wyprowadza ziarna kolejnych gier z ziarna głównego."""
+    seed_rng = random.Random(master_seed)
+    return [seed_rng.getrandbits(63) for _ in range(num_games)]
+
+
+def _empty_totals(num_players: int, max_hands: int) -> Dict:
+    return {
+        "games": 0,
+        "hands": 0,
+        "games_won": [0] * num_players,
+        "hands_won": [0] * num_players,
+        "final_stack_sum": [0] * num_players,
+        "trajectory_sum": [[0] * max_hands for _ in range(num_players)],
+        "hand_categories": [0] * len(CATEGORY_NAMES),
+    }
+
+
+def _merge_totals(into: Dict, other: Dict) -> None:
+    into["games"] += other["games"]
+    into["hands"] += other["hands"]
+    for key in ("games_won", "hands_won", "final_stack_sum", "hand_categories"):
+        into[key] = [a + b for a, b in zip(into[key], other[key])]
+    for seat, row in enumerate(other["trajectory_sum"]):
+        into["trajectory_sum"][seat] = [a + b for a, b in zip(into["trajectory_sum"][seat], row)]
+
+
+def play_game(seed: int, num_players: int, initial_stack: int, small_blind: int, big_blind: int,
+              max_hands: int, totals: Dict) -> None:
+    """Rozgrywa jedną grę botów i dopisuje jej wyniki do ``totals``."""
+    players = Player.create_players(num_players, initial_stack)
+    engine = GameEngine.create_headless(players, small_blind, big_blind, rng=random.Random(seed))
+    stacks = [initial_stack] * num_players
+    hands_played = 0
+    for hand_number in range(1, max_hands + 1):
+        if sum(1 for p in players if p.stack > 0) < 2:
+            break
+        engine.play_round(hand_number)
+        hands_played += 1
+        for seat, player in enumerate(players):
+            if player.stack > stacks[seat]:
+                totals["hands_won"][seat] += 1
+            stacks[seat] = player.stack
+        for _, strength in engine.last_showdown:
+            totals["hand_categories"][category_of(strength)] += 1
+        for seat in range(num_players):
+            totals["trajectory_sum"][seat][hand_number - 1] += stacks[seat]
+
+    # Po zakończeniu gry stosy nie zmieniają się już do końca trajektorii.
+    for seat in range(num_players):
+        row = totals["trajectory_sum"][seat]
+        for hand_idx in range(hands_played, max_hands):
+            row[hand_idx] += stacks[seat]
+        totals["final_stack_sum"][seat] += stacks[seat]
+    totals["games_won"][max(range(num_players), key=lambda seat: stacks[seat])] += 1
+    totals["games"] += 1
+    totals["hands"] += hands_played
+
+
+def _run_chunk(seeds: Sequence[int], num_players: int, initial_stack: int, small_blind: int, big_blind: int,
+               max_hands: int) -> Dict:
+    totals = _empty_totals(num_players, max_hands)
+    for seed in seeds:
+        play_game(seed, num_players, initial_stack, small_blind, big_blind, max_hands, totals)
+    return totals
+
+
+def simulate(num_games: int, num_players: int = 4, initial_stack: int = 1000, small_blind: int = 25,
+             big_blind: int = 50, max_hands: int = 200, master_seed: int = 0,
+             workers: Optional[int] = None, chunk_size: Optional[int] = None) -> Dict:
+    """Rozgrywa ``num_games`` niezależnych gier i zwraca zagregowane wyniki.
+
+    Wynik zawiera odsetek wygranych gier i rozdań dla każdego miejsca, średnią
+    trajektorię stosów (stos po każdym rozdaniu) oraz liczność kategorii układów
+    pokazanych w showdownie.
+    """
+    if num_players < 2:
+        raise ValueError("Symulacja wymaga co najmniej dwóch graczy.")
+    workers = workers or os.cpu_count() or 1
+    seeds = game_seeds(master_seed, num_games)
+    if chunk_size is None:
+        chunk_size = max(1, -(-num_games // (workers * 4)))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, num_games, chunk_size)]
+    args = (num_players, initial_stack, small_blind, big_blind, max_hands)
+
+    totals = _empty_totals(num_players, max_hands)
+    if workers == 1:
+        for chunk in chunks:
+            _merge_totals(totals, _run_chunk(chunk, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_chunk, chunk, *args) for chunk in chunks]
+            for future in futures:
+                _merge_totals(totals, future.result())
+
+    games = max(totals["games"], 1)
+    hands = max(totals["hands"], 1)
+    return {
+        "master_seed": master_seed,
+        "games": totals["games"],
+        "hands": totals["hands"],
+        "num_players": num_players,
+        "games_won": totals["games_won"],
+        "win_rate": [won / games for won in totals["games_won"]],
+        "hands_won": totals["hands_won"],
+        "hand_win_rate": [won / hands for won in totals["hands_won"]],
+        "final_stack_mean": [total / games for total in totals["final_stack_sum"]],
+        "chip_trajectory_mean": [[total / games for total in row] for row in totals["trajectory_sum"]],
+        "hand_categories": dict(zip(CATEGORY_NAMES, totals["hand_categories"])),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Symulacja wielu gier botów w pokera dobieranego.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--stack", type=int, default=1000)
+    parser.add_argument("--small-blind", type=int, default=25)
+    parser.add_argument("--big-blind", type=int, default=50)
+    parser.add_argument("--max-hands", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default=None, help="Plik JSON z pełnymi wynikami.")
+    args = parser.parse_args(argv)
+
+    result = simulate(args.games, args.players, args.stack, args.small_blind, args.big_blind,
+                      args.max_hands, args.seed, args.workers)
+    print(f"Gry: {result['games']}, rozdania: {result['hands']}")
+    for seat in range(result["num_players"]):
+        print(f"  Miejsce {seat}: wygrane gry {result['win_rate'][seat]:.1%}, "
+              f"wygrane rozdania {result['hand_win_rate'][seat]:.1%}, "
+              f"średni stos końcowy {result['final_stack_mean'][seat]:.0f}")
+    print("Układy w showdownie:", result["hand_categories"])
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=4, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Korpus skryptowanych rund licytacji do testów regresji ``GameEngine._betting_round``.
+
+Scenariusze są losowane z ustalonego ziarna, rozgrywane przez silnik, a ich przebieg
+(kolejne decyzje, zdarzenia i końcowy stan stołu) zapisywany w ``data/betting_corpus.json``.
+Nagranie odtwarza się poleceniem:
+    python tests/betting_corpus.py
+"""
+import json
+import os
+import random
+import sys
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import GameEngine, GameLogger, Player, SeatStrategy  # noqa: E402
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "betting_corpus.json")
+ACTIONS = ("fold", "check", "call", "bet", "raise")
+
+
+class ScriptedStrategy(SeatStrategy):
+    """Zwraca kolejne decyzje ze wspólnego skryptu; po jego wyczerpaniu sprawdza."""
+
+    def __init__(self, script: List, decisions: List):
+        self.script = script
+        self.decisions = decisions
+
+    def decide_action(self, engine, player):
+        if self.script:
+            action, delta = self.script.pop(0)
+            amount = engine.current_bet_to_match_in_round + delta if action in ("bet", "raise") else 0
+        else:
+            action, amount = "call", 0
+        self.decisions.append([engine.players.index(player), action, amount])
+        return action, amount
+
+    def decide_exchange(self, engine, player):
+        return []
+
+
+class ReplayStrategy(SeatStrategy):
+    """Odtwarza zapisane decyzje, sprawdzając, że pyta o nie właściwe miejsce."""
+
+    def __init__(self, decisions: List):
+        self.decisions = list(decisions)
+
+    def decide_action(self, engine, player):
+        seat, action, amount = self.decisions.pop(0)
+        assert engine.players.index(player) == seat, "Silnik pyta o decyzję inne miejsce niż w nagraniu"
+        return action, amount
+
+    def decide_exchange(self, engine, player):
+        return []
+
+
+def random_scenario(rng: random.Random) -> Dict:
+    num_players = rng.randint(2, 10)
+    big_blind = rng.choice((10, 20, 50))
+    stacks = [rng.choice((0, big_blind // 2, big_blind, 3 * big_blind, rng.randint(1, 40) * big_blind))
+              for _ in range(num_players)]
+    folded = [rng.random() < 0.15 for _ in range(num_players)]
+    bets = [0] * num_players
+    sb, bb = rng.sample(range(num_players), 2)
+    for seat, blind in ((sb, big_blind // 2), (bb, big_blind)):
+        stacks[seat] += blind
+        bets[seat] = blind
+        folded[seat] = False
+    script = []
+    for _ in range(rng.randint(0, 4 * num_players)):
+        action = rng.choices(ACTIONS, weights=(2, 2, 4, 1, 2))[0]
+        delta = rng.choice((-big_blind, 0, big_blind, 2 * big_blind, rng.randint(1, 60) * big_blind))
+        script.append([action, delta if action in ("bet", "raise") else 0])
+    return {
+        "stacks": stacks,
+        "bets": bets,
+        "folded": folded,
+        "start": rng.randrange(num_players),
+        "big_blind": big_blind,
+        "script": script,
+    }
+
+
+def _setup(scenario: Dict, strategy_factory):
+    players = [Player(stack, f"P{seat}", is_bot=True) for seat, stack in enumerate(scenario["stacks"])]
+    for player, bet, folded in zip(players, scenario["bets"], scenario["folded"]):
+        player.pay_money(bet)
+        player.current_bet_in_round = bet
+        player.is_folded = folded
+    events = []
+    logger = GameLogger(None)
+    logger.event = lambda event_type, **fields: events.append([event_type, fields["player"], fields["amount"],
+                                                               fields["pot"]])
+    strategy = strategy_factory()
+    engine = GameEngine(players, None, scenario["big_blind"] // 2, scenario["big_blind"], logger,
+                        strategies=[strategy] * len(players), observer=None)
+    engine.pot = sum(scenario["bets"])
+    engine.current_bet_to_match_in_round = max(scenario["bets"])
+    return engine, events
+
+
+def final_state(engine: GameEngine) -> Dict:
+    return {
+        "stacks": [p.stack for p in engine.players],
+        "bets": [p.current_bet_in_round for p in engine.players],
+        "folded": [p.is_folded for p in engine.players],
+        "pot": engine.pot,
+        "bet_to_match": engine.current_bet_to_match_in_round,
+    }
+
+
+def record(scenario: Dict) -> Dict:
+    decisions: List = []
+    engine, events = _setup(scenario, lambda: ScriptedStrategy([list(step) for step in scenario["script"]],
+                                                               decisions))
+    engine._betting_round(scenario["start"])
+    return {"scenario": scenario, "decisions": decisions, "events": events, "final": final_state(engine)}
+
+
+def replay(entry: Dict):
+    """Rozgrywa nagrany scenariusz ponownie i zwraca (zdarzenia, stan końcowy, niezużyte decyzje)."""
+    strategy = ReplayStrategy(entry["decisions"])
+    engine, events = _setup(entry["scenario"], lambda: strategy)
+    engine._betting_round(entry["scenario"]["start"])
+    return events, final_state(engine), strategy.decisions
+
+
+def build_corpus(num_scenarios: int = 400, seed: int = 2025) -> List[Dict]:
+    rng = random.Random(seed)
+    return [record(random_scenario(rng)) for _ in range(num_scenarios)]
+
+
+if __name__ == "__main__":
+    corpus = build_corpus()
+    os.makedirs(os.path.dirname(CORPUS_PATH), exist_ok=True)
+    with open(CORPUS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(corpus, f, separators=(",", ":"))
+        f.write("\n")
+    print(f"Zapisano {len(corpus)} scenariuszy do {CORPUS_PATH}")
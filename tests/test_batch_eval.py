@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from main import Card, Player
+from src.logic.evaluator import evaluate5, STRAIGHT, STRAIGHT_FLUSH, ROYAL_FLUSH
+
+np = pytest.importorskip("numpy")
+
+from src.logic.batch_eval import categories_of, evaluate_array  # noqa: E402
+
+
+def test_matches_scalar_evaluator_on_random_hands():
+    rng = random.Random(11)
+    hands = np.array([rng.sample(range(52), 5) for _ in range(20000)], dtype=np.int16)
+    expected = np.array([evaluate5(*map(int, row)) for row in hands])
+    assert (evaluate_array(hands) == expected).all()
+
+
+def test_wheel_and_royal_flush_match_player_hand_rank():
+    specs = [
+        [('A', 'h'), ('5', 'd'), ('4', 'c'), ('3', 's'), ('2', 'h')],
+        [('A', 'c'), ('5', 'c'), ('4', 'c'), ('3', 'c'), ('2', 'c')],
+        [('A', 's'), ('K', 's'), ('Q', 's'), ('J', 's'), ('10', 's')],
+    ]
+    rows = []
+    for spec in specs:
+        player = Player(100, "P")
+        for rank, suit in spec:
+            player.take_card(Card(rank, suit))
+        rows.append(player.hand_codes())
+        assert player.hand_rank()[2] == ([5, 4, 3, 2, 1] if spec[0][0] == 'A' and spec[1][0] == '5'
+                                         else [14, 13, 12, 11, 10])
+    strengths = evaluate_array(np.array(rows))
+    assert list(categories_of(strengths)) == [STRAIGHT, STRAIGHT_FLUSH, ROYAL_FLUSH]
+    assert strengths[0] < strengths[1] < strengths[2]
+
+
+def test_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        evaluate_array(np.zeros((3, 4), dtype=np.int64))
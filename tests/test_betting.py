@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from betting_corpus import CORPUS_PATH, replay
+from main import Player
+from src.logic import betting
+from src.logic.betting import BettingRound
+from src.logic.table_state import TableState
+
+
+def load_corpus():
+    with open(CORPUS_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_engine_matches_recorded_betting_corpus():
+    corpus = load_corpus()
+    assert len(corpus) >= 100
+    for number, entry in enumerate(corpus):
+        events, final, unused = replay(entry)
+        assert unused == [], f"scenariusz {number}: silnik zakończył licytację za wcześnie"
+        assert events == entry["events"], f"scenariusz {number}: inny przebieg licytacji"
+        assert final == entry["final"], f"scenariusz {number}: inny stan końcowy"
+
+
+def test_step_api_tracks_queue_aggressor_and_counters():
+    players = [Player(1000, f"P{i}") for i in range(4)]
+    for player, blind in zip(players[1:3], (25, 50)):
+        player.pay_money(blind)
+        player.current_bet_in_round = blind
+    rnd = BettingRound(TableState(players), start_idx=3, bet_to_match=50, pot=75)
+    assert rnd.queue == (3, 0, 1, 2)
+
+    assert rnd.next_to_act() == 3
+    assert rnd.apply_action("raise", 150) == ("raise", 150)
+    assert rnd.last_aggressor == 3 and rnd.queue == (0, 1, 2)
+    assert rnd.next_to_act() == 0
+    assert rnd.apply_action("fold") == ("fold", 0)
+    assert rnd.next_to_act() == 1
+    assert rnd.apply_action("bet", 100) == ("call", 125)  # zakład poniżej stawki to sprawdzenie
+    assert rnd.next_to_act() == 2
+    assert rnd.apply_action("call") == ("call", 100)
+    assert rnd.next_to_act() is None
+    assert rnd.end_reason == betting.ORBIT_COMPLETE
+    assert (rnd.pot, rnd.bet_to_match, rnd.active_count, rnd.all_in_count) == (450, 150, 3, 0)
+    with pytest.raises(RuntimeError):
+        rnd.apply_action("check")
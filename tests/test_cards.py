@@ -0,0 +1,30 @@
+import pickle
+
+import pytest
+
+from main import Card, Deck
+from src.logic import cards
+from src.logic.evaluator import evaluate, evaluate5
+
+
+def test_cards_are_interned():
+    assert Card('A', 's') is Card('A', 's')
+    assert Card.from_code(cards.encode('10', 'h')) is Card('10', 'h')
+    assert pickle.loads(pickle.dumps(Card('Q', 'd'))) is Card('Q', 'd')
+    deck_a, deck_b = Deck(), Deck()
+    assert all(a is b for a, b in zip(deck_a.cards, deck_b.cards))
+    assert len({card.code for card in deck_a.cards}) == cards.NUM_CARDS
+
+
+def test_encoding_round_trip():
+    for code in range(cards.NUM_CARDS):
+        rank, suit = cards.decode(code)
+        assert cards.encode(rank, suit) == code
+        assert Card.from_code(code).get_rank_value() == Card.RANK_ORDER[rank]
+    with pytest.raises(ValueError):
+        cards.encode('1', 's')
+
+
+def test_evaluate5_matches_evaluate():
+    hand = [Card('A', 'h'), Card('2', 's'), Card('3', 'd'), Card('4', 'c'), Card('5', 's')]
+    assert evaluate5(*(c.code for c in hand)) == evaluate([c.get_rank_value() for c in hand], [c.suit for c in hand])
@@ -0,0 +1,55 @@
+import json
+import random
+
+import pytest
+
+from main import GameEngine, Player
+from src.fileops.session_manager import SessionManager
+from src.logic.evaluator import CATEGORY_NAMES
+
+np = pytest.importorskip("numpy")
+
+from src.fileops.columnar import HandStore, export_history  # noqa: E402
+
+
+def record_game(sm, game_id, hands, seed):
+    players = Player.create_players(4, 1000)
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(seed))
+    for hand_number in range(1, hands + 1):
+        if sum(1 for p in players if p.stack > 0) < 2:
+            break
+        engine.play_round(hand_number)
+        sm.append_hand_history(game_id, engine.hand_record(hand_number))
+
+
+def test_export_matches_aggregates_computed_from_json(tmp_path):
+    sm = SessionManager(data_dir=str(tmp_path))
+    record_game(sm, "cols", 60, seed=5)
+    jsonl = str(tmp_path / "session_cols.jsonl")
+    with open(jsonl, encoding="utf-8") as f:
+        hands = [json.loads(line) for line in f]
+
+    export_history(jsonl, str(tmp_path / "cols.npz"))
+    store = HandStore.load(str(tmp_path / "cols.npz"))
+    assert len(store) == len(hands)
+    assert store.columns["pot"].tolist() == [h["pot"] for h in hands]
+
+    rates = store.win_rate_by_seat()
+    for seat in range(4):
+        won = sum(1 for h in hands if any(s == seat for s, _ in h["winners"]))
+        assert rates[seat] == pytest.approx(won / len(hands))
+    assert sum(store.winnings_by_seat().values()) == sum(h["pot"] for h in hands)
+
+    expected = dict.fromkeys(CATEGORY_NAMES, 0)
+    for h in hands:
+        for _, category in h["showdown"]:
+            expected[CATEGORY_NAMES[category]] += 1
+    assert store.category_frequency() == expected
+    assert store.pot_distribution()["p50"] == pytest.approx(float(np.median([h["pot"] for h in hands])))
+
+
+def test_empty_history(tmp_path):
+    path = tmp_path / "session_empty.jsonl"
+    path.write_text("")
+    store = HandStore.from_jsonl(str(path))
+    assert len(store) == 0 and store.win_rate_by_seat() == {} and store.pot_distribution() == {}
@@ -0,0 +1,38 @@
+import random
+
+from main import Card, Deck
+
+
+def test_shuffled_deck_deals_every_card_once():
+    deck = Deck(random.Random(7))
+    deck.shuffle()
+    dealt = deck.deal_many(60)
+    assert len(dealt) == 52 and len(set(dealt)) == 52
+    assert deck.deal_one() is None and len(deck) == 0
+
+
+def test_seeded_decks_are_reproducible():
+    first, second = Deck(random.Random(3)), Deck(random.Random(3))
+    first.shuffle()
+    second.shuffle()
+    assert first.cards == second.cards
+    assert first.deal_many(10) == second.deal_many(10)
+
+
+def test_cards_listing_matches_deal_order():
+    deck = Deck(random.Random(11))
+    deck.shuffle()
+    deck.deal_many(5)
+    remaining = deck.cards
+    assert deck.deal_many(47) == remaining
+
+
+def test_discarded_cards_go_to_bottom_and_reset_restores_deck():
+    deck = Deck(random.Random(5))
+    deck.shuffle()
+    hand = deck.deal_many(50)
+    rest = deck.cards
+    deck.add_cards_to_bottom(hand[:3])
+    assert deck.deal_many(5) == rest + hand[:3]
+    deck.reset()
+    assert len(deck) == 52 and deck.cards[0] is Card('2', 's')
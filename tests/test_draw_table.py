@@ -0,0 +1,64 @@
+import random
+
+from main import Card, GameEngine, Player, RuleBasedBotStrategy
+from src.logic.canonical import canonicalize
+from src.logic.draw_table import (DrawTable, build_table, canonical_classes, hand_index, NUM_HANDS,
+                                  strength_percentiles)
+from src.logic.evaluator import evaluate_codes
+
+
+def permute_suits(codes, perm):
+    return [perm[code // 13] * 13 + code % 13 for code in codes]
+
+
+def test_canonical_form_ignores_suit_permutation_and_order():
+    rng = random.Random(3)
+    for _ in range(200):
+        codes = rng.sample(range(52), 5)
+        other = permute_suits(codes, rng.sample(range(4), 4))
+        rng.shuffle(other)
+        canonical, order = canonicalize(other)
+        assert canonical == canonicalize(codes)[0]
+        assert evaluate_codes(canonical) == evaluate_codes(codes)
+        assert sorted(order) == list(range(5))
+        assert [other[i] % 13 for i in order] == [code % 13 for code in canonical]
+
+
+def test_hand_index_is_dense_and_percentiles_are_ordered():
+    assert hand_index((0, 1, 2, 3, 4)) == 0
+    assert hand_index((47, 48, 49, 50, 51)) == NUM_HANDS - 1
+    pct = strength_percentiles()
+    values = [pct[s] for s in sorted(pct)]
+    assert values == sorted(values) and 0 < values[0] and values[-1] < 1
+
+
+def test_table_lookup_maps_discards_back_to_original_hand(tmp_path):
+    path = str(tmp_path / "draw.bin")
+    assert build_table(path, samples=16, workers=1, limit=40) == 40
+    table = DrawTable(path)
+    rng = random.Random(7)
+    try:
+        for canonical in canonical_classes(40):
+            mask = table.best_discard(list(canonical))
+            assert mask is not None
+            hand = permute_suits(canonical, rng.sample(range(4), 4))
+            rng.shuffle(hand)
+            discarded = table.best_discard(hand)
+            assert sorted(hand[i] % 13 for i in discarded) == sorted(canonical[i] % 13 for i in mask)
+        royal = [Card(rank, 'h').code for rank in ('A', 'K', 'Q', 'J', '10')]
+        assert table.best_discard(royal) is None
+
+        # Bot korzysta z tablicy, a dla rąk spoza niej wraca do reguł.
+        players = Player.create_players(2, 1000)
+        engine = GameEngine.create_headless(players, 25, 50, strategies=[RuleBasedBotStrategy(table)] * 2)
+        bot = players[0]
+        for code in (12, 11, 10, 9, 8):  # poker królewski w pikach - klasa spoza tablicy
+            bot.take_card(Card.from_code(code))
+        assert engine.strategies[0].decide_exchange(engine, bot) == []
+        bot.clear_hand()
+        hand = list(canonical_classes(1)[0])
+        for code in hand:
+            bot.take_card(Card.from_code(code))
+        assert engine.strategies[0].decide_exchange(engine, bot) == table.best_discard(hand)
+    finally:
+        table.close()
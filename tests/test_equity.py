@@ -0,0 +1,53 @@
+import pytest
+
+from main import Card
+from src.logic import equity
+from src.logic.equity import count_deals, hand_equity
+
+
+def cards(*specs):
+    return [Card(rank, suit) for rank, suit in specs]
+
+
+def test_royal_flush_never_loses():
+    royal = cards(('A', 's'), ('K', 's'), ('Q', 's'), ('J', 's'), ('10', 's'))
+    result = hand_equity(royal, num_opponents=2, samples=500, seed=1)
+    assert result.win == 1.0 and result.loss == 0.0 and not result.exact
+
+
+def test_exact_enumeration_matches_monte_carlo():
+    hand = cards(('A', 'h'), ('A', 'd'), ('9', 'c'), ('6', 's'), ('2', 'h'))
+    codes = {card.code for card in hand}
+    dead = [code for code in range(52) if code not in codes][:22]  # 25 pozostałych kart
+    exact = hand_equity(hand, dead=dead)
+    assert exact.exact and exact.samples == count_deals(25, 1)
+    assert exact.win + exact.tie + exact.loss == pytest.approx(1.0)
+    sampled = hand_equity(hand, dead=dead, exact_limit=0, samples=20000, seed=5)
+    assert not sampled.exact
+    assert sampled.equity == pytest.approx(exact.equity, abs=0.02)
+
+
+def test_seeded_sampling_is_reproducible_and_validated():
+    hand = cards(('K', 'h'), ('K', 'd'), ('4', 'c'), ('4', 's'), ('J', 'h'))
+    assert hand_equity(hand, samples=2000, seed=9) == hand_equity(hand, samples=2000, seed=9)
+    with pytest.raises(ValueError):
+        hand_equity(hand[:4])
+    with pytest.raises(ValueError):
+        hand_equity(hand, num_opponents=10)
+
+
+def test_expired_time_budget_stops_after_one_deadline_step():
+    hand = cards(('Q', 'h'), ('Q', 'd'), ('7', 'c'), ('3', 's'), ('2', 'h'))
+    result = hand_equity(hand, num_opponents=5, time_budget=0.0, exact_limit=0, seed=3)
+    assert 0 < result.samples <= 64 and not result.exact
+
+
+def test_vectorized_and_python_sampling_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    hand = cards(('J', 'h'), ('J', 'd'), ('8', 'c'), ('5', 's'), ('3', 'h'))
+    vectorized = hand_equity(hand, num_opponents=3, exact_limit=0, samples=20000, seed=4)
+    monkeypatch.setattr(equity, "np", None)
+    looped = hand_equity(hand, num_opponents=3, exact_limit=0, samples=20000, seed=4)
+    assert vectorized.samples == looped.samples == 20000
+    assert vectorized.equity == pytest.approx(looped.equity, abs=0.02)
+    assert vectorized.win + vectorized.tie + vectorized.loss == pytest.approx(1.0)
@@ -0,0 +1,36 @@
+from main import Card, Player
+from src.logic.evaluator import describe, evaluate
+
+
+def make_player(*cards):
+    player = Player(100, "Test")
+    for rank, suit in cards:
+        player.take_card(Card(rank, suit))
+    return player
+
+
+def strength(*cards):
+    return evaluate([Card.RANK_ORDER[r] for r, _ in cards], [s for _, s in cards])
+
+
+def test_categories_and_tie_breakers():
+    assert make_player(('A', 's'), ('K', 's'), ('Q', 's'), ('J', 's'), ('10', 's')).hand_rank() == \
+        ("Poker królewski", 9, [14, 13, 12, 11, 10])
+    assert make_player(('A', 'h'), ('2', 's'), ('3', 'd'), ('4', 'c'), ('5', 's')).hand_rank() == \
+        ("Strit", 4, [5, 4, 3, 2, 1])
+    assert make_player(('9', 'h'), ('9', 's'), ('4', 'd'), ('4', 'c'), ('9', 'c')).hand_rank() == \
+        ("Full", 6, [9, 4])
+    assert make_player(('K', 'h'), ('7', 's'), ('7', 'd'), ('2', 'c'), ('3', 'c')).hand_rank() == \
+        ("Para", 1, [7, 13, 3, 2])
+    assert make_player(('K', 'h'), ('7', 's')).hand_rank() == ("Niepełna ręka", -1, [])
+
+
+def test_strength_ordering():
+    wheel = strength(('A', 'h'), ('2', 's'), ('3', 'd'), ('4', 'c'), ('5', 's'))
+    six_high = strength(('6', 'h'), ('2', 's'), ('3', 'd'), ('4', 'c'), ('5', 's'))
+    trips = strength(('A', 'h'), ('A', 's'), ('A', 'd'), ('K', 'c'), ('Q', 's'))
+    flush = strength(('2', 'h'), ('4', 'h'), ('6', 'h'), ('8', 'h'), ('9', 'h'))
+    assert trips < wheel < six_high < flush
+    assert strength(('K', 'h'), ('K', 's'), ('5', 'd'), ('4', 'c'), ('2', 's')) == \
+        strength(('K', 'd'), ('K', 'c'), ('5', 's'), ('4', 'h'), ('2', 'h'))
+    assert describe(flush) == ("Kolor", 5, [9, 8, 6, 4, 2])
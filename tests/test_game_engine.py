@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from main import GameEngine, Player, SeatStrategy
+
+
+class AlwaysCallStrategy(SeatStrategy):
+    def __init__(self):
+        self.actions = 0
+        self.exchanges = 0
+
+    def decide_action(self, engine, player):
+        self.actions += 1
+        return ("call", 0)
+
+    def decide_exchange(self, engine, player):
+        self.exchanges += 1
+        return [0, 1]
+
+
+def test_headless_engine_plays_without_console(capsys, monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda *args: (_ for _ in ()).throw(AssertionError("input()")))
+    random.seed(3)
+    players = Player.create_players(6, 1000)
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(3))
+    for round_number in range(1, 200):
+        if len([p for p in players if p.stack > 0]) < 2:
+            break
+        engine.play_round(round_number)
+        assert sum(p.stack for p in players) + engine.pot == 6000
+    assert capsys.readouterr().out == ""
+
+
+def test_custom_strategies_and_observer():
+    players = Player.create_players(3, 500)
+    strategies = [AlwaysCallStrategy() for _ in players]
+    messages = []
+    engine = GameEngine.create_headless(players, 10, 20, strategies=strategies, observer=messages.append,
+                                        rng=random.Random(1))
+    engine.play_round(1)
+    assert all(s.actions >= 1 and s.exchanges == 1 for s in strategies)
+    assert any("Showdown" in m for m in messages)
+    assert sum(p.stack for p in players) == 1500
+
+
+def test_incomplete_strategy_fails_when_created():
+    class ActionOnly(SeatStrategy):
+        def decide_action(self, engine, player):
+            return ("check", 0)
+
+    with pytest.raises(TypeError):
+        ActionOnly()
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from src.fileops.history_reader import HandHistoryReader
+from src.fileops.session_manager import SessionManager
+
+
+def write_hands(sm, first, last):
+    for hand in range(first, last + 1):
+        sm.append_hand_history("hist", {"round": hand, "winner": f"Gracz {hand % 3 + 1}", "pot": 25 * hand})
+
+
+def test_random_access_and_range_scan(tmp_path):
+    sm = SessionManager(data_dir=str(tmp_path))
+    write_hands(sm, 1, 500)
+    with sm.read_hand_history("hist") as reader:
+        assert len(reader) == 500
+        assert reader.get_hand(0)["round"] == 1
+        assert reader.get_hand(341) == {"round": 342, "winner": "Gracz 1", "pot": 8550}
+        assert reader.get_hand(-1)["round"] == 500
+        assert [h["round"] for h in reader.hands(100, 105)] == [101, 102, 103, 104, 105]
+        assert sum(1 for _ in reader) == 500
+        with pytest.raises(IndexError):
+            reader.get_hand(500)
+
+
+def test_index_is_extended_incrementally_and_skips_torn_line(tmp_path):
+    sm = SessionManager(data_dir=str(tmp_path))
+    write_hands(sm, 1, 50)
+    path = str(tmp_path / "session_hist.jsonl")
+    HandHistoryReader(path).close()
+    index_size = os.path.getsize(path + ".idx")
+
+    write_hands(sm, 51, 60)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"round": 61, "win')
+    reader = HandHistoryReader(path)
+    assert len(reader) == 60 and reader.get_hand(59)["round"] == 60
+    assert os.path.getsize(path + ".idx") == index_size + 10 * 8
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('ner": "Gracz 2", "pot": 1525}\n')
+    reader.refresh()
+    assert reader.get_hand(60)["pot"] == 1525
+    reader.close()
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    sm = SessionManager(data_dir=str(tmp_path))
+    write_hands(sm, 1, 30)
+    path = str(tmp_path / "session_hist.jsonl")
+    HandHistoryReader(path).close()
+
+    os.remove(path)
+    write_hands(sm, 1000, 1004)
+    with HandHistoryReader(path) as reader:
+        assert [h["round"] for h in reader] == [1000, 1001, 1002, 1003, 1004]
@@ -0,0 +1,31 @@
+import random
+
+from main import GameEngine, Player
+from src.logic.instrumentation import Instrumentation
+
+
+def test_engine_reports_phases_counters_and_profiles(tmp_path):
+    inst = Instrumentation(profile_every=5, profile_dir=str(tmp_path))
+    players = Player.create_players(4, 1000)
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(2), instrumentation=inst)
+    decisions = 0
+    for hand_number in range(1, 21):
+        engine.play_round(hand_number)
+        decisions += len(engine.hand_actions)
+
+    snap = inst.snapshot()
+    counters = snap["counters"]
+    assert counters["hands_played"] == 20 == snap["timers"]["hand"]["count"]
+    assert sum(counters["actions"].values()) == decisions == snap["timers"]["decision"]["count"]
+    assert counters["actions"]["action=exchange,street=draw"] > 0
+    assert counters["hand_evaluations"] > 0 and counters["deck_allocations"] == 0
+    for phase in ("blinds", "deal", "betting", "showdown", "decision"):
+        assert snap["timers"][phase]["count"] > 0
+    assert snap["profiled_hands"] == 4 and snap["last_profile"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["hand_10.prof", "hand_15.prof", "hand_20.prof",
+                                                          "hand_5.prof"]
+
+    text = inst.prometheus()
+    assert "# TYPE poker_hands_played_total counter\npoker_hands_played_total 20\n" in text
+    assert 'poker_actions_total{action="exchange",street="draw"}' in text
+    assert 'poker_phase_seconds_count{phase="showdown"} 20' in text
@@ -0,0 +1,65 @@
+import json
+
+from main import GameLogger
+from src.fileops.log_writer import BufferedLogWriter
+
+
+def test_buffered_logger_flushes_and_closes(tmp_path):
+    log_path = tmp_path / "game.txt"
+    logger = GameLogger(str(log_path), buffered=True, batch_size=1000, flush_interval=60)
+    for i in range(100):
+        logger.log(f"linia {i}")
+    logger.flush()
+    lines = log_path.read_text(encoding='utf-8').splitlines()
+    assert "Sesja gry rozpoczęta" in lines[1] and lines[-1].endswith("linia 99")
+    logger.close_session()
+    assert log_path.read_text(encoding='utf-8').splitlines()[-1].endswith("=== Sesja gry zakończona ===")
+
+
+def test_drop_mode_discards_lines_when_buffer_is_full(tmp_path):
+    log_path = tmp_path / "drop.txt"
+    writer = BufferedLogWriter(str(log_path), capacity=3, batch_size=1000, flush_interval=60,
+                               overflow=BufferedLogWriter.DROP)
+    accepted = [writer.write(f"{i}\n") for i in range(5)]
+    writer.close()
+    assert accepted == [True, True, True, False, False]
+    assert writer.dropped == 2
+    assert log_path.read_text(encoding='utf-8') == "0\n1\n2\n"
+
+
+def test_block_mode_waits_for_writer(tmp_path):
+    log_path = tmp_path / "block.txt"
+    writer = BufferedLogWriter(str(log_path), capacity=2, batch_size=1000, flush_interval=60)
+    for i in range(50):
+        assert writer.write(f"{i}\n")
+    writer.close()
+    assert writer.dropped == 0
+    assert log_path.read_text(encoding='utf-8').split() == [str(i) for i in range(50)]
+
+
+def test_disabled_levels_skip_formatting(tmp_path):
+    log_path = tmp_path / "levels.txt"
+    logger = GameLogger(str(log_path), level=GameLogger.INFO)
+
+    def expensive():
+        raise AssertionError("nie powinno być wywołane")
+
+    logger.debug(expensive)
+    logger.log("Gracz %s czeka. Stack: %s", "Bob", 950)
+    logger.log(lambda: "leniwa wiadomość")
+    lines = log_path.read_text(encoding='utf-8').splitlines()
+    assert lines[-2].endswith("Gracz Bob czeka. Stack: 950")
+    assert lines[-1].endswith("leniwa wiadomość")
+
+
+def test_structured_events_are_json_lines(tmp_path):
+    events_path = tmp_path / "events.jsonl"
+    logger = GameLogger(str(tmp_path / "game.txt"), buffered=True, events_file_path=str(events_path))
+    assert logger.structured
+    logger.event("call", player="Bob", amount=50, pot=125)
+    logger.event("win", player="Alice", amount=125, pot=125, hand="Kolor")
+    logger.close_session()
+    records = [json.loads(line) for line in events_path.read_text(encoding='utf-8').splitlines()]
+    assert [r["event"] for r in records] == ["call", "win"]
+    assert records[0]["player"] == "Bob" and records[0]["amount"] == 50 and records[0]["pot"] == 125
+    assert records[1]["hand"] == "Kolor"
@@ -0,0 +1,41 @@
+from main import Card, GameEngine, Player, RuleBasedBotStrategy
+from src.logic.bots import RuleBasedBot
+from src.logic.canonical import canonical_key
+from src.logic.memo import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_and_counts():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" jest teraz najdawniej używany
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get_or_compute("c", lambda: 99) == 3
+    assert cache.get_or_compute("d", lambda: 4) == 4
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 2, "misses": 2, "hit_rate": 0.5}
+
+
+def test_canonical_key_ignores_suits_and_order():
+    pair_hearts = [Card('K', 'h'), Card('K', 'd'), Card('7', 'h'), Card('4', 'c'), Card('2', 's')]
+    pair_spades = [Card('2', 'h'), Card('K', 's'), Card('4', 'd'), Card('7', 's'), Card('K', 'c')]
+    other_pair = [Card('Q', 'h'), Card('Q', 'd'), Card('7', 'h'), Card('4', 'c'), Card('2', 's')]
+    assert canonical_key([c.code for c in pair_hearts]) == canonical_key([c.code for c in pair_spades])
+    assert canonical_key([c.code for c in pair_hearts]) != canonical_key([c.code for c in other_pair])
+
+
+def test_bot_exchange_reuses_decision_for_isomorphic_hand():
+    RuleBasedBotStrategy.exchange_cache.clear()
+    players = Player.create_players(2, 1000)
+    engine = GameEngine.create_headless(players, 25, 50)
+    bot = players[1]
+    for card in (Card('K', 'h'), Card('K', 'd'), Card('7', 'h'), Card('4', 'c'), Card('2', 's')):
+        bot.take_card(card)
+    first = engine.strategies[1].decide_exchange(engine, bot)
+    bot.clear_hand()
+    for card in (Card('2', 'h'), Card('K', 's'), Card('4', 'd'), Card('7', 's'), Card('K', 'c')):
+        bot.take_card(card)
+    second = engine.strategies[1].decide_exchange(engine, bot)
+    assert sorted(first) == [2, 3, 4]
+    assert second == [0, 2, 3] == RuleBasedBot().decide_exchange(engine.table_view(bot))
+    assert RuleBasedBotStrategy.cache_stats()["exchange"]["hits"] == 1
@@ -0,0 +1,84 @@
+import asyncio
+
+from main import Decision
+from src.net.client import PokerClient, run_bots
+from src.net.server import Table, TableServer
+
+
+async def play_with_bots(server: TableServer, num_bots: int):
+    await server.start()
+    try:
+        results = await asyncio.wait_for(run_bots(num_bots, "127.0.0.1", server.port), 30)
+        await server.wait_tables()
+        return results
+    finally:
+        await server.close()
+
+
+def test_remote_bots_play_full_tables():
+    server = TableServer(port=0, seats_per_table=3, remote_seats_per_table=2, max_hands=10, seed=4)
+    results = asyncio.run(play_with_bots(server, 4))
+    assert all(result is not None for result in results)
+    assert {result["hands"] for result in results} == {t.hands_played for t in server.tables}
+    for table in server.tables:
+        assert sum(table.final_stacks.values()) == 3 * 1000
+        assert all(r["stacks"] == table.final_stacks for r in results if r["stacks"].keys() == table.final_stacks.keys())
+    stats = server.stats()
+    assert stats["finished_tables"] == 2 and stats["remote_actions"] > 0 and stats["timeouts"] == 0
+    assert stats["action_latency_ms"]["p50"] <= stats["action_latency_ms"]["p99"]
+
+
+def test_slow_client_gets_fallback_action_after_timeout():
+    async def scenario():
+        server = TableServer(port=0, seats_per_table=2, remote_seats_per_table=1, max_hands=2,
+                             action_timeout=0.05, seed=1)
+        await server.start()
+
+        async def never_decides(request):
+            await asyncio.sleep(0.3)
+            return "raise", 10_000
+
+        client = PokerClient("Wolny", decide_action=never_decides, decide_exchange=never_decides)
+        try:
+            result = await asyncio.wait_for(client.play("127.0.0.1", server.port), 30)
+        finally:
+            await server.close()
+        return server, result
+
+    server, _ = asyncio.run(scenario())
+    # Klient mógł nie zdążyć odebrać końca gry przed zamknięciem stołu - liczy się stan serwera.
+    table = server.tables[0]
+    assert table.finished and table.hands_played == 2
+    assert sum(table.final_stacks.values()) == 2000
+    assert server.timeouts > 0
+
+
+def test_reply_is_checked_against_amount_to_call():
+    parse = Table._parse_reply
+    fold, check = ("fold", 0), ("check", 0)
+    assert parse(Decision.ACTION, {"action": "check"}, fold, 100, 200) == fold
+    assert parse(Decision.ACTION, {"action": "check"}, check, 0, 200) == check
+    assert parse(Decision.ACTION, {"action": "raise", "amount": 200}, fold, 100, 200) == ("call", 0)
+    assert parse(Decision.ACTION, {"action": "bet", "amount": 50}, check, 0, 200) == check
+    assert parse(Decision.ACTION, {"action": "raise", "amount": 400}, fold, 100, 200) == ("raise", 400)
+    assert parse(Decision.ACTION, {"action": "allin"}, fold, 100, 200) == fold
+
+
+def test_client_checking_into_a_bet_does_not_stall_the_table():
+    async def scenario():
+        server = TableServer(port=0, seats_per_table=2, remote_seats_per_table=1, max_hands=5, seed=2)
+        await server.start()
+        client = PokerClient("Czekający", decide_action=lambda request: ("check", 0))
+        try:
+            await asyncio.wait_for(client.play("127.0.0.1", server.port), 30)
+            await asyncio.wait_for(server.wait_tables(), 30)
+        finally:
+            await server.close()
+        return server, client
+
+    server, client = asyncio.run(scenario())
+    table = server.tables[0]
+    assert table.finished and table.hands_played >= 1
+    assert sum(table.final_stacks.values()) == 2000
+    # Każde rozdanie wymaga najwyżej kilku decyzji klienta - czekanie na zakład kończy się pasem.
+    assert 0 < client.decisions <= 10 * table.hands_played
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from main import GameEngine, Player
+from src.fileops.session_manager import SessionManager
+from src.logic.evaluator import CATEGORY_NAMES, PAIR
+from src.logic.opponent_stats import OpponentStats
+
+
+def test_counters_and_decayed_rates():
+    stats = OpponentStats(decay=0.5)
+    for hand in range(4):
+        stats.begin_hand(["A", "B"])
+        # A przebija w każdym rozdaniu, B sprawdza w pierwszym, potem pasuje na przebicie.
+        stats.on_action("A", "raise", False)
+        stats.on_action("B", "call" if hand == 0 else "fold", True)
+        stats.on_exchange("A", 1)
+        stats.on_exchange("B", 3)
+        stats.end_hand(["A", "B"])
+    stats.on_showdown("A", PAIR)
+
+    a, b = stats.player("A"), stats.player("B")
+    assert a.hands == b.hands == 4 and a.draws[1] == 4 and a.categories[PAIR] == 1
+    rates = stats.snapshot()
+    assert rates["A"]["vpip"] == 1.0 and rates["A"]["aggression"] is None and rates["A"]["avg_draw"] == 1.0
+    assert rates["B"]["vpip"] == 0.25 and rates["B"]["fold_to_bet"] == 0.75 and rates["B"]["avg_draw"] == 3.0
+    # Wagi wykładnicze: ostatnie rozdania ważą więcej niż pierwsze sprawdzenie.
+    assert rates["B"]["recent_vpip"] == pytest.approx(0.125 / 1.875)
+    assert rates["B"]["recent_fold_to_bet"] == pytest.approx(1.75 / 1.875)
+    # VPIP liczy się raz na rozdanie; akcje poza rozdaniem nie zmieniają liczby rozdań.
+    stats.end_hand(["A", "B"])
+    assert stats.player("A").hands == 4
+    assert rates["A"]["showdowns"] == 1 and rates["A"]["showdown_categories"] == {CATEGORY_NAMES[PAIR]: 1}
+    assert rates["B"]["draws"] == [0, 0, 0, 4, 0, 0] and rates["B"]["showdown_categories"] == {}
+
+
+def test_engine_feeds_stats_and_they_survive_a_session_round_trip(tmp_path):
+    players = Player.create_players(4, 1000)
+    stats = OpponentStats()
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(5), stats=stats)
+    hands = 30
+    showdowns = 0
+    for hand_number in range(1, hands + 1):
+        engine.play_round(hand_number)
+        showdowns += len(engine.last_showdown)
+
+    assert sum(s.hands for s in stats.players.values()) <= hands * len(players)
+    assert sum(s.showdowns for s in stats.players.values()) == showdowns
+    assert sum(sum(s.categories) for s in stats.players.values()) == showdowns
+    for rates in stats.snapshot().values():
+        assert rates["hands"] > 0 and 0.0 <= rates["vpip"] <= 1.0
+
+    sm = SessionManager(data_dir=str(tmp_path))
+    sm.save_stats("g1", stats.to_dict())
+    restored = OpponentStats.from_dict(sm.load_stats("g1"))
+    assert restored.snapshot() == stats.snapshot()
+    assert restored.to_dict() == stats.to_dict()
+    assert sm.load_stats("missing") == {}
+
+
+def test_busted_seat_is_not_counted_as_dealt_in():
+    players = [Player(stack, f"P{i}", is_bot=True) for i, stack in enumerate((1000, 1000, 1000, 0))]
+    stats = OpponentStats()
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(3), stats=stats)
+    for hand_number in range(1, 11):
+        engine.play_round(hand_number)
+    assert "P3" not in stats.players or stats.player("P3").hands == 0
+    assert stats.player("P0").hands == 10
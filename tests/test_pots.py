@@ -0,0 +1,104 @@
+import random
+
+from main import GameEngine, Player, SeatStrategy
+from src.logic.pots import Pot, award_pots, build_pots, uncalled_bet
+
+
+def test_side_pots_from_contributions():
+    # Miejsce 3 spasowało po wniesieniu 30, miejsce 0 weszło za wszystko za 50, 1 i 2 za 100.
+    pots = build_pots([50, 100, 100, 30, 200], [False, False, False, True, False])
+    assert pots == [Pot(230, (0, 1, 2, 4)), Pot(150, (1, 2, 4))]
+    assert uncalled_bet([50, 100, 100, 30, 200]) == (4, 100)  # 100 ponad drugi najwyższy wkład wraca
+    # Wkład spasowanego gracza ponad wkłady pozostałych dostaje ostatnia pula...
+    assert build_pots([100, 100, 50], [True, True, False]) == [Pot(250, (2,))]
+    # ...ale niesprawdzona nadwyżka najwyższego wkładu nie trafia do żadnej puli.
+    assert build_pots([100, 50, 0], [True, False, False]) == [Pot(100, (1,))]
+    assert uncalled_bet([100, 50, 0]) == (0, 50) and uncalled_bet([60, 60, 10]) == (-1, 0)
+    assert build_pots([0, 0], [False, False]) == []
+
+
+def test_each_pot_goes_to_best_eligible_hand_with_odd_chips_to_lower_seats():
+    pots = [Pot(301, (0, 1, 2, 3)), Pot(200, (1, 2, 3)), Pot(50, (3,))]
+    awards = award_pots(pots, [900, 500, 700, 700])
+    assert awards == [[(0, 301)], [(2, 100), (3, 100)], [(3, 50)]]
+    assert award_pots([Pot(7, (2, 0))], [5, -1, 5]) == [[(0, 4), (2, 3)]]
+
+
+class RaiseTo400(SeatStrategy):
+    def decide_action(self, engine, player):
+        return ("raise", 400)
+
+    def decide_exchange(self, engine, player):
+        return []
+
+
+def test_short_all_in_wins_only_the_main_pot():
+    for seed in range(200):
+        players = [Player(stack, f"P{i}", is_bot=True) for i, stack in enumerate((100, 1000, 1000))]
+        engine = GameEngine.create_headless(players, 25, 50, strategies=[RaiseTo400() for _ in players],
+                                            rng=random.Random(seed))
+        engine.play_round(1)
+        strengths = {p.seat: strength for p, strength in engine.last_showdown}
+        if strengths[0] > max(strengths[1], strengths[2]):
+            break
+    else:
+        raise AssertionError("brak rozdania, w którym wygrywa najkrótszy stos")
+    assert engine.last_winnings[0] == (0, 300)
+    assert sum(amount for _, amount in engine.last_winnings) == 900
+    assert players[0].stack == 300 and sum(p.stack for p in players) == 2100
+
+
+class AlwaysFold(SeatStrategy):
+    def decide_action(self, engine, player):
+        return ("fold", 0)
+
+    def decide_exchange(self, engine, player):
+        return []
+
+
+def test_busted_seat_is_folded_and_never_wins_the_blinds():
+    players = [Player(stack, f"P{i}", is_bot=True) for i, stack in enumerate((1000, 1000, 1000, 0))]
+    engine = GameEngine.create_headless(players, 25, 50, strategies=[AlwaysFold() for _ in players],
+                                        rng=random.Random(272))
+    for hand_number in range(1, 13):
+        engine.play_round(hand_number)
+        assert players[3].is_folded and players[3].hand_size() == 0
+        assert all(seat != 3 for seat, _ in engine.last_winnings)
+        assert sum(p.stack for p in players) == 3000
+
+
+def test_pot_returns_to_contributors_when_only_seats_without_chips_in_remain():
+    players = [Player(1000, f"P{i}", is_bot=True) for i in range(3)]
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(1))
+    engine.state.new_hand()
+    engine.pot = players[0].pay_money(25) + players[1].pay_money(50)
+    players[0].is_folded = players[1].is_folded = True
+    engine.showdown()
+    # Niesprawdzona część dużego blinda wraca najpierw, potem pozostałe wkłady.
+    assert engine.last_winnings == [(0, 25), (1, 25)]
+    assert [p.stack for p in players] == [1000, 1000, 1000] and engine.pot == 0
+
+
+class Scripted(SeatStrategy):
+    def __init__(self, actions):
+        self.actions = actions
+        self.asked = []
+
+    def decide_action(self, engine, player):
+        self.asked.append(player.seat)
+        return self.actions[player.seat].pop(0) if self.actions[player.seat] else ("fold", 0)
+
+    def decide_exchange(self, engine, player):
+        return []
+
+
+def test_short_all_in_raise_does_not_reopen_action_and_uncalled_chips_return():
+    players = [Player(stack, f"P{i}", is_bot=True) for i, stack in enumerate((1000, 60, 1000))]
+    # P0 przebija do 200, P1 "przebija" za wszystko (60), P2 pasuje.
+    strategy = Scripted({0: [("raise", 200)], 1: [("raise", 1000)], 2: [("fold", 0)]})
+    engine = GameEngine.create_headless(players, 25, 50, strategies=[strategy] * 3, rng=random.Random(0))
+    engine.play_round(1)
+    assert strategy.asked[:3] == [0, 1, 2] and strategy.asked.count(0) == 1
+    # P1 może wygrać najwyżej 60 + 60 + 50 = 170; 140 z zakładu P0 nikt nie sprawdził.
+    assert players[2].stack == 950 and sum(p.stack for p in players) == 2060
+    assert (players[0].stack, players[1].stack) in ((940, 170), (1110, 0))
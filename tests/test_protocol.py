@@ -0,0 +1,65 @@
+import pytest
+
+from src.net.protocol import (FrameReader, ProtocolError, card_to_code, code_to_card, decode, encode,
+                              read_varint, to_debug_json, write_varint)
+
+
+def test_varint_round_trip():
+    for value in (0, 1, 127, 128, 300, 2 ** 21, 2 ** 40 + 5):
+        out = bytearray()
+        write_varint(out, value)
+        assert read_varint(bytes(out), 0) == (value, len(out))
+    with pytest.raises(ValueError):
+        write_varint(bytearray(), -1)
+
+
+def test_action_and_state_delta_round_trip():
+    action = {"type": "action_event", "table": 3, "hand": 1200, "seat": 2, "action": "raise",
+              "amount": 150, "pot": 425, "stack": 9850}
+    frame = encode(action)
+    assert len(frame) < 16
+    assert decode(frame) == action
+
+    delta = {"type": "state_delta", "table": 0, "hand": 7, "pot": 75, "current_player": 1,
+             "stacks": [[0, 975], [1, 950], [2, 1000]],
+             "hands": [[1, [card_to_code(c) for c in ("AS", "KD", "3H", "7C", "10S")]]]}
+    assert decode(encode(delta)) == delta
+    assert [code_to_card(c) for c in decode(encode(delta))["hands"][0][1]] == ["AS", "KD", "3H", "7C", "10S"]
+
+
+def test_json_fallback_and_streaming_reader():
+    unknown = {"type": "chat", "text": "Cześć"}
+    frames = [encode(unknown), encode({"type": "action_event", "seat": 0, "action": "call", "amount": 50,
+                                       "pot": 100}, binary=False)]
+    assert decode(frames[0]) == unknown
+    assert '"call"' in to_debug_json(frames[1])
+
+    stream = b"".join(frames) * 2
+    reader = FrameReader()
+    received = []
+    for i in range(0, len(stream), 5):
+        received.extend(reader.feed(stream[i:i + 5]))
+    assert [m["type"] for m in received] == ["chat", "action_event"] * 2
+
+    with pytest.raises(ValueError):
+        decode(frames[0][:1] + b"\x09" + frames[0][2:])
+
+
+def test_truncated_and_empty_frames_raise_protocol_error():
+    action = encode({"type": "action_event", "table": 3, "hand": 1200, "seat": 2, "action": "raise",
+                     "amount": 150, "pot": 425, "stack": 9850})
+    delta = encode({"type": "state_delta", "table": 0, "hand": 7, "pot": 75, "current_player": 1,
+                    "stacks": [[0, 975]], "hands": [[1, [0, 1, 2, 3, 4]]]})
+    for frame in (action, delta):
+        # Długość ramki obcięta o bajt: treść sięgałaby do następnej ramki.
+        truncated = bytes([frame[0] - 1]) + frame[1:-1]
+        with pytest.raises(ProtocolError):
+            decode(truncated + action)
+        with pytest.raises(ProtocolError):
+            FrameReader().feed(truncated)
+    # Ramka o zerowej długości nie może czytać nagłówka z następnej.
+    with pytest.raises(ProtocolError):
+        decode(b"\x00" + action)
+    # Niepoprawny kod akcji.
+    with pytest.raises(ProtocolError):
+        decode(action[:7] + b"\x7f" + action[8:])
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from main import GameEngine, Player
+from src.sim.replay import ReplayMismatch, replay_hand, verify_hand
+
+
+def play_game(seed, hands=40, num_players=4):
+    players = Player.create_players(num_players, 1000)
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(seed))
+    records = []
+    for hand_number in range(1, hands + 1):
+        if sum(1 for p in players if p.stack > 0) < 2:
+            break
+        engine.play_round(hand_number)
+        records.append(engine.hand_record(hand_number))
+    return records
+
+
+def test_same_seed_gives_same_game_regardless_of_global_random():
+    random.seed(1)
+    first = play_game(9)
+    random.seed(2)
+    random.random()
+    assert play_game(9) == first
+    assert play_game(10) != first
+
+
+def test_every_recorded_hand_replays_exactly():
+    records = play_game(4, hands=80, num_players=5)
+    assert any(len(r["showdown"]) > 1 for r in records)
+    for record in records:
+        verify_hand(record)
+    engine = replay_hand(records[-1])
+    assert [p.stack for p in engine.players] == records[-1]["stacks"]
+
+
+def test_diverging_record_is_reported():
+    record = next(r for r in play_game(4) if any(kind == "action" for _, kind, _ in r["actions"]))
+    tampered = dict(record, actions=[list(a) for a in record["actions"]])
+    first = next(a for a in tampered["actions"] if a[1] == "action")
+    first[2] = ["fold", 0] if first[2][0] != "fold" else ["call", 0]
+    with pytest.raises(ReplayMismatch):
+        verify_hand(tampered)
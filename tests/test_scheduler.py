@@ -0,0 +1,67 @@
+import random
+
+from main import Decision, GameEngine, Player, RuleBasedBotStrategy
+from src.sim.scheduler import ExternalSeat, ScheduledTable, TableScheduler
+
+
+def make_engine(num_players, seed, stack=1000, strategies=None):
+    players = [Player(stack, f"T{seed}_{i}", is_bot=True) for i in range(num_players)]
+    return GameEngine.create_headless(players, 25, 50, strategies=strategies, rng=random.Random(seed))
+
+
+def test_tables_match_sequential_play_and_interleave():
+    scheduler = TableScheduler()
+    for seed in range(3):
+        scheduler.add_table(make_engine(4, seed), max_hands=12)
+    scheduler.run()
+    assert scheduler.stats()["finished"] == 3 and scheduler.hands_played == 36 and not scheduler.eliminated
+
+    # Ten sam stół rozegrany samodzielnie daje te same stosy - harmonogram nie zmienia przebiegu gry.
+    for seed, table in enumerate(scheduler.tables.values()):
+        engine = make_engine(4, seed)
+        for hand_number in range(1, 13):
+            engine.play_round(hand_number)
+        assert [p.stack for p in engine.players] == [p.stack for p in table.engine.players]
+
+
+def test_external_seat_waits_without_blocking_other_tables():
+    scheduler = TableScheduler()
+    human = scheduler.add_table(make_engine(2, 1, strategies=[ExternalSeat(), RuleBasedBotStrategy()]))
+    bots = scheduler.add_table(make_engine(3, 2), max_hands=5)
+    scheduler.run()
+    assert scheduler.tables[bots].state == ScheduledTable.FINISHED
+    decision = scheduler.waiting[human]
+    assert decision.seat == 0
+    scheduler.submit(human, ("fold", 0) if decision.kind == Decision.ACTION else [])
+    assert scheduler.run(max_ticks=1) == 1
+
+
+def test_short_tables_are_rebalanced():
+    scheduler = TableScheduler(max_seats=6)
+    total = 0
+    for seed in range(6):
+        engine = make_engine(3, seed, stack=150)
+        total += sum(p.stack for p in engine.players)
+        scheduler.add_table(engine)
+    scheduler.run(max_ticks=200_000)
+    stats = scheduler.stats()
+    assert stats["moves"] > 0
+    remaining = [p for t in scheduler.tables.values() for p in t.engine.players + [a[0] for a in t.arrivals]]
+    assert sum(p.stack for p in remaining) == total
+    assert len(remaining) + stats["eliminated"] == 18
+    # Zostaje co najwyżej jeden bezczynny stół - reszta graczy została przesadzona.
+    assert stats["idle"] <= 1 and stats["ready"] + stats["waiting"] == 0
+
+
+def test_free_seat_index_picks_least_seated_playing_table():
+    scheduler = TableScheduler(max_seats=4)
+    ids = [scheduler.add_table(make_engine(n, seed)) for seed, n in enumerate((4, 3, 2, 2))]
+    tables = [scheduler.tables[i] for i in ids]
+    tables[2].state = ScheduledTable.FINISHED
+    assert scheduler._find_seat(tables[0]) is tables[3]
+    # Źródło przesiadki jest pomijane, ale pozostaje w indeksie.
+    assert scheduler._find_seat(tables[3]) is tables[1]
+    assert scheduler._find_seat(tables[0]) is tables[3]
+    tables[3].state = ScheduledTable.IDLE
+    scheduler._index(tables[3])
+    assert scheduler._find_seat(tables[0]) is tables[1]
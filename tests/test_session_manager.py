@@ -22,3 +22,69 @@ def test_save_and_load():
     assert session == loaded
     os.remove('test_data/session_test123.json')
     os.rmdir('test_data')
+
+
+def play_hands(sm, session, first, last):
+    for hand in range(first, last + 1):
+        session["bets"] = [{"stage": "pre-flop", "player_id": 1, "action": "raise", "amount": 50, "pot": 75}]
+        sm.save_session(session)
+        session["bets"].append({"stage": "pre-flop", "player_id": 2, "action": "call", "amount": 50, "pot": 125})
+        session["pot"] = 125
+        session["players"][hand % 2]["stack"] += 125
+        session["history"].append({"round": hand, "winner_id": hand % 2 + 1, "pot": 125})
+        sm.save_session(session)
+
+
+def new_session(game_id):
+    return {
+        "game_id": game_id,
+        "players": [{"id": 1, "name": "Alice", "stack": 1000}, {"id": 2, "name": "Bob", "stack": 1000}],
+        "deck": ["AS", "KD"],
+        "hands": {"1": ["AS", "3H", "7C", "9D", "KD"]},
+        "bets": [],
+        "current_player": 1,
+        "pot": 0,
+        "history": [],
+    }
+
+
+def test_full_save_is_atomic(tmp_path):
+    sm = SessionManager(data_dir=str(tmp_path))
+    session = new_session("atom")
+    sm.save_session(session)
+    session["pot"] = 50
+    sm.save_session(session)
+    assert sorted(os.listdir(tmp_path)) == ["session_atom.json"]
+    assert sm.load_session("atom") == session
+
+
+def test_incremental_save_round_trip_across_snapshots(tmp_path):
+    sm = SessionManager(data_dir=str(tmp_path), incremental=True, snapshot_every=7)
+    session = new_session("inc")
+    play_hands(sm, session, 1, 30)
+    assert SessionManager(data_dir=str(tmp_path), incremental=True).load_session("inc") == session
+
+    # Koszt zapisu nie zależy od długości historii: linia dziennika ma stały rozmiar.
+    journal = tmp_path / "session_inc.journal.jsonl"
+    size_early = os.path.getsize(journal)
+    play_hands(sm, session, 31, 200)
+    lines = journal.read_text(encoding="utf-8").splitlines()
+    assert len(lines) < 7 and os.path.getsize(journal) <= size_early + 7 * 400
+    assert json.loads(lines[-1])["history_len"] == 200
+
+
+def test_incremental_load_recovers_from_interrupted_write(tmp_path):
+    sm = SessionManager(data_dir=str(tmp_path), incremental=True, snapshot_every=5)
+    session = new_session("crash")
+    play_hands(sm, session, 1, 12)
+    expected = json.loads(json.dumps(session))
+    with open(tmp_path / "session_crash.history.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"round": 13, "winner_id"')
+    with open(tmp_path / "session_crash.journal.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"seq": 99, "bets": [')
+
+    restarted = SessionManager(data_dir=str(tmp_path), incremental=True, snapshot_every=5)
+    loaded = restarted.load_session("crash")
+    assert loaded == expected
+    play_hands(restarted, loaded, 13, 14)
+    assert SessionManager(data_dir=str(tmp_path), incremental=True).load_session("crash") == loaded
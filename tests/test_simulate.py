@@ -0,0 +1,17 @@
+from src.sim.simulate import simulate
+
+
+def test_simulation_is_reproducible_across_worker_counts():
+    single = simulate(6, num_players=3, initial_stack=300, max_hands=40, master_seed=11, workers=1)
+    pooled = simulate(6, num_players=3, initial_stack=300, max_hands=40, master_seed=11, workers=2, chunk_size=2)
+    assert single == pooled
+    assert single["games"] == 6 and sum(single["games_won"]) == 6
+    assert abs(sum(single["final_stack_mean"]) - 900) < 1e-9
+    assert len(single["chip_trajectory_mean"][0]) == 40
+    assert sum(single["hand_categories"].values()) > 0
+
+
+def test_different_master_seeds_give_different_games():
+    first = simulate(4, num_players=3, max_hands=30, master_seed=1, workers=1)
+    second = simulate(4, num_players=3, max_hands=30, master_seed=2, workers=1)
+    assert first["chip_trajectory_mean"] != second["chip_trajectory_mean"]
@@ -0,0 +1,103 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from main import Card, GameEngine, Player
+from src.logic.table_state import DETACHED, HAND_SIZE, TableState
+
+
+def test_engine_moves_players_into_shared_columns():
+    players = [Player(1000 + i, f"P{i}", is_bot=True) for i in range(3)]
+    players[1].pay_money(40)
+    players[1].current_bet_in_round = 40
+    players[2].is_folded = True
+    players[2].take_card(Card.from_code(51))
+    engine = GameEngine.create_headless(players, 25, 50)
+
+    state = engine.state
+    assert engine.players is players and state.players is players
+    assert [p.seat for p in players] == [0, 1, 2]
+    assert list(state.stack) == [1000, 961, 1002]
+    assert list(state.bet) == [0, 40, 0] and list(state.committed) == [0, 40, 0]
+    assert list(state.folded) == [0, 0, 1]
+    assert players[2].hand_codes() == [51]
+
+    players[0].pay_money(1000)
+    assert state.stack[0] == 0 and players[0].is_all_in
+    assert state.seats_with_chips() == [1, 2] and state.seats_in_hand() == [0, 1]
+    assert state.count_with_chips() == 2 and state.count_in_hand() == 2
+    assert state.next_seat(2, chips=True) == 2
+    assert state.next_seat(2, chips=True, in_hand=True) == 1
+    assert state.next_seat(2, in_hand=True, count=1) == -1
+    assert state.total_chips() == 1000 + 1001 + 1002
+
+
+def test_removed_player_keeps_data_and_seats_are_renumbered():
+    players = [Player(1000, f"P{i}", is_bot=True) for i in range(4)]
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(3))
+    engine.play_round(1)
+    hands = [p.hand_codes() for p in players]
+    stacks = [p.stack for p in players]
+    engine.dealer_button_idx = 2
+
+    leaving, strategy = engine.remove_player(1)
+    assert leaving.stack == stacks[1] and leaving.hand_codes() == hands[1] and leaving not in engine.players
+    assert [p.seat for p in engine.players] == [0, 1, 2]
+    assert [p.hand_codes() for p in engine.players] == [hands[0], hands[2], hands[3]]
+    assert engine.dealer_button_idx == 1 and len(engine.strategies) == 3
+
+    assert engine.seat_player(leaving, strategy) == 3
+    assert list(engine.state.stack) == [stacks[0], stacks[2], stacks[3], stacks[1]]
+    engine.play_round(2)
+    assert sum(p.stack for p in players) == 4000
+
+
+def test_players_off_table_share_recycled_rows():
+    rows = len(DETACHED)
+    players = [Player(500 + i, f"D{i}") for i in range(8)]
+    assert all(p._state is DETACHED for p in players) and [p.stack for p in players] == list(range(500, 508))
+    assert len(DETACHED) <= rows + 8
+    engine = GameEngine.create_headless(players, 25, 50)
+    # Gracze przy stole zwolnili wiersze, które dostaną kolejni gracze poza stołem.
+    newcomers = [Player(10, f"N{i}") for i in range(8)]
+    assert len(DETACHED) <= rows + 8 and all(p.stack == 10 and p.hand_size() == 0 for p in newcomers)
+    del newcomers
+    leaving, _ = engine.remove_player(0)
+    assert leaving._state is DETACHED and leaving.stack == 500
+    assert len(DETACHED) <= rows + 8
+
+
+def test_copied_and_pickled_players_get_their_own_rows():
+    player = Player(500, "K", is_bot=True)
+    player.take_code(7)
+    clone = copy.copy(player)
+    assert clone._seat != player._seat and (clone.name, clone.stack, clone.hand_codes()) == ("K", 500, [7])
+    del clone
+    Player(123, "Nowy")  # zajmuje wiersz zwolniony przez kopię
+    assert player.stack == 500
+    deep = copy.deepcopy(player)
+    deep.take_code(3)
+    assert player.hand_codes() == [7] and deep.hand_codes() == [7, 3]
+
+    engine = GameEngine.create_headless(Player.create_players(3, 1000), 25, 50, rng=random.Random(2))
+    engine.play_round(1)
+    seated = engine.players[1]
+    restored = pickle.loads(pickle.dumps(seated))
+    assert restored._state is DETACHED and restored.is_bot
+    assert (restored.name, restored.stack, restored.hand_codes()) == (seated.name, seated.stack, seated.hand_codes())
+
+
+def test_numpy_views_share_column_memory():
+    pytest.importorskip("numpy")
+    players = Player.create_players(6, 1000)
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(5))
+    engine.play_round(1)
+    views = engine.state.arrays()
+    assert views["hand"].shape == (6, HAND_SIZE)
+    assert views["stack"].sum() == sum(p.stack for p in players)
+    assert views["hand"][0].tolist() == players[0].hand_codes()
+    players[3].receive_money(7)
+    assert views["stack"][3] == players[3].stack
+    assert TableState().arrays()["hand"].shape == (0, HAND_SIZE)
@@ -0,0 +1,77 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from main import BudgetedSeat, GameEngine, Player
+from src.logic.bots import EquityBot, RuleBasedBot
+from src.logic.table_view import ViewStrategy
+
+
+class SlowBot(RuleBasedBot):
+    def __init__(self, delay):
+        self.delay = delay
+
+    def decide_action(self, view):
+        time.sleep(self.delay)
+        return ("raise", view.bet_to_match + 1000)
+
+
+def test_view_is_an_immutable_snapshot_of_the_table():
+    players = Player.create_players(3, 1000)
+    engine = GameEngine.create_headless(players, 25, 50, rng=random.Random(4))
+    seen = []
+
+    class Recorder(RuleBasedBot):
+        def decide_action(self, view):
+            seen.append(view)
+            return super().decide_action(view)
+
+    engine.strategies = [BudgetedSeat(Recorder()) for _ in players]
+    engine.play_round(1)
+    view = seen[0]
+    assert len(view.hand) == 5 and view.strength >= 0
+    assert len(view.stacks) == len(view.bets) == len(view.folded) == 3
+    assert view.bet_to_match == 50 and view.to_call == 50 - view.bet and view.deadline is None
+    with pytest.raises(AttributeError):
+        view.stack = 0
+
+
+def test_rule_bot_seat_plays_like_the_builtin_bot():
+    def play(make_strategies):
+        players = Player.create_players(4, 1000)
+        engine = GameEngine.create_headless(players, 25, 50, strategies=make_strategies(), rng=random.Random(8))
+        records = []
+        for hand_number in range(1, 31):
+            engine.play_round(hand_number)
+            records.append(engine.hand_record(hand_number))
+        return records
+
+    assert play(lambda: [BudgetedSeat(RuleBasedBot(), budget=5.0) for _ in range(4)]) == play(lambda: None)
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_late_decision_is_replaced_by_fallback(pooled):
+    players = Player.create_players(2, 1000)
+    executor = ThreadPoolExecutor(max_workers=1) if pooled else None
+    seat = BudgetedSeat(SlowBot(0.3 if pooled else 0.02), budget=0.01, executor=executor)
+    engine = GameEngine.create_headless(players, 25, 50, strategies=[seat, seat], rng=random.Random(1))
+    engine.play_round(1)
+    if executor is not None:
+        executor.shutdown(wait=True)
+    actions = [action for _, kind, action in engine.hand_actions if kind == "action"]
+    # Każda decyzja o akcji przyszła po terminie, więc wszystkie to akcje awaryjne.
+    assert actions and seat.timeouts >= len(actions)
+    assert all(action in (["check", 0], ["fold", 0]) for action in actions)
+    assert sum(p.stack for p in players) == 2000
+
+
+def test_equity_bot_decides_within_budget():
+    players = Player.create_players(3, 1000)
+    seats = [BudgetedSeat(EquityBot(samples=300, seed=i), budget=0.5) for i in range(3)]
+    engine = GameEngine.create_headless(players, 25, 50, strategies=seats, rng=random.Random(2))
+    for hand_number in range(1, 4):
+        engine.play_round(hand_number)
+    assert sum(p.stack for p in players) == 3000
+    assert isinstance(seats[0].strategy, ViewStrategy)